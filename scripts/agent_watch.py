@@ -9,30 +9,48 @@ Policy:
 
 Outputs:
 - Writes JSON report under scripts/probe_scan_output/agent_watch/<UTC timestamp>/report.json
+- Keeps upstream ETag/Last-Modified validators in scripts/probe_scan_output/agent_watch/.etag_cache.json
 """
 
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import functools
 import json
+import mmap
 import os
 import re
 import shutil
 import sqlite3
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 DEFAULT_CONFIG = "docs/agent-support/agent-watch-config.json"
 DEFAULT_TIMEOUT_SECONDS = 120
+# Default bound on agents checked concurrently in daily/weekly mode (`--jobs`).
+_MAX_AGENT_WORKERS = 8
+# Stand-in for an absent config section; shared, so it must never be mutated.
+_EMPTY_CFG: dict[str, Any] = {}
 
 
 def _now_utc_slug() -> str:
@@ -43,10 +61,54 @@ def _read_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _loads(data: bytes | str) -> Any:
+    """Decode one JSON document, via orjson when it is installed.
+
+    Session logs are read as raw bytes so orjson can skip the str round-trip. Anything
+    orjson rejects (malformed UTF-8, NaN, oversized ints) is retried through the stdlib
+    with replacement decoding, so results match the old `errors="replace"` text reads
+    and failures still surface as `json.JSONDecodeError`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    return json.loads(data)
+
+
+def _write_report(path: Path, report: dict[str, Any]) -> None:
+    """Write `report` as 2-space indented, key-sorted JSON plus a trailing newline.
+
+    orjson (when installed) serializes and sorts in one native pass and hands back
+    bytes ready to write. Anything it refuses (ints beyond 64 bits, non-str keys)
+    goes through the stdlib, which produces the same layout.
+    """
+    if orjson is not None:
+        try:
+            path.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+            )
+            return
+        except TypeError:
+            pass
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
 def _expand_path(p: str) -> Path:
-    # Expand env vars and ~
-    expanded = os.path.expandvars(p)
-    return Path(expanded).expanduser()
+    # Expand env vars and ~. Roots are re-expanded for every sample and sibling
+    # lookup, so the common "~/..." form is memoised; the cache key carries $HOME
+    # because that is the only environment it depends on.
+    if "$" in p:
+        return Path(os.path.expandvars(p)).expanduser()
+    return _expand_user_path(p, os.environ.get("HOME"))
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_user_path(p: str, home: str | None) -> Path:
+    return Path(p).expanduser()
 
 
 # Credentials that must never reach a monitored agent CLI. This tool shells out
@@ -71,17 +133,111 @@ def _github_token() -> str | None:
     return None
 
 
+class _ConditionalGetCache:
+    """url -> validators and body of the last 200, persisted between runs.
+
+    Upstream release endpoints rarely change from one daily run to the next. Replaying
+    the stored ETag / Last-Modified lets the server answer 304 with no body, and GitHub
+    does not count a 304 against the API rate limit. Disabled until `load` is called,
+    so library callers and tests keep plain unconditional GETs.
+    """
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self._entries: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        # Agents fetch concurrently (see `main`), so every access goes through this.
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> None:
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        with self._lock:
+            self.path = path
+            self._entries = entries if isinstance(entries, dict) else {}
+            self._dirty = False
+
+    def get(self, url: str) -> dict[str, str] | None:
+        with self._lock:
+            if self.path is None:
+                return None
+            entry = self._entries.get(url)
+        return entry if isinstance(entry, dict) and isinstance(entry.get("body"), str) else None
+
+    def put(self, url: str, etag: str | None, last_modified: str | None, body: str) -> None:
+        with self._lock:
+            if self.path is None:
+                return
+            if not etag and not last_modified:
+                # Nothing to revalidate with next time; don't keep the body around.
+                self._dirty = self._entries.pop(url, None) is not None or self._dirty
+                return
+            entry = {"body": body}
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["last_modified"] = last_modified
+            self._entries[url] = entry
+            self._dirty = True
+
+    def close(self) -> None:
+        """Persist any new validators, then go back to unconditional GETs."""
+        with self._lock:
+            path, self.path = self.path, None
+            if path is None or not self._dirty:
+                return
+            tmp = path.with_name(path.name + ".tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(self._entries, sort_keys=True) + "\n", encoding="utf-8")
+                os.replace(tmp, path)
+            except OSError:
+                pass
+            self._dirty = False
+
+
+_HTTP_CACHE = _ConditionalGetCache()
+
+
+def _parse_curl_headers(text: str) -> dict[str, str]:
+    """Headers of the final response in a `curl -D` dump (earlier blocks are redirects)."""
+    headers: dict[str, str] = {}
+    for line in text.splitlines():
+        if line.startswith("HTTP/"):
+            headers = {}
+            continue
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
 def _http_get_text(url: str, timeout: int) -> str:
     # Prefer curl to avoid Python SSL trust-store drift on some macOS setups.
     curl_argv = ["curl", "-fsSL", "-H", "User-Agent: AgentSessions-AgentWatch/1.0"]
     github_token = _github_token()
     use_token = bool(github_token) and urllib.parse.urlparse(url).netloc == "api.github.com"
+    conditional = _HTTP_CACHE.path is not None
+    cached = _HTTP_CACHE.get(url)
+    validators: dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            validators["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            validators["If-Modified-Since"] = cached["last_modified"]
+    for name, value in validators.items():
+        curl_argv.extend(["-H", f"{name}: {value}"])
 
     # The Authorization header goes through a 0600 curl config file, never argv:
     # process arguments are world-readable in the process table, so `-H "Authorization:
     # Bearer …"` would publish the token to every user on the machine for the life of
     # the request.
     config_path: str | None = None
+    # With the cache enabled, curl writes the body and headers to files and prints
+    # only the status code, which is how a 304 is told apart from an empty 200.
+    scratch_dir: str | None = None
     # Seeded so a failure while writing the config file falls through to the
     # urllib path below instead of raising UnboundLocalError on `rc`.
     rc, out = 1, ""
@@ -92,14 +248,37 @@ def _http_get_text(url: str, timeout: int) -> str:
                 fh.write(f'header = "Authorization: Bearer {github_token}"\n')
             os.chmod(config_path, 0o600)
             curl_argv.extend(["--config", config_path])
+        if conditional:
+            scratch_dir = tempfile.mkdtemp(prefix="agent-watch-http-")
+            body_path = os.path.join(scratch_dir, "body")
+            headers_path = os.path.join(scratch_dir, "headers")
+            curl_argv.extend(["-D", headers_path, "-o", body_path, "-w", "%{http_code}"])
         curl_argv.append(url)
         rc, out, err = _run_cmd(curl_argv, timeout=timeout)
+        if conditional and rc == 0:
+            status = out.strip()
+            if status == "304" and cached:
+                return cached["body"]
+            if status.startswith("2"):
+                try:
+                    body = Path(body_path).read_bytes().decode("utf-8", errors="replace")
+                    resp_headers = _parse_curl_headers(
+                        Path(headers_path).read_text(encoding="utf-8", errors="replace")
+                    )
+                except OSError:
+                    body = ""
+                if body:
+                    _HTTP_CACHE.put(url, resp_headers.get("etag"), resp_headers.get("last-modified"), body)
+                    return body
+            rc = 1
     finally:
         if config_path:
             try:
                 os.unlink(config_path)
             except OSError:
                 pass
+        if scratch_dir:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
     if rc == 0 and out:
         return out
     # Fallback to urllib for environments without curl.
@@ -107,15 +286,25 @@ def _http_get_text(url: str, timeout: int) -> str:
         "User-Agent": "AgentSessions-AgentWatch/1.0",
         "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
     }
+    headers.update(validators)
     if use_token:
         headers["Authorization"] = f"Bearer {github_token}"
     req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
     try:
-        return raw.decode("utf-8")
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            raw = resp.read()
+            etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached:
+            return cached["body"]
+        raise
+    try:
+        text = raw.decode("utf-8")
     except UnicodeDecodeError:
-        return raw.decode("utf-8", errors="replace")
+        text = raw.decode("utf-8", errors="replace")
+    if conditional:
+        _HTTP_CACHE.put(url, etag, last_modified, text)
+    return text
 
 
 def _http_get_json(url: str, timeout: int) -> Any:
@@ -134,6 +323,13 @@ class Semver:
 
     @staticmethod
     def parse(text: str) -> "Semver | None":
+        # Bare "X.Y.Z" (npm versions, matrix entries, regex captures) is the common
+        # input; a split handles it without entering the regex engine.
+        parts = text.split(".")
+        if len(parts) == 3:
+            major, minor, patch = parts
+            if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+                return Semver(int(major), int(minor), int(patch))
         m = _SEMVER_RE.search(text)
         if not m:
             return None
@@ -143,18 +339,38 @@ class Semver:
         return f"{self.major}.{self.minor}.{self.patch}"
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_semver_cached(text: str) -> Semver | None:
+    # The same handful of verified/installed/upstream strings is parsed and compared
+    # repeatedly per agent; Semver is frozen, so sharing one instance is safe.
+    return Semver.parse(text)
+
+
 def _extract_semver(text: str) -> str | None:
-    v = Semver.parse(text)
+    v = _parse_semver_cached(text)
     return str(v) if v else None
 
 
+def _decode_output(data: bytes | None) -> str:
+    """Child output as stripped text: UTF-8 with replacement, universal newlines.
+
+    Pipes are read as bytes and decoded once here rather than through `text=True`,
+    whose locale codec is strict and raised on any CLI that printed non-UTF-8.
+    """
+    if not data:
+        return ""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+
 def _run_cmd(argv: list[str], timeout: int) -> tuple[int, str, str]:
     try:
         proc = subprocess.run(
             argv,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             check=False,
             timeout=timeout,
             # Single choke point for every spawned process, including the agent
@@ -164,7 +380,7 @@ def _run_cmd(argv: list[str], timeout: int) -> tuple[int, str, str]:
             # file instead.
             env=_child_env(),
         )
-        return proc.returncode, (proc.stdout or "").strip(), (proc.stderr or "").strip()
+        return proc.returncode, _decode_output(proc.stdout), _decode_output(proc.stderr)
     except FileNotFoundError:
         return 127, "", f"Command not found: {argv[0]}"
     except subprocess.TimeoutExpired:
@@ -178,55 +394,165 @@ def _run_cmd(argv: list[str], timeout: int) -> tuple[int, str, str]:
         return 126, "", f"Cannot execute {argv[0]}: {exc}"
 
 
-def _read_verified_versions_from_matrix(matrix_path: Path) -> dict[str, str]:
+# Config agent name -> support-matrix agent key.
+_MATRIX_KEY_BY_AGENT = {
+    "codex": "codex_cli",
+    "claude": "claude_code",
+    "opencode": "opencode",
+    "hermes": "hermes",
+    "antigravity": "antigravity",
+    "copilot": "copilot_cli",
+    "openclaw": "openclaw",
+    "cursor": "cursor",
+    "pi": "pi",
+    "kimi": "kimi_code",
+}
+
+# Support-matrix line shapes. Indents are fixed by the file's own convention, so they
+# are spelled as literal spaces rather than `\s{n}`.
+_MATRIX_AGENT_RE = re.compile(r"^  ([a-zA-Z0-9_]+):\s*$")
+_MATRIX_ITEM_RE = re.compile(r'^      -\s+"?(.*?)"?\s*$')
+_MATRIX_FIELD_RE = re.compile(r"^(?:    |  )\w+:")
+
+
+def _parse_matrix(matrix_path: Path) -> tuple[dict[str, str], dict[str, list[str]]]:
     """
     Minimal YAML reader for the specific support matrix shape.
     Avoids external dependencies (PyYAML).
+
+    One pass over the file yields both `agents.<key>.max_verified_version` and the
+    `agents.<key>.evidence_fixtures` lists, keyed by matrix agent key.
     """
-    text = matrix_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    return _parse_matrix_lines(matrix_path.read_text(encoding="utf-8", errors="replace").splitlines())
+
 
-    # We only need: agents.<key>.max_verified_version
+def _parse_matrix_lines(text: list[str]) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """`_parse_matrix` over lines the caller has already read."""
     in_agents = False
     current_agent: str | None = None
+    in_evidence = False
     versions: dict[str, str] = {}
+    evidence: dict[str, list[str]] = {}
 
-    for raw in text:
-        line = raw.rstrip("\n")
-        if not line.strip() or line.lstrip().startswith("#"):
+    # Every meaningful line is recognisable from its indentation alone (0: section,
+    # 2: agent key, 4: field, 6: list item), so dispatch on that and run at most one
+    # pattern per line.
+    for line in text:
+        body = line.lstrip(" ")
+        if not body or body[0] == "#" or body[0].isspace():
+            # Blank, comment, or tab-indented: none of the shapes below can match.
             continue
-        if line.startswith("agents:"):
-            in_agents = True
-            current_agent = None
+        lead = len(line) - len(body)
+
+        if lead == 0:
+            if line.startswith("agents:"):
+                in_agents = True
+                current_agent = None
+                in_evidence = False
             continue
         if not in_agents:
             continue
 
-        # Top-level agent key (2-space indent): "  codex_cli:"
-        m_agent = re.match(r"^\s{2}([a-zA-Z0-9_]+):\s*$", line)
-        if m_agent:
-            current_agent = m_agent.group(1)
+        if lead == 2:
+            # Top-level agent key: "  codex_cli:"
+            m_agent = _MATRIX_AGENT_RE.match(line)
+            if m_agent:
+                current_agent = m_agent.group(1)
+                in_evidence = False
+            elif in_evidence and _MATRIX_FIELD_RE.match(line):
+                in_evidence = False
             continue
 
         if current_agent is None:
             continue
 
-        # Field line (4-space indent): "    max_verified_version: "0.73.0""
-        m_ver = re.match(r'^\s{4}max_verified_version:\s*"?(.*?)"?\s*$', line)
-        if m_ver:
-            versions[current_agent] = m_ver.group(1).strip()
-
-    return versions
-
+        if lead == 6:
+            if in_evidence:
+                m_item = _MATRIX_ITEM_RE.match(line)
+                if m_item:
+                    evidence[current_agent].append(m_item.group(1))
+            continue
 
-def _keyword_hits(text: str, keywords: list[str]) -> list[str]:
+        if lead == 4:
+            # A new field ends any evidence list.
+            if in_evidence and _MATRIX_FIELD_RE.match(line):
+                in_evidence = False
+            key, sep, value = body.partition(":")
+            if not sep:
+                continue
+            if key == "max_verified_version":
+                # '    max_verified_version: "0.73.0"' -- one optional quote each side.
+                value = value.strip()
+                if value.startswith('"'):
+                    value = value[1:]
+                if value.endswith('"'):
+                    value = value[:-1]
+                versions[current_agent] = value.strip()
+            elif key == "evidence_fixtures" and not value.strip():
+                in_evidence = True
+                evidence[current_agent] = []
+
+    return versions, evidence
+
+
+def _keyword_hits(text: str, *keyword_lists: list[str]) -> tuple[list[str], ...]:
+    """Case-insensitive hits in `text`, one hit list per keyword list passed.
+
+    Keywords must already be lowercase; `main` normalises `risk_keywords` once when
+    the config is loaded. The text is lowercased once and each distinct keyword is
+    searched at most once, however many lists share it. Plain `in` (a C substring
+    search per keyword) beats a single alternation-regex pass at these list sizes, so
+    there is no multi-pattern matcher.
+    """
     if not text:
-        return []
+        return tuple([] for _ in keyword_lists)
     lower = text.lower()
-    hits: list[str] = []
-    for k in keywords:
-        if k.lower() in lower:
-            hits.append(k)
-    return hits
+    found: dict[str, bool] = {}
+    for k, contained in _keyword_plan(tuple(k for keywords in keyword_lists for k in keywords)):
+        # A keyword can't occur if a shorter keyword inside it didn't ("jsonl" without
+        # "json"), so those are settled without searching.
+        found[k] = all(found[c] for c in contained) and k in lower
+    return tuple([k for k in keywords if found[k]] for keywords in keyword_lists)
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_plan(keywords: tuple[str, ...]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Distinct keywords, shortest first, each with the shorter keywords it contains.
+
+    Built once per agent's keyword set and reused for every text scanned against it.
+    """
+    ordered = sorted(set(keywords), key=len)
+    return tuple((k, tuple(c for c in ordered[:i] if c in k)) for i, k in enumerate(ordered))
+
+
+def _upstream_scan_text(value: Any) -> str:
+    """The string values of an upstream result (nested ones included), newline-joined.
+
+    Risk keywords are about release content, so field names and non-string scalars
+    are left out; this also spares re-serializing the whole release body as JSON.
+    """
+    parts: list[str] = []
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, str):
+            parts.append(v)
+        elif isinstance(v, dict):
+            stack.extend(reversed(list(v.values())))
+        elif isinstance(v, list):
+            stack.extend(reversed(v))
+    return "\n".join(parts)
+
+
+def _normalize_risk_keywords(cfg: dict[str, Any]) -> None:
+    """Lowercase every agent's `risk_keywords` lists in place, once per run."""
+    for agent_cfg in (cfg.get("agents") or {}).values():
+        risk = agent_cfg.get("risk_keywords") if isinstance(agent_cfg, dict) else None
+        if not isinstance(risk, dict):
+            continue
+        for kind, keywords in risk.items():
+            if isinstance(keywords, list):
+                risk[kind] = [k.lower() for k in keywords if isinstance(k, str)]
 
 
 def _resolve_cli_binary_mtime(installed_version_cmd: list[str] | None) -> tuple[str | None, float | None]:
@@ -459,26 +785,13 @@ def _latest_cached_upstream_evidence(
     }
 
 
-def _compare_semver(a: str | None, b: str | None) -> int | None:
-    """
-    Returns -1/0/1 for a<b, a==b, a>b. None if either is not semver.
-    """
-    if not a or not b:
-        return None
-    va = Semver.parse(a)
-    vb = Semver.parse(b)
-    if not va or not vb:
-        return None
-    if va < vb:
-        return -1
-    if va > vb:
-        return 1
-    return 0
+# Working directory captured once per `main` run; report paths are made relative to it.
+_CWD: Path | None = None
 
 
 def _safe_relpath(path: Path) -> str:
     try:
-        return str(path.relative_to(Path.cwd()))
+        return str(path.relative_to(_CWD or Path.cwd()))
     except Exception:
         return str(path)
 
@@ -493,7 +806,6 @@ def _path_matches_any_exclude(path: Path, exclude_globs: list[str] | None) -> bo
     """
     if not exclude_globs:
         return False
-    import fnmatch
     posix = path.as_posix()
     for pattern in exclude_globs:
         if not isinstance(pattern, str) or not pattern:
@@ -506,28 +818,95 @@ def _path_matches_any_exclude(path: Path, exclude_globs: list[str] | None) -> bo
     return False
 
 
-def _newest_file(roots: list[str], glob: str, exclude_globs: list[str] | None = None) -> Path | None:
-    candidates: list[Path] = []
-    for r in roots:
-        root = _expand_path(r)
-        if not root.exists():
+def _glob_parts(glob: str) -> tuple[str, ...]:
+    """Split a local_schema glob into path components, collapsing repeated `**`.
+
+    Keeps the long-standing selection rule: a bare single-component wildcard
+    (`session_*.json`) matches only directly under the root; anything else is
+    matched recursively, exactly like `Path.rglob`.
+    """
+    parts = [p for p in glob.split("/") if p]
+    if not ("*" in glob and "/" not in glob):
+        parts.insert(0, "**")
+    collapsed: list[str] = []
+    for part in parts:
+        if part == "**" and collapsed and collapsed[-1] == "**":
             continue
-        candidates.extend(root.glob(glob) if "*" in glob and "/" not in glob else root.rglob(glob))
-    newest: Path | None = None
-    newest_mtime = -1.0
-    for p in candidates:
+        collapsed.append(part)
+    return tuple(collapsed)
+
+
+def _glob_parts_match(names: tuple[str, ...], parts: tuple[str, ...]) -> bool:
+    if not parts:
+        return not names
+    head = parts[0]
+    if head == "**":
+        return _glob_parts_match(names, parts[1:]) or (bool(names) and _glob_parts_match(names[1:], parts))
+    return bool(names) and fnmatch.fnmatchcase(names[0], head) and _glob_parts_match(names[1:], parts[1:])
+
+
+def _scan_glob(root: Path, parts: tuple[str, ...]) -> Iterator[tuple[Path, os.DirEntry[str]]]:
+    """Non-directory entries under `root` whose relative path matches `parts`.
+
+    An explicit-stack `os.scandir` walk: directory type comes from the cached dirent,
+    and a `Path` is only built for matches. Like `**` in pathlib, symlinked
+    directories are not descended into. Patterns without `**` have a fixed depth, so
+    directories that cannot lead to a match are never opened.
+    """
+    fixed_depth = None if "**" in parts else len(parts)
+    stack: list[tuple[str, tuple[str, ...]]] = [(str(root), ())]
+    while stack:
+        dir_path, rel = stack.pop()
         try:
-            st = p.stat()
+            it = os.scandir(dir_path)
         except OSError:
             continue
-        if not p.is_file():
-            continue
-        if _path_matches_any_exclude(p, exclude_globs):
-            continue
-        if st.st_mtime > newest_mtime:
-            newest = p
-            newest_mtime = st.st_mtime
-    return newest
+        with it:
+            for entry in it:
+                names = rel + (entry.name,)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if fixed_depth is None:
+                        stack.append((entry.path, names))
+                    elif len(names) < fixed_depth and fnmatch.fnmatchcase(entry.name, parts[len(rel)]):
+                        stack.append((entry.path, names))
+                    continue
+                if _glob_parts_match(names, parts):
+                    yield Path(entry.path), entry
+
+
+def _stat_candidates(
+    roots: list[str], glob: str, exclude_globs: list[str] | None = None
+) -> list[tuple[float, Path]]:
+    """`(mtime, path)` for every regular file matching `glob` under `roots`.
+
+    Each candidate is stat'd exactly once: `st_mode` answers is_file() and `st_mtime`
+    is kept for ranking, so callers never re-stat inside a sort key.
+    """
+    parts = _glob_parts(glob)
+    scored: list[tuple[float, Path]] = []
+    for r in roots:
+        for p, entry in _scan_glob(_expand_path(r), parts):
+            if _path_matches_any_exclude(p, exclude_globs):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            scored.append((st.st_mtime, p))
+    return scored
+
+
+def _newest_file(roots: list[str], glob: str, exclude_globs: list[str] | None = None) -> Path | None:
+    scored = _stat_candidates(roots, glob, exclude_globs)
+    if not scored:
+        return None
+    return max(scored, key=itemgetter(0))[1]
 
 
 # How many recent sessions the weekly scan fingerprints together. One is not enough:
@@ -541,39 +920,30 @@ def _newest_files(
     roots: list[str], glob: str, count: int, exclude_globs: list[str] | None = None
 ) -> list[Path]:
     """The `count` most recently modified matches, newest first."""
-    candidates: list[Path] = []
-    for r in roots:
-        root = _expand_path(r)
-        if not root.exists():
-            continue
-        candidates.extend(root.glob(glob) if "*" in glob and "/" not in glob else root.rglob(glob))
-    scored: list[tuple[float, Path]] = []
-    for p in candidates:
-        try:
-            st = p.stat()
-        except OSError:
-            continue
-        if not p.is_file():
-            continue
-        if _path_matches_any_exclude(p, exclude_globs):
-            continue
-        scored.append((st.st_mtime, p))
-    scored.sort(key=lambda t: t[0], reverse=True)
+    scored = _stat_candidates(roots, glob, exclude_globs)
+    scored.sort(key=itemgetter(0), reverse=True)
     return [p for _, p in scored[:count]]
 
 
 def _jsonl_contains_any_type(path: Path, required_types: set[str], max_lines: int) -> bool:
+    # A line can only have `type` in required_types if the encoded string value
+    # appears in its raw bytes, whatever the spacing around the colon. Checking that
+    # first skips the JSON decode for the vast majority of lines; matches are still
+    # parsed, so a value appearing elsewhere in the record can't yield a false hit.
+    needles = [json.dumps(t, ensure_ascii=False).encode("utf-8") for t in required_types]
     try:
         lines_seen = 0
-        with path.open("r", encoding="utf-8", errors="replace") as f:
+        with path.open("rb") as f:
             for line in f:
                 if not line.strip():
                     continue
                 lines_seen += 1
                 if lines_seen > max_lines:
                     break
+                if not any(n in line for n in needles):
+                    continue
                 try:
-                    obj = json.loads(line)
+                    obj = _loads(line)
                 except json.JSONDecodeError:
                     continue
                 if not isinstance(obj, dict):
@@ -586,6 +956,10 @@ def _jsonl_contains_any_type(path: Path, required_types: set[str], max_lines: in
     return False
 
 
+# Candidates _newest_file_with_types checks concurrently per round.
+_TYPE_PEEK_BATCH = 8
+
+
 def _newest_file_with_types(
     roots: list[str],
     glob: str,
@@ -593,18 +967,22 @@ def _newest_file_with_types(
     max_lines: int,
     exclude_globs: list[str] | None = None,
 ) -> Path | None:
-    candidates: list[Path] = []
-    for r in roots:
-        root = _expand_path(r)
-        if not root.exists():
-            continue
-        candidates.extend(root.glob(glob) if "*" in glob and "/" not in glob else root.rglob(glob))
-    candidates = [c for c in candidates if c.is_file() and not _path_matches_any_exclude(c, exclude_globs)]
-    candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    scored = _stat_candidates(roots, glob, exclude_globs)
+    if not scored:
+        return None
+    scored.sort(key=itemgetter(0), reverse=True)
     wanted = {t for t in required_types if isinstance(t, str) and t}
-    for p in candidates:
-        if _jsonl_contains_any_type(p, wanted, max_lines=max_lines):
-            return p
+    paths = [p for _, p in scored]
+    # Heads are peeked a batch at a time on threads so their reads overlap. Batches
+    # go newest first and map() keeps order, so this returns the same file a serial
+    # newest-first scan would.
+    with ThreadPoolExecutor(max_workers=min(_TYPE_PEEK_BATCH, len(paths))) as pool:
+        for start in range(0, len(paths), _TYPE_PEEK_BATCH):
+            batch = paths[start : start + _TYPE_PEEK_BATCH]
+            hits = pool.map(lambda p: _jsonl_contains_any_type(p, wanted, max_lines=max_lines), batch)
+            for p, hit in zip(batch, hits):
+                if hit:
+                    return p
     return None
 
 
@@ -654,21 +1032,38 @@ def _check_discovery_path_contract(local_file: str | None, contract_cfg: dict[st
     }
 
 
-def _tail_lines(path: Path, max_lines: int) -> list[str]:
-    # Read tail-ish by keeping only last max_lines lines (simple but OK for monitoring).
-    lines: list[str] = []
-    with path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            lines.append(line)
-            if len(lines) > max_lines:
-                lines.pop(0)
-    return lines
+# Files above this size are tailed by walking back from EOF through a read-only mmap
+# instead of streaming the whole log; live Claude/Codex sessions run to hundreds of MB.
+_TAIL_SEEK_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+
+def _tail_lines(path: Path, max_lines: int) -> list[bytes]:
+    """The last `max_lines` non-blank lines of `path`, as raw bytes for `_loads`."""
+    if max_lines <= 0:
+        return []
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size <= _TAIL_SEEK_THRESHOLD_BYTES:
+            f.seek(0)
+            return list(deque((line for line in f if line.strip()), maxlen=max_lines))
+
+        # Each step is one C-level rfind over the mapping; only the returned lines are
+        # copied out, and the kernel pages in just the tail that is touched.
+        lines: list[bytes] = []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size
+            while end > 0 and len(lines) < max_lines:
+                start = mm.rfind(b"\n", 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+        lines.reverse()
+        return lines
 
 
 def _jsonl_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     total_lines: int = 0
@@ -677,9 +1072,8 @@ def _jsonl_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
 
     for raw in lines:
         total_lines += 1
-        s = raw.strip()
         try:
-            obj = json.loads(s)
+            obj = _loads(raw)
         except json.JSONDecodeError:
             parse_errors += 1
             continue
@@ -688,9 +1082,7 @@ def _jsonl_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
         t = obj.get("type")
         event_type = t if isinstance(t, str) and t else "<missing-type>"
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
-        for k in obj.keys():
-            ks.add(k)
+        type_keys[event_type].update(obj)
 
     return {
         "file": str(path),
@@ -751,7 +1143,7 @@ _NESTED_OPAQUE_KEYS: dict[str, set[str]] = {
 def _nested_bucket_walk(
     bucket: str,
     obj: dict[str, Any],
-    out: dict[str, set[str]],
+    out: defaultdict[str, set[str]],
     depth: int,
     max_depth: int,
     opaque_keys: frozenset[str] = frozenset(),
@@ -763,9 +1155,7 @@ def _nested_bucket_walk(
     event name there). Keeping the key in the name means two different wrappers can
     never collapse into one bucket.
     """
-    ks = out.setdefault(bucket, set())
-    for k in obj.keys():
-        ks.add(k)
+    out[bucket].update(obj)
     if depth >= max_depth:
         return
     for k, v in obj.items():
@@ -809,7 +1199,7 @@ def _nested_jsonl_schema_fingerprint(
     docs/agent-support/monitoring.md relies on this fingerprint to watch, because
     those live under `event_msg.payload`.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     total_lines: int = 0
@@ -817,7 +1207,7 @@ def _nested_jsonl_schema_fingerprint(
     for raw in _tail_lines(path, max_lines):
         total_lines += 1
         try:
-            obj = json.loads(raw.strip())
+            obj = _loads(raw)
         except json.JSONDecodeError:
             parse_errors += 1
             continue
@@ -902,7 +1292,7 @@ def _kimi_wire_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
     Nested shape changes (a value that stops being an object) get their own
     `.<non-object>` bucket rather than being silently skipped.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     total_lines: int = 0
@@ -910,18 +1300,11 @@ def _kimi_wire_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
     # (turnId, step, stepUuid, part.type) -> count, to spot streamed parts.
     part_runs: dict[tuple[Any, Any, Any, str], int] = {}
 
-    lines: list[str] = []
-    with path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            lines.append(line)
-            if len(lines) > max_lines:
-                lines.pop(0)
+    lines = _tail_lines(path, max_lines)
 
     def _add(bucket: str, keys: Any = ()) -> None:
         type_counts[bucket] = type_counts.get(bucket, 0) + 1
-        ks = type_keys.setdefault(bucket, set())
+        ks = type_keys[bucket]
         for k in keys:
             if isinstance(k, str):
                 ks.add(k)
@@ -931,9 +1314,8 @@ def _kimi_wire_schema_fingerprint(path: Path, max_lines: int) -> dict[str, Any]:
 
     for raw in lines:
         total_lines += 1
-        s = raw.strip()
         try:
-            obj = json.loads(s)
+            obj = _loads(raw)
         except json.JSONDecodeError:
             parse_errors += 1
             continue
@@ -1004,25 +1386,17 @@ def _cursor_transcript_schema_fingerprint(path: Path, max_lines: int) -> dict[st
     Role normalization matches CursorSessionParser.swift:187-193:
       user/human -> user, assistant/model -> assistant, system -> system, else -> assistant
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     total_lines: int = 0
 
-    lines: list[str] = []
-    with path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            lines.append(line)
-            if len(lines) > max_lines:
-                lines.pop(0)
+    lines = _tail_lines(path, max_lines)
 
     for raw in lines:
         total_lines += 1
-        s = raw.strip()
         try:
-            obj = json.loads(s)
+            obj = _loads(raw)
         except json.JSONDecodeError:
             parse_errors += 1
             continue
@@ -1034,9 +1408,7 @@ def _cursor_transcript_schema_fingerprint(path: Path, max_lines: int) -> dict[st
         role_key = raw_role.lower() if isinstance(raw_role, str) else ""
         role = _ROLE_MAP.get(role_key, "assistant")
         type_counts[role] = type_counts.get(role, 0) + 1
-        ks = type_keys.setdefault(role, set())
-        for k in obj.keys():
-            ks.add(k)
+        type_keys[role].update(obj)
 
         # Bucket content block keys by content type
         msg = obj.get("message")
@@ -1051,9 +1423,7 @@ def _cursor_transcript_schema_fingerprint(path: Path, max_lines: int) -> dict[st
                         ct = "<missing-content-type>"
                     bucket = f"content.{ct}"
                     type_counts[bucket] = type_counts.get(bucket, 0) + 1
-                    cks = type_keys.setdefault(bucket, set())
-                    for k in block.keys():
-                        cks.add(k)
+                    type_keys[bucket].update(block)
 
     return {
         "file": str(path),
@@ -1072,24 +1442,23 @@ def _gemini_session_json_schema_fingerprint(path: Path, max_messages: int) -> di
     message has a `type` field (e.g. `user`, `gemini`). We bucket keys by message `type`,
     plus a `root` bucket for top-level session keys.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     parsed_messages: int = 0
 
     parse_errors = 0
     try:
-        root = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+        root = _loads(path.read_bytes())
     except Exception:
         root_items: list[Any] = []
         try:
-            with path.open("r", encoding="utf-8", errors="replace") as f:
+            with path.open("rb") as f:
                 for line in f:
-                    s = line.strip()
-                    if not s:
+                    if not line.strip():
                         continue
                     try:
-                        root_items.append(json.loads(s))
+                        root_items.append(_loads(line))
                     except json.JSONDecodeError:
                         parse_errors += 1
         except OSError:
@@ -1107,9 +1476,7 @@ def _gemini_session_json_schema_fingerprint(path: Path, max_messages: int) -> di
 
     def _add(event_type: str, obj: dict[str, Any]) -> None:
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
-        for k in obj.keys():
-            ks.add(k)
+        type_keys[event_type].update(obj)
 
     if isinstance(root, dict):
         _add("root", root)
@@ -1199,7 +1566,7 @@ def _hermes_session_json_schema_fingerprint(path: Path, max_messages: int) -> di
     The app parser consumes root metadata, message-role records, assistant tool_calls,
     and declared root tools, so bucket those shapes separately.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parsed_messages = 0
     parsed_tool_calls = 0
@@ -1220,9 +1587,7 @@ def _hermes_session_json_schema_fingerprint(path: Path, max_messages: int) -> di
 
     def _add(event_type: str, obj: dict[str, Any]) -> None:
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
-        for k in obj.keys():
-            ks.add(k)
+        type_keys[event_type].update(obj)
 
     if not isinstance(root, dict):
         return {
@@ -1277,14 +1642,14 @@ def _hermes_session_json_schema_fingerprint(path: Path, max_messages: int) -> di
 
 
 def _hermes_state_db_latest_session_schema_fingerprint(path: Path, max_messages: int) -> dict[str, Any]:
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parsed_messages = 0
     parsed_tool_calls = 0
 
     def _add(event_type: str, obj: dict[str, Any]) -> None:
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
+        ks = type_keys[event_type]
         for k, value in obj.items():
             if value is not None:
                 ks.add(k)
@@ -1373,17 +1738,47 @@ def _hermes_state_db_latest_session_schema_fingerprint(path: Path, max_messages:
     }
 
 
+_OPENCODE_STORAGE_DIRS = frozenset({"session", "message", "part"})
+
+
 def _opencode_storage_root_for_session_file(session_path: Path) -> Path | None:
     # Typical layout: ~/.local/share/opencode/storage/session/<project>/ses_*.json
-    for parent in session_path.parents:
+    return _opencode_storage_root_for_dir(session_path.parent)
+
+
+@functools.lru_cache(maxsize=64)
+def _opencode_storage_root_for_dir(start: Path) -> Path | None:
+    # Sibling sessions share a directory, so the upward walk is cached per start dir.
+    # `start` itself holds every session file of the project, so listing it would read
+    # thousands of names to look for three; probe those directly instead. Ancestors
+    # are small, and one listing each replaces three existence probes.
+    if all(os.path.exists(os.path.join(start, name)) for name in _OPENCODE_STORAGE_DIRS):
+        return start
+    for parent in start.parents:
         try:
-            if (parent / "session").exists() and (parent / "message").exists() and (parent / "part").exists():
-                return parent
+            with os.scandir(parent) as it:
+                names = {e.name for e in it}
         except OSError:
             continue
+        if _OPENCODE_STORAGE_DIRS <= names:
+            return parent
     return None
 
 
+def _sorted_json_files(dir_path: Path, prefix: str = "") -> list[Path]:
+    """`dir_path/<prefix>*.json` sorted by name; empty if the directory is missing.
+
+    OpenCode keeps one small file per message/part, so these directories get large.
+    A single scandir with plain string tests replaces a glob's per-entry fnmatch.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            names = [e.name for e in it if e.name.startswith(prefix) and e.name.endswith(".json")]
+    except OSError:
+        return []
+    return [dir_path / name for name in sorted(names)]
+
+
 def _opencode_fixture_file_schema_fingerprint(path: Path) -> dict[str, Any]:
     """
     Fingerprint a single OpenCode JSON file from fixtures.
@@ -1391,12 +1786,12 @@ def _opencode_fixture_file_schema_fingerprint(path: Path) -> dict[str, Any]:
     We bucket keys by "record kind" so message/part schema changes are visible separately
     from session record schema changes.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
 
     try:
-        obj = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+        obj = _loads(path.read_bytes())
     except Exception:
         return {"file": str(path), "type_counts": {}, "type_keys": {}, "parse_errors": 1}
 
@@ -1435,7 +1830,7 @@ def _opencode_storage_session_tree_schema_fingerprint(
     - message records (storage/message/<sessionId>/msg_*.json)
     - part records (storage/part/<messageId>/*.json)
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors: int = 0
     message_files_parsed: int = 0
@@ -1443,12 +1838,10 @@ def _opencode_storage_session_tree_schema_fingerprint(
 
     def _add(event_type: str, obj: dict[str, Any]) -> None:
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
-        for k in obj.keys():
-            ks.add(k)
+        type_keys[event_type].update(obj)
 
     try:
-        session_obj = json.loads(session_path.read_text(encoding="utf-8", errors="replace"))
+        session_obj = _loads(session_path.read_bytes())
     except Exception:
         return {
             "file": str(session_path),
@@ -1499,9 +1892,9 @@ def _opencode_storage_session_tree_schema_fingerprint(
 
     total_parts_budget = max(0, int(max_parts))
     msg_budget = max(0, int(max_messages))
-    for msg_file in sorted(msg_dir.glob("msg_*.json"))[:msg_budget]:
+    for msg_file in _sorted_json_files(msg_dir, prefix="msg_")[:msg_budget]:
         try:
-            msg_obj = json.loads(msg_file.read_text(encoding="utf-8", errors="replace"))
+            msg_obj = _loads(msg_file.read_bytes())
         except Exception:
             parse_errors += 1
             continue
@@ -1515,17 +1908,13 @@ def _opencode_storage_session_tree_schema_fingerprint(
         mid = msg_obj.get("id")
         if not isinstance(mid, str) or not mid:
             continue
-        part_dir = storage_root / "part" / mid
-        if not part_dir.exists():
-            continue
         if total_parts_budget <= 0:
             continue
-        part_files = sorted(part_dir.glob("*.json"))
-        for part_file in part_files:
+        for part_file in _sorted_json_files(storage_root / "part" / mid):
             if total_parts_budget <= 0:
                 break
             try:
-                part_obj = json.loads(part_file.read_text(encoding="utf-8", errors="replace"))
+                part_obj = _loads(part_file.read_bytes())
             except Exception:
                 parse_errors += 1
                 total_parts_budget -= 1
@@ -1559,7 +1948,7 @@ def _opencode_sqlite_latest_session_schema_fingerprint(
     schema buckets normalized to the fixture keys so version checks report real
     format drift, not storage implementation details like snake_case columns.
     """
-    type_keys: dict[str, set[str]] = {}
+    type_keys: defaultdict[str, set[str]] = defaultdict(set)
     type_counts: dict[str, int] = {}
     parse_errors = 0
     message_rows_parsed = 0
@@ -1567,7 +1956,7 @@ def _opencode_sqlite_latest_session_schema_fingerprint(
 
     def _add(event_type: str, obj: dict[str, Any]) -> None:
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        ks = type_keys.setdefault(event_type, set())
+        ks = type_keys[event_type]
         for k, v in obj.items():
             if v is not None:
                 ks.add(k)
@@ -1715,9 +2104,29 @@ def _opencode_sqlite_latest_session_schema_fingerprint(
     }
 
 
+def _fixture_stat_key(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _baseline_type_keys_for_agent(agent_name: str, baseline_paths: list[str]) -> dict[str, list[str]]:
     # Baseline should represent the current "normal" format; ignore schema_drift fixtures.
     filtered = [p for p in baseline_paths if isinstance(p, str) and p and "schema_drift" not in p]
+    # The same fixtures are fingerprinted by the weekly and prebump passes; memoize on
+    # each file's stat (and the cwd, as matrix paths are relative) so edits are re-read.
+    stamp = tuple((p, _fixture_stat_key(p)) for p in filtered)
+    cached = _baseline_type_keys_cached(agent_name, os.getcwd(), stamp)
+    return {t: list(keys) for t, keys in cached.items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _baseline_type_keys_cached(
+    agent_name: str, cwd: str, stamp: tuple[tuple[str, tuple[int, int] | None], ...]
+) -> dict[str, list[str]]:
+    filtered = [p for p, _ in stamp]
     fps: list[dict[str, Any]] = []
 
     if agent_name in ("codex", "claude", "copilot", "droid", "pi"):
@@ -1813,8 +2222,14 @@ def _schema_diff(
     unknown_keys: dict[str, list[str]] = {}
     missing_keys: dict[str, list[str]] = {}
     for t in sorted(observed_types | baseline_types):
-        o = set(observed_type_keys.get(t, []))
-        b = set(baseline_type_keys.get(t, []))
+        o_list = observed_type_keys.get(t, [])
+        b_list = baseline_type_keys.get(t, [])
+        # Fingerprint key lists are sorted, so an unchanged bucket (the common case)
+        # is settled by one list comparison without building sets.
+        if o_list == b_list:
+            continue
+        o = set(o_list)
+        b = set(b_list)
         extra = sorted(o - b)
         miss = sorted(b - o)
         if extra:
@@ -1861,9 +2276,14 @@ def _run_probe_script(probe: dict[str, Any], out_dir: Path, verbose: bool) -> di
 
     rc, stdout, stderr = _run_cmd(argv, timeout=timeout)
 
-    (out_dir / f"{label}.argv.json").write_text(json.dumps(argv, indent=2) + "\n", encoding="utf-8")
-    (out_dir / f"{label}.stdout.txt").write_text(stdout + "\n", encoding="utf-8")
-    (out_dir / f"{label}.stderr.txt").write_text(stderr + "\n", encoding="utf-8")
+    # Sidecars are written as ready-made bytes: one open/write/close each, with no
+    # text-layer encoder or newline translation in between.
+    for suffix, payload in (
+        ("argv.json", json.dumps(argv, indent=2)),
+        ("stdout.txt", stdout),
+        ("stderr.txt", stderr),
+    ):
+        (out_dir / f"{label}.{suffix}").write_bytes(payload.encode("utf-8") + b"\n")
 
     parsed: dict[str, Any] | None = None
     if parse_kind == "claude_usage_json" or parse_kind == "codex_status_json":
@@ -1918,6 +2338,27 @@ def _run_probe_script(probe: dict[str, Any], out_dir: Path, verbose: bool) -> di
     }
 
 
+def _fetch_upstreams(sources: list[Any], timeout: int) -> Iterator[dict[str, Any]]:
+    """`_fetch_upstream` results for every dict source, yielded in priority order.
+
+    Fallback sources are requested alongside the primary, so a slow or failing first
+    source costs max(latency) rather than the sum. Callers stop at the first ok
+    result; lower-priority fetches still in flight are then abandoned, not awaited.
+    """
+    sources = [s for s in sources if isinstance(s, dict)]
+    if len(sources) <= 1:
+        for s in sources:
+            yield _fetch_upstream(s, timeout=timeout)
+        return
+    pool = ThreadPoolExecutor(max_workers=len(sources))
+    try:
+        futures = [pool.submit(_fetch_upstream, s, timeout) for s in sources]
+        for future in futures:
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def _fetch_upstream(source: dict[str, Any], timeout: int) -> dict[str, Any]:
     kind = source.get("kind")
     if kind == "github_latest_release":
@@ -1973,8 +2414,14 @@ def _fetch_upstream(source: dict[str, Any], timeout: int) -> dict[str, Any]:
             return {"ok": False, "error": "fetch_failed", "detail": str(exc), "url": url}
         rx = re.compile(pattern)
         versions: list[Semver] = []
+        # Release listings repeat each version many times (links, checksums, assets);
+        # parse each distinct capture once.
+        seen_raw: set[str] = set()
         for m in rx.finditer(text):
             raw = m.group(1) if m.groups() else m.group(0)
+            if raw in seen_raw:
+                continue
+            seen_raw.add(raw)
             v = Semver.parse(raw)
             if v:
                 versions.append(v)
@@ -2688,9 +3135,7 @@ def _run_prebump(
             "report_dir": _safe_relpath(prebump_dir),
             "results": {e["agent"]: e for e in gate_failures},
         }
-        (prebump_dir / "report.json").write_text(
-            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-        )
+        _write_report(prebump_dir / "report.json", report)
         return 4
 
     entries: list[dict[str, Any]] = []
@@ -2882,12 +3327,7 @@ def _run_prebump(
         schema_diff: dict[str, Any] | None = None
         fresh_matches: bool | None = None
         if result.ok and result.session_path and result.session_path.exists():
-            matrix_key = {
-                "codex": "codex_cli", "claude": "claude_code", "copilot": "copilot_cli",
-                "antigravity": "antigravity", "opencode": "opencode", "hermes": "hermes",
-                "openclaw": "openclaw", "cursor": "cursor", "pi": "pi",
-                "kimi": "kimi_code",
-            }.get(agent_name)
+            matrix_key = _MATRIX_KEY_BY_AGENT.get(agent_name)
             baseline_paths = evidence.get(matrix_key or "", []) if matrix_key else []
             baseline_type_keys = _baseline_type_keys_for_agent(agent_name, baseline_paths)
             if agent_name == "antigravity":
@@ -2965,9 +3405,7 @@ def _run_prebump(
         "report_dir": _safe_relpath(prebump_dir),
         "results": {e["agent"]: e for e in entries},
     }
-    (prebump_dir / "report.json").write_text(
-        json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    _write_report(prebump_dir / "report.json", report)
 
     rc = _exit_code_for_prebump(entries)
     print(f"Agent watch (prebump) report: {prebump_dir / 'report.json'}")
@@ -2978,12 +3416,474 @@ def _run_prebump(
     return rc
 
 
+def _process_agent(
+    agent_name: str,
+    agent_cfg: dict[str, Any],
+    *,
+    args: argparse.Namespace,
+    report_dir: Path,
+    verified_map: dict[str, str | None],
+    evidence: dict[str, list[str]],
+) -> tuple[dict[str, Any], str | None, bool]:
+    """Run one agent's daily/weekly checks; returns (result, summary_line, actionable).
+
+    Agents share nothing but read-only config, and each writes only under its own
+    `report_dir/<agent>` directory, so `main` runs these concurrently.
+    """
+    agent_out = report_dir / agent_name
+    agent_out.mkdir(parents=True, exist_ok=True)
+    weekly_cfg = agent_cfg.get("weekly") or _EMPTY_CFG
+    risk_cfg = agent_cfg.get("risk_keywords") or _EMPTY_CFG
+
+    verified = verified_map.get(agent_name)
+    # Parsed once; the newer-than checks below compare Semver values directly.
+    verified_v = _parse_semver_cached(verified) if verified else None
+
+    installed_cmd = agent_cfg.get("installed_version_cmd")
+    effective_installed_cmd = installed_cmd if isinstance(installed_cmd, list) else None
+    installed_rc, installed_stdout, installed_stderr = (0, "", "skipped")
+    installed: str | None = None
+    if not args.skip_update:
+        (
+            effective_installed_cmd,
+            installed_rc,
+            installed_stdout,
+            installed_stderr,
+            installed,
+        ) = _run_installed_version_cmds(agent_cfg)
+
+    upstream_sources = agent_cfg.get("upstream") or []
+    upstream: str | None = None
+    upstream_source_used: dict[str, Any] | None = None
+    upstream_source_status: str | None = None
+    upstream_errors: list[dict[str, Any]] = []
+
+    if not args.skip_update and isinstance(upstream_sources, list):
+        for res in _fetch_upstreams(upstream_sources, timeout=args.timeout):
+            if res.get("ok"):
+                upstream = res.get("version")
+                upstream_source_used = res
+                upstream_source_status = "current_fetch"
+                break
+            upstream_errors.append(res)
+
+    if (
+        not args.skip_update
+        and upstream_sources
+        and upstream is None
+        and _upstream_fetch_degraded(upstream_errors)
+    ):
+        cached_upstream = _latest_cached_upstream_evidence(
+            agent_name=agent_name,
+            reports_root=report_dir.parent,
+        )
+        if cached_upstream is not None:
+            upstream = cached_upstream.get("version")
+            upstream_source_used = cached_upstream
+            upstream_source_status = "cached_prior_report"
+
+    schema_keywords = list(risk_cfg.get("schema") or [])
+    usage_keywords = list(risk_cfg.get("usage") or [])
+    notes_text = _upstream_scan_text(upstream_source_used) if upstream_source_used else ""
+
+    schema_hits, usage_hits = _keyword_hits(notes_text, schema_keywords, usage_keywords)
+
+    upstream_newer_than_verified = False
+    installed_newer_than_verified = False
+    if verified_v is not None:
+        upstream_v = _parse_semver_cached(upstream) if upstream else None
+        installed_v = _parse_semver_cached(installed) if installed else None
+        upstream_newer_than_verified = upstream_v is not None and upstream_v > verified_v
+        installed_newer_than_verified = installed_v is not None and installed_v > verified_v
+
+    monitoring_failed = False
+    if not args.skip_update and upstream_sources and upstream is None:
+        monitoring_failed = not _upstream_fetch_degraded(upstream_errors)
+
+    weekly_details: dict[str, Any] | None = None
+    probe_failed = False
+    probe_failed_but_upstream_degraded = False
+    discovery_contract_failed = False
+    schema_matches_baseline: bool | None = None
+    schema_diff: dict[str, Any] | None = None
+    if args.mode == "weekly":
+        weekly_details = {}
+        local_schema_cfg = weekly_cfg.get("local_schema")
+        discovery_contract_cfg = weekly_cfg.get("discovery_path_contract")
+        if isinstance(local_schema_cfg, dict):
+            kind = local_schema_cfg.get("kind")
+            roots = list(local_schema_cfg.get("roots") or [])
+            glob = str(local_schema_cfg.get("glob") or "**/*")
+            matrix_key = _MATRIX_KEY_BY_AGENT.get(agent_name)
+            baseline_paths = evidence.get(matrix_key or "", []) if matrix_key else []
+            baseline_type_keys = _baseline_type_keys_for_agent(agent_name, baseline_paths)
+
+            local_fp: dict[str, Any] | None = None
+            newest: Path | None = None
+
+            # `kimi_wire_newest` selects the same way as `jsonl_newest` but
+            # fingerprints the nested loop-event structure as well.
+            if kind in ("jsonl_newest", "kimi_wire_newest"):
+                max_lines = int(local_schema_cfg.get("max_lines") or 2500)
+                required_types = list(local_schema_cfg.get("required_types") or [])
+                exclude_globs_cfg = local_schema_cfg.get("exclude_globs")
+                exclude_globs = [g for g in exclude_globs_cfg if isinstance(g, str)] if isinstance(exclude_globs_cfg, list) else None
+                if required_types:
+                    newest = _newest_file_with_types(
+                        roots, glob, required_types, max_lines=400, exclude_globs=exclude_globs
+                    )
+                else:
+                    newest = _newest_file(roots, glob, exclude_globs=exclude_globs)
+                if newest:
+                    def _fp(p: Path) -> dict[str, Any]:
+                        if kind == "kimi_wire_newest":
+                            return _kimi_wire_schema_fingerprint(p, max_lines=max_lines)
+                        return _schema_fingerprint_for_agent(agent_name, p, max_lines=max_lines)
+
+                    local_fp = _fp(newest)
+                    # Union the next few recent sessions into the same fingerprint so
+                    # one thin session cannot decide the verdict on its own.
+                    if required_types:
+                        recent = _newest_files_with_types(
+                            roots, glob, required_types, _LOCAL_SCHEMA_SAMPLE_COUNT,
+                            max_lines=400, exclude_globs=exclude_globs,
+                        )
+                    else:
+                        recent = _newest_files(
+                            roots, glob, _LOCAL_SCHEMA_SAMPLE_COUNT, exclude_globs=exclude_globs
+                        )
+                    siblings = [p for p in recent if p != newest]
+                    sampled_fps = [local_fp]
+                    for sib in siblings:
+                        try:
+                            sampled_fps.append(_fp(sib))
+                        except OSError:
+                            continue
+                    if len(sampled_fps) > 1:
+                        local_fp["type_keys"] = _merge_type_keys(sampled_fps)
+                        merged_counts: dict[str, int] = {}
+                        for fp in sampled_fps:
+                            for t, n in (fp.get("type_counts") or {}).items():
+                                merged_counts[t] = merged_counts.get(t, 0) + int(n)
+                        local_fp["type_counts"] = dict(sorted(merged_counts.items()))
+                    local_fp["sampled_files"] = [str(fp.get("file")) for fp in sampled_fps]
+            elif kind == "antigravity_markdown_newest":
+                max_lines = int(local_schema_cfg.get("max_lines") or 2500)
+                newest = _newest_file(roots, glob)
+                if newest:
+                    local_fp = _antigravity_markdown_schema_fingerprint(newest, max_lines=max_lines)
+            elif kind == "hermes_session_json_newest":
+                max_messages = int(local_schema_cfg.get("max_messages") or 2500)
+                newest = _newest_file(roots, glob)
+                if newest:
+                    local_fp = _hermes_session_json_schema_fingerprint(newest, max_messages=max_messages)
+            elif kind == "hermes_latest_session":
+                max_messages = int(local_schema_cfg.get("max_messages") or 2500)
+                db_roots_cfg = local_schema_cfg.get("db_roots") or []
+                db_roots = [_expand_path(p) for p in db_roots_cfg if isinstance(p, str)]
+                for db_path in db_roots:
+                    if db_path.exists():
+                        newest = db_path
+                        local_fp = _hermes_state_db_latest_session_schema_fingerprint(db_path, max_messages=max_messages)
+                        break
+                if local_fp is None:
+                    newest = _newest_file(roots, glob)
+                    if newest:
+                        local_fp = _hermes_session_json_schema_fingerprint(newest, max_messages=max_messages)
+            elif kind == "opencode_storage_latest_session":
+                max_messages = int(local_schema_cfg.get("max_messages") or 250)
+                max_parts = int(local_schema_cfg.get("max_parts") or 2500)
+                newest = _newest_file(roots, glob)
+                if newest:
+                    local_fp = _opencode_storage_session_tree_schema_fingerprint(
+                        newest, max_messages=max_messages, max_parts=max_parts
+                    )
+            elif kind == "opencode_latest_session":
+                max_messages = int(local_schema_cfg.get("max_messages") or 250)
+                max_parts = int(local_schema_cfg.get("max_parts") or 2500)
+                db_roots = list(local_schema_cfg.get("db_roots") or ["~/.local/share/opencode/opencode.db"])
+                db_candidates = [_expand_path(str(p)) for p in db_roots if isinstance(p, str)]
+                db_candidates = [p for p in db_candidates if p.exists()]
+                if db_candidates:
+                    newest = max(db_candidates, key=lambda p: p.stat().st_mtime)
+                    local_fp = _opencode_sqlite_latest_session_schema_fingerprint(
+                        newest, max_messages=max_messages, max_parts=max_parts
+                    )
+                else:
+                    newest = _newest_file(roots, glob)
+                    if newest:
+                        local_fp = _opencode_storage_session_tree_schema_fingerprint(
+                            newest, max_messages=max_messages, max_parts=max_parts
+                        )
+            elif kind == "cursor_transcript_newest":
+                max_lines = int(local_schema_cfg.get("max_lines") or 2500)
+                newest = _newest_file(roots, glob)
+                if newest:
+                    local_fp = _cursor_transcript_schema_fingerprint(newest, max_lines=max_lines)
+
+            if local_fp is not None:
+                weekly_details["local_schema"] = local_fp
+                if baseline_type_keys:
+                    schema_diff = _schema_diff(
+                        observed_type_keys=local_fp.get("type_keys") or {},
+                        baseline_type_keys=baseline_type_keys,
+                        observed_event_count=_observed_event_count(local_fp),
+                    )
+                    schema_matches_baseline = bool(schema_diff.get("unknown_only_is_empty"))
+                    weekly_details["baseline_schema"] = {
+                        "fixtures": [p for p in baseline_paths if isinstance(p, str) and "schema_drift" not in p],
+                        "type_keys": baseline_type_keys,
+                    }
+                    weekly_details["schema_diff"] = schema_diff
+            else:
+                weekly_details["local_schema"] = {"error": "no_files_found", "roots": roots, "glob": glob, "kind": kind}
+
+            if isinstance(discovery_contract_cfg, dict):
+                local_file = None
+                if isinstance(local_fp, dict):
+                    local_file_value = local_fp.get("file")
+                    if isinstance(local_file_value, str):
+                        local_file = local_file_value
+                contract_result = _check_discovery_path_contract(local_file, discovery_contract_cfg)
+                weekly_details["discovery_path_contract"] = contract_result
+                discovery_contract_failed = bool(local_file) and not bool(contract_result.get("ok"))
+
+        probes_cfg = weekly_cfg.get("probes") or []
+        probe_results: list[dict[str, Any]] = []
+        if isinstance(probes_cfg, list):
+            probes = [p for p in probes_cfg if isinstance(p, dict)]
+            # Probes only wait on their own subprocess and write label-named sidecars,
+            # so an agent's probes run side by side; results keep config order.
+            with ThreadPoolExecutor(max_workers=max(1, len(probes))) as pool:
+                probe_results = list(pool.map(lambda p: _run_probe_script(p, agent_out, verbose=args.verbose), probes))
+        if probe_results:
+            weekly_details["probes"] = probe_results
+            probe_failed = any(not pr.get("ok") for pr in probe_results)
+        probe_failed = probe_failed or discovery_contract_failed
+        if agent_name == "claude":
+            status = next((pr for pr in probe_results if pr.get("label") == "claude_status"), None)
+            usage = next((pr for pr in probe_results if pr.get("label") == "claude_usage_probe"), None)
+            status_parsed = (status or {}).get("parsed") if isinstance(status, dict) else None
+            if isinstance(status_parsed, dict):
+                indicator = status_parsed.get("indicator")
+                incidents = status_parsed.get("incidents_count")
+                degraded = (isinstance(indicator, str) and indicator not in ("none", "unknown")) or (
+                    isinstance(incidents, int) and incidents > 0
+                )
+                usage_ok = bool((usage or {}).get("ok")) if isinstance(usage, dict) else True
+                if degraded and not usage_ok:
+                    probe_failed_but_upstream_degraded = True
+
+    severity, recommendation = _pick_severity(
+        upstream_newer_than_verified=upstream_newer_than_verified,
+        installed_newer_than_verified=installed_newer_than_verified,
+        monitoring_failed=monitoring_failed,
+        schema_hits=schema_hits,
+        usage_hits=usage_hits,
+        probe_failed=probe_failed,
+        probe_failed_but_upstream_degraded=probe_failed_but_upstream_degraded,
+    )
+
+    sample_freshness: dict[str, Any] | None = None
+    fresh_evidence_available = False
+    fresh_evidence_source: str | None = None
+    prebump_evidence: dict[str, Any] | None = None
+    failed_prebump_evidence: dict[str, Any] | None = None
+    if args.mode == "weekly":
+        window_days_cfg = int(weekly_cfg.get("freshness_window_days") or 14)
+        window_seconds = window_days_cfg * 86400
+        sample_mtime_epoch: float | None = None
+        if isinstance(weekly_details, dict):
+            local_schema_obj = weekly_details.get("local_schema")
+            if isinstance(local_schema_obj, dict):
+                fpath = local_schema_obj.get("file")
+                if isinstance(fpath, str):
+                    try:
+                        st = os.stat(fpath)
+                        sample_mtime_epoch = float(st.st_mtime)
+                        local_schema_obj["mtime_epoch"] = sample_mtime_epoch
+                        local_schema_obj["mtime_utc"] = _epoch_to_utc_iso(sample_mtime_epoch)
+                    except OSError:
+                        pass
+        cli_path, cli_mtime = _resolve_cli_binary_mtime(effective_installed_cmd)
+        mode_context = "skip_update" if args.skip_update else "normal"
+        sample_freshness = _compute_sample_freshness(
+            sample_mtime=sample_mtime_epoch,
+            cli_binary_path=cli_path,
+            cli_binary_mtime=cli_mtime,
+            freshness_window_seconds=window_seconds,
+            now_epoch=datetime.now(timezone.utc).timestamp(),
+            mode_context=mode_context,
+            force_fresh=bool(getattr(args, "force_fresh", False)),
+        )
+        if isinstance(agent_cfg.get("prebump"), dict):
+            prebump_evidence = _latest_successful_prebump_evidence(
+                agent_name=agent_name,
+                reports_root=report_dir.parent,
+                cli_binary_mtime=cli_mtime,
+            )
+            if prebump_evidence is not None:
+                prebump_sample = prebump_evidence.get("sample_freshness")
+                if isinstance(prebump_sample, dict):
+                    sample_freshness = dict(prebump_sample)
+                    sample_freshness["mode_context"] = "latest_prebump_report"
+                if prebump_evidence.get("schema_matches_baseline") is True:
+                    schema_matches_baseline = True
+                    schema_diff = prebump_evidence.get("schema_diff") if isinstance(prebump_evidence.get("schema_diff"), dict) else schema_diff
+                fresh_evidence_available = True
+                fresh_evidence_source = "latest_prebump_report"
+            else:
+                failed_prebump_evidence = _latest_failed_prebump_evidence(
+                    agent_name=agent_name,
+                    reports_root=report_dir.parent,
+                    cli_binary_mtime=cli_mtime,
+                )
+
+    # If we have concrete evidence that the newest local schema matches our fixture baseline,
+    # downgrade "installed newer" to low and suggest bumping verified version.
+    if (
+        args.mode == "weekly"
+        and severity in ("medium", "low")
+        and installed_newer_than_verified
+        and schema_matches_baseline is True
+        and not probe_failed
+    ):
+        severity = "low"
+        recommendation = "bump_verified_version"
+
+    if args.mode == "weekly":
+        severity, recommendation = _apply_stale_override(
+            severity=severity,
+            recommendation=recommendation,
+            installed_newer_than_verified=installed_newer_than_verified,
+            schema_matches_baseline=schema_matches_baseline,
+            sample_freshness=sample_freshness,
+            probe_failed=probe_failed,
+        )
+
+    if args.mode == "weekly":
+        compatibility = _build_compatibility_assessment(
+            verified=verified,
+            installed=installed,
+            upstream=upstream,
+            upstream_source_status=upstream_source_status,
+            upstream_sources_configured=bool(upstream_sources),
+            upstream_errors=upstream_errors,
+            installed_newer_than_verified=installed_newer_than_verified,
+            upstream_newer_than_verified=upstream_newer_than_verified,
+            monitoring_failed=monitoring_failed,
+            schema_matches_baseline=schema_matches_baseline,
+            schema_diff=schema_diff,
+            sample_freshness=sample_freshness,
+            fresh_evidence_source=fresh_evidence_source,
+            probe_failed=probe_failed,
+            real_session_driver_configured=isinstance(agent_cfg.get("prebump"), dict),
+            failed_prebump_evidence=failed_prebump_evidence,
+        )
+        severity, recommendation = _apply_compatibility_to_legacy_status(
+            severity=severity,
+            recommendation=recommendation,
+            compatibility=compatibility,
+        )
+    else:
+        compatibility = {
+            "question": "Can current Agent Sessions code support the latest available session/storage/usage format for this agent?",
+            "verdict": "not_evaluated_daily",
+            "scope": "none",
+            "confidence": "none",
+            "latest_status": (
+                "cached_latest"
+                if upstream and upstream_source_status == "cached_prior_report"
+                else (
+                    "current_fetch_known"
+                    if upstream
+                    else ("unknown_fetch_failed" if upstream_errors else "unknown_not_configured")
+                )
+            ),
+            "verified_version": verified,
+            "installed_version": installed,
+            "latest_available_version": upstream,
+            "supports_installed": None,
+            "supports_latest": None,
+            "evidence_source": "not_collected_daily",
+            "fresh_schema_evidence": False,
+            "blockers": [],
+            "next_action": "run weekly mode for compatibility verdict",
+        }
+
+    # Daily runs should only bother the user when something looks risky/urgent.
+    # Low severity (newer version with no risk signal) is recorded silently.
+    if args.mode == "weekly":
+        actionable = severity != "none"
+    else:
+        actionable = severity in ("medium", "high")
+
+    result = {
+        "verified_version": verified,
+        "installed": {
+            "argv": effective_installed_cmd,
+            "exit_code": installed_rc,
+            "stdout": installed_stdout,
+            "stderr": installed_stderr,
+            "parsed_version": installed,
+        },
+        "upstream": {
+            "parsed_version": upstream,
+            "source_used": upstream_source_used,
+            "source_status": upstream_source_status,
+            "errors": upstream_errors[:3],
+        },
+        "diff": {
+            "upstream_newer_than_verified": upstream_newer_than_verified,
+            "installed_newer_than_verified": installed_newer_than_verified,
+        },
+        "risk": {
+            "schema_keyword_hits": schema_hits,
+            "usage_keyword_hits": usage_hits,
+            "monitoring_failed": monitoring_failed,
+        },
+        "weekly": weekly_details,
+        "evidence": {
+            "schema_matches_baseline": schema_matches_baseline,
+            "schema_diff": schema_diff,
+            "sample_freshness": sample_freshness,
+            "fresh_evidence_available": fresh_evidence_available,
+            "fresh_evidence_source": fresh_evidence_source,
+            "prebump_evidence": prebump_evidence,
+            "failed_prebump_evidence": failed_prebump_evidence,
+        },
+        "compatibility": compatibility,
+        "severity": severity,
+        "recommendation": recommendation,
+    }
+
+    summary_line: str | None = None
+    if args.mode == "weekly" or severity != "none":
+        summary_line = _format_summary_line(
+            agent_name=agent_name,
+            severity=severity,
+            verified=verified,
+            installed=installed,
+            upstream=upstream,
+            recommendation=recommendation,
+            sample_freshness=sample_freshness,
+            compatibility=compatibility,
+        )
+    return result, summary_line, actionable
+
+
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--mode", choices=["daily", "weekly", "prebump"], required=True)
     parser.add_argument("--config", default=DEFAULT_CONFIG)
     parser.add_argument("--timeout", type=int, default=12)
     parser.add_argument("--verbose", action="store_true")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=_MAX_AGENT_WORKERS,
+        help=f"Agents checked concurrently in daily/weekly mode (default {_MAX_AGENT_WORKERS}; 1 runs them in order).",
+    )
     parser.add_argument("--skip-update", action="store_true",
                         help="Skip installed-version and upstream-fetch checks (agents already updated locally)")
     parser.add_argument("--force-fresh", action="store_true",
@@ -3003,531 +3903,58 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--allow-real-home", action="store_true", help="Allow copilot (and other home_override agents) to fall back to real HOME after an explicit sandbox-leak diagnostic.")
     args = parser.parse_args(argv)
 
+    global _CWD
+    _CWD = Path.cwd()
     cfg_path = Path(args.config)
     cfg = _read_json(cfg_path)
+    _normalize_risk_keywords(cfg)
     report_root = Path(cfg.get("report_root") or "scripts/probe_scan_output/agent_watch")
     report_dir = report_root / _now_utc_slug()
     report_dir.mkdir(parents=True, exist_ok=True)
+    # Conditional-GET validators for upstream fetches live beside the reports, so
+    # they survive across runs but not across a wipe of the output directory.
+    _HTTP_CACHE.load(report_root / ".etag_cache.json")
 
-    matrix_versions = _read_verified_versions_from_matrix(Path("docs/agent-support/agent-support-matrix.yml"))
-    matrix_obj = Path("docs/agent-support/agent-support-matrix.yml").read_text(encoding="utf-8", errors="replace")
-    # Map config agent names to matrix keys
-    verified_map = {
-        "codex": matrix_versions.get("codex_cli"),
-        "claude": matrix_versions.get("claude_code"),
-        "opencode": matrix_versions.get("opencode"),
-        "hermes": matrix_versions.get("hermes"),
-        "antigravity": matrix_versions.get("antigravity"),
-        "copilot": matrix_versions.get("copilot_cli"),
-        "openclaw": matrix_versions.get("openclaw"),
-        "cursor": matrix_versions.get("cursor"),
-        "pi": matrix_versions.get("pi"),
-        "kimi": matrix_versions.get("kimi_code"),
-    }
-
-    # Extract evidence fixtures from matrix YAML (minimal parser for `agents.*.evidence_fixtures:` lists).
-    evidence: dict[str, list[str]] = {}
-    in_agents = False
-    current_agent: str | None = None
-    in_evidence = False
-    for raw in matrix_obj.splitlines():
-        line = raw.rstrip("\n")
-        if not line.strip() or line.lstrip().startswith("#"):
-            continue
-        if line.startswith("agents:"):
-            in_agents = True
-            current_agent = None
-            in_evidence = False
-            continue
-        if not in_agents:
-            continue
-        m_agent = re.match(r"^\s{2}([a-zA-Z0-9_]+):\s*$", line)
-        if m_agent:
-            current_agent = m_agent.group(1)
-            in_evidence = False
-            continue
-        if current_agent is None:
-            continue
-        if re.match(r"^\s{4}evidence_fixtures:\s*$", line):
-            in_evidence = True
-            evidence[current_agent] = []
-            continue
-        if in_evidence:
-            m_item = re.match(r'^\s{6}-\s+"?(.*?)"?\s*$', line)
-            if m_item:
-                evidence[current_agent].append(m_item.group(1))
-                continue
-            # Exit evidence block when indentation changes back to 4 spaces (new field) or 2 (new agent).
-            if re.match(r"^\s{4}\w+:", line) or re.match(r"^\s{2}\w+:", line):
-                in_evidence = False
+    matrix_versions, evidence = _parse_matrix(Path("docs/agent-support/agent-support-matrix.yml"))
+    verified_map = {agent: matrix_versions.get(key) for agent, key in _MATRIX_KEY_BY_AGENT.items()}
 
     if args.mode == "prebump":
-        return _run_prebump(args, cfg, report_dir=report_dir, verified_map=verified_map, evidence=evidence)
+        try:
+            return _run_prebump(args, cfg, report_dir=report_dir, verified_map=verified_map, evidence=evidence)
+        finally:
+            _HTTP_CACHE.close()
 
     results: dict[str, Any] = {}
     summary_lines: list[str] = []
     any_actionable = False
 
-    for agent_name, agent_cfg in (cfg.get("agents") or {}).items():
-        cadence = (agent_cfg.get("cadence") or {})
-        if args.mode == "daily" and not cadence.get("daily", False):
-            continue
-        if args.mode == "weekly" and not cadence.get("weekly", False):
-            continue
-
-        agent_out = report_dir / agent_name
-        agent_out.mkdir(parents=True, exist_ok=True)
-
-        verified = verified_map.get(agent_name)
-        verified_semver = _extract_semver(verified or "") if verified else None
-
-        installed_cmd = agent_cfg.get("installed_version_cmd")
-        effective_installed_cmd = installed_cmd if isinstance(installed_cmd, list) else None
-        installed_rc, installed_stdout, installed_stderr = (0, "", "skipped")
-        installed: str | None = None
-        if not args.skip_update:
-            (
-                effective_installed_cmd,
-                installed_rc,
-                installed_stdout,
-                installed_stderr,
-                installed,
-            ) = _run_installed_version_cmds(agent_cfg)
-
-        upstream_sources = agent_cfg.get("upstream") or []
-        upstream: str | None = None
-        upstream_source_used: dict[str, Any] | None = None
-        upstream_source_status: str | None = None
-        upstream_errors: list[dict[str, Any]] = []
-
-        if not args.skip_update and isinstance(upstream_sources, list):
-            for s in upstream_sources:
-                if not isinstance(s, dict):
-                    continue
-                res = _fetch_upstream(s, timeout=args.timeout)
-                if res.get("ok"):
-                    upstream = res.get("version")
-                    upstream_source_used = res
-                    upstream_source_status = "current_fetch"
-                    break
-                upstream_errors.append(res)
-
-        if (
-            not args.skip_update
-            and upstream_sources
-            and upstream is None
-            and _upstream_fetch_degraded(upstream_errors)
-        ):
-            cached_upstream = _latest_cached_upstream_evidence(
-                agent_name=agent_name,
-                reports_root=report_dir.parent,
-            )
-            if cached_upstream is not None:
-                upstream = cached_upstream.get("version")
-                upstream_source_used = cached_upstream
-                upstream_source_status = "cached_prior_report"
-
-        schema_keywords = list((agent_cfg.get("risk_keywords") or {}).get("schema") or [])
-        usage_keywords = list((agent_cfg.get("risk_keywords") or {}).get("usage") or [])
-        notes_text = json.dumps(upstream_source_used, ensure_ascii=False) if upstream_source_used else ""
-
-        schema_hits = _keyword_hits(notes_text, schema_keywords)
-        usage_hits = _keyword_hits(notes_text, usage_keywords)
-
-        upstream_newer_than_verified = False
-        installed_newer_than_verified = False
-        if verified_semver and upstream:
-            cmp_uv = _compare_semver(upstream, verified_semver)
-            upstream_newer_than_verified = (cmp_uv == 1)
-        if verified_semver and installed:
-            cmp_iv = _compare_semver(installed, verified_semver)
-            installed_newer_than_verified = (cmp_iv == 1)
-
-        monitoring_failed = False
-        if not args.skip_update and upstream_sources and upstream is None:
-            monitoring_failed = not _upstream_fetch_degraded(upstream_errors)
-
-        weekly_details: dict[str, Any] | None = None
-        probe_failed = False
-        probe_failed_but_upstream_degraded = False
-        discovery_contract_failed = False
-        schema_matches_baseline: bool | None = None
-        schema_diff: dict[str, Any] | None = None
-        if args.mode == "weekly":
-            weekly_details = {}
-            local_schema_cfg = (agent_cfg.get("weekly") or {}).get("local_schema")
-            discovery_contract_cfg = (agent_cfg.get("weekly") or {}).get("discovery_path_contract")
-            if isinstance(local_schema_cfg, dict):
-                kind = local_schema_cfg.get("kind")
-                roots = list(local_schema_cfg.get("roots") or [])
-                glob = str(local_schema_cfg.get("glob") or "**/*")
-                matrix_key = {
-                    "codex": "codex_cli",
-                    "claude": "claude_code",
-                    "copilot": "copilot_cli",
-                    "antigravity": "antigravity",
-                    "opencode": "opencode",
-                    "hermes": "hermes",
-                    "openclaw": "openclaw",
-                    "cursor": "cursor",
-                    "pi": "pi",
-                    "kimi": "kimi_code",
-                }.get(agent_name)
-                baseline_paths = evidence.get(matrix_key or "", []) if matrix_key else []
-                baseline_type_keys = _baseline_type_keys_for_agent(agent_name, baseline_paths)
-
-                local_fp: dict[str, Any] | None = None
-                newest: Path | None = None
-
-                # `kimi_wire_newest` selects the same way as `jsonl_newest` but
-                # fingerprints the nested loop-event structure as well.
-                if kind in ("jsonl_newest", "kimi_wire_newest"):
-                    max_lines = int(local_schema_cfg.get("max_lines") or 2500)
-                    required_types = list(local_schema_cfg.get("required_types") or [])
-                    exclude_globs_cfg = local_schema_cfg.get("exclude_globs")
-                    exclude_globs = [g for g in exclude_globs_cfg if isinstance(g, str)] if isinstance(exclude_globs_cfg, list) else None
-                    if required_types:
-                        newest = _newest_file_with_types(
-                            roots, glob, required_types, max_lines=400, exclude_globs=exclude_globs
-                        )
-                    else:
-                        newest = _newest_file(roots, glob, exclude_globs=exclude_globs)
-                    if newest:
-                        def _fp(p: Path) -> dict[str, Any]:
-                            if kind == "kimi_wire_newest":
-                                return _kimi_wire_schema_fingerprint(p, max_lines=max_lines)
-                            return _schema_fingerprint_for_agent(agent_name, p, max_lines=max_lines)
-
-                        local_fp = _fp(newest)
-                        # Union the next few recent sessions into the same fingerprint so
-                        # one thin session cannot decide the verdict on its own.
-                        if required_types:
-                            recent = _newest_files_with_types(
-                                roots, glob, required_types, _LOCAL_SCHEMA_SAMPLE_COUNT,
-                                max_lines=400, exclude_globs=exclude_globs,
-                            )
-                        else:
-                            recent = _newest_files(
-                                roots, glob, _LOCAL_SCHEMA_SAMPLE_COUNT, exclude_globs=exclude_globs
-                            )
-                        siblings = [p for p in recent if p != newest]
-                        sampled_fps = [local_fp]
-                        for sib in siblings:
-                            try:
-                                sampled_fps.append(_fp(sib))
-                            except OSError:
-                                continue
-                        if len(sampled_fps) > 1:
-                            local_fp["type_keys"] = _merge_type_keys(sampled_fps)
-                            merged_counts: dict[str, int] = {}
-                            for fp in sampled_fps:
-                                for t, n in (fp.get("type_counts") or {}).items():
-                                    merged_counts[t] = merged_counts.get(t, 0) + int(n)
-                            local_fp["type_counts"] = dict(sorted(merged_counts.items()))
-                        local_fp["sampled_files"] = [str(fp.get("file")) for fp in sampled_fps]
-                elif kind == "antigravity_markdown_newest":
-                    max_lines = int(local_schema_cfg.get("max_lines") or 2500)
-                    newest = _newest_file(roots, glob)
-                    if newest:
-                        local_fp = _antigravity_markdown_schema_fingerprint(newest, max_lines=max_lines)
-                elif kind == "hermes_session_json_newest":
-                    max_messages = int(local_schema_cfg.get("max_messages") or 2500)
-                    newest = _newest_file(roots, glob)
-                    if newest:
-                        local_fp = _hermes_session_json_schema_fingerprint(newest, max_messages=max_messages)
-                elif kind == "hermes_latest_session":
-                    max_messages = int(local_schema_cfg.get("max_messages") or 2500)
-                    db_roots_cfg = local_schema_cfg.get("db_roots") or []
-                    db_roots = [_expand_path(p) for p in db_roots_cfg if isinstance(p, str)]
-                    for db_path in db_roots:
-                        if db_path.exists():
-                            newest = db_path
-                            local_fp = _hermes_state_db_latest_session_schema_fingerprint(db_path, max_messages=max_messages)
-                            break
-                    if local_fp is None:
-                        newest = _newest_file(roots, glob)
-                        if newest:
-                            local_fp = _hermes_session_json_schema_fingerprint(newest, max_messages=max_messages)
-                elif kind == "opencode_storage_latest_session":
-                    max_messages = int(local_schema_cfg.get("max_messages") or 250)
-                    max_parts = int(local_schema_cfg.get("max_parts") or 2500)
-                    newest = _newest_file(roots, glob)
-                    if newest:
-                        local_fp = _opencode_storage_session_tree_schema_fingerprint(
-                            newest, max_messages=max_messages, max_parts=max_parts
-                        )
-                elif kind == "opencode_latest_session":
-                    max_messages = int(local_schema_cfg.get("max_messages") or 250)
-                    max_parts = int(local_schema_cfg.get("max_parts") or 2500)
-                    db_roots = list(local_schema_cfg.get("db_roots") or ["~/.local/share/opencode/opencode.db"])
-                    db_candidates = [_expand_path(str(p)) for p in db_roots if isinstance(p, str)]
-                    db_candidates = [p for p in db_candidates if p.exists()]
-                    if db_candidates:
-                        newest = max(db_candidates, key=lambda p: p.stat().st_mtime)
-                        local_fp = _opencode_sqlite_latest_session_schema_fingerprint(
-                            newest, max_messages=max_messages, max_parts=max_parts
-                        )
-                    else:
-                        newest = _newest_file(roots, glob)
-                        if newest:
-                            local_fp = _opencode_storage_session_tree_schema_fingerprint(
-                                newest, max_messages=max_messages, max_parts=max_parts
-                            )
-                elif kind == "cursor_transcript_newest":
-                    max_lines = int(local_schema_cfg.get("max_lines") or 2500)
-                    newest = _newest_file(roots, glob)
-                    if newest:
-                        local_fp = _cursor_transcript_schema_fingerprint(newest, max_lines=max_lines)
-
-                if local_fp is not None:
-                    weekly_details["local_schema"] = local_fp
-                    if baseline_type_keys:
-                        schema_diff = _schema_diff(
-                            observed_type_keys=local_fp.get("type_keys") or {},
-                            baseline_type_keys=baseline_type_keys,
-                            observed_event_count=_observed_event_count(local_fp),
-                        )
-                        schema_matches_baseline = bool(schema_diff.get("unknown_only_is_empty"))
-                        weekly_details["baseline_schema"] = {
-                            "fixtures": [p for p in baseline_paths if isinstance(p, str) and "schema_drift" not in p],
-                            "type_keys": baseline_type_keys,
-                        }
-                        weekly_details["schema_diff"] = schema_diff
-                else:
-                    weekly_details["local_schema"] = {"error": "no_files_found", "roots": roots, "glob": glob, "kind": kind}
-
-                if isinstance(discovery_contract_cfg, dict):
-                    local_file = None
-                    if isinstance(local_fp, dict):
-                        local_file_value = local_fp.get("file")
-                        if isinstance(local_file_value, str):
-                            local_file = local_file_value
-                    contract_result = _check_discovery_path_contract(local_file, discovery_contract_cfg)
-                    weekly_details["discovery_path_contract"] = contract_result
-                    discovery_contract_failed = bool(local_file) and not bool(contract_result.get("ok"))
-
-            probes_cfg = (agent_cfg.get("weekly") or {}).get("probes") or []
-            probe_results: list[dict[str, Any]] = []
-            if isinstance(probes_cfg, list):
-                for p in probes_cfg:
-                    if not isinstance(p, dict):
-                        continue
-                    probe_results.append(_run_probe_script(p, agent_out, verbose=args.verbose))
-            if probe_results:
-                weekly_details["probes"] = probe_results
-                probe_failed = any(not pr.get("ok") for pr in probe_results)
-            probe_failed = probe_failed or discovery_contract_failed
-            if agent_name == "claude":
-                status = next((pr for pr in probe_results if pr.get("label") == "claude_status"), None)
-                usage = next((pr for pr in probe_results if pr.get("label") == "claude_usage_probe"), None)
-                status_parsed = (status or {}).get("parsed") if isinstance(status, dict) else None
-                if isinstance(status_parsed, dict):
-                    indicator = status_parsed.get("indicator")
-                    incidents = status_parsed.get("incidents_count")
-                    degraded = (isinstance(indicator, str) and indicator not in ("none", "unknown")) or (
-                        isinstance(incidents, int) and incidents > 0
-                    )
-                    usage_ok = bool((usage or {}).get("ok")) if isinstance(usage, dict) else True
-                    if degraded and not usage_ok:
-                        probe_failed_but_upstream_degraded = True
-
-        severity, recommendation = _pick_severity(
-            upstream_newer_than_verified=upstream_newer_than_verified,
-            installed_newer_than_verified=installed_newer_than_verified,
-            monitoring_failed=monitoring_failed,
-            schema_hits=schema_hits,
-            usage_hits=usage_hits,
-            probe_failed=probe_failed,
-            probe_failed_but_upstream_degraded=probe_failed_but_upstream_degraded,
-        )
-
-        sample_freshness: dict[str, Any] | None = None
-        fresh_evidence_available = False
-        fresh_evidence_source: str | None = None
-        prebump_evidence: dict[str, Any] | None = None
-        failed_prebump_evidence: dict[str, Any] | None = None
-        if args.mode == "weekly":
-            window_days_cfg = int(((agent_cfg.get("weekly") or {}).get("freshness_window_days") or 14))
-            window_seconds = window_days_cfg * 86400
-            sample_mtime_epoch: float | None = None
-            if isinstance(weekly_details, dict):
-                local_schema_obj = weekly_details.get("local_schema")
-                if isinstance(local_schema_obj, dict):
-                    fpath = local_schema_obj.get("file")
-                    if isinstance(fpath, str):
-                        try:
-                            st = os.stat(fpath)
-                            sample_mtime_epoch = float(st.st_mtime)
-                            local_schema_obj["mtime_epoch"] = sample_mtime_epoch
-                            local_schema_obj["mtime_utc"] = _epoch_to_utc_iso(sample_mtime_epoch)
-                        except OSError:
-                            pass
-            cli_path, cli_mtime = _resolve_cli_binary_mtime(effective_installed_cmd)
-            mode_context = "skip_update" if args.skip_update else "normal"
-            sample_freshness = _compute_sample_freshness(
-                sample_mtime=sample_mtime_epoch,
-                cli_binary_path=cli_path,
-                cli_binary_mtime=cli_mtime,
-                freshness_window_seconds=window_seconds,
-                now_epoch=datetime.now(timezone.utc).timestamp(),
-                mode_context=mode_context,
-                force_fresh=bool(getattr(args, "force_fresh", False)),
-            )
-            if isinstance(agent_cfg.get("prebump"), dict):
-                prebump_evidence = _latest_successful_prebump_evidence(
-                    agent_name=agent_name,
-                    reports_root=report_dir.parent,
-                    cli_binary_mtime=cli_mtime,
-                )
-                if prebump_evidence is not None:
-                    prebump_sample = prebump_evidence.get("sample_freshness")
-                    if isinstance(prebump_sample, dict):
-                        sample_freshness = dict(prebump_sample)
-                        sample_freshness["mode_context"] = "latest_prebump_report"
-                    if prebump_evidence.get("schema_matches_baseline") is True:
-                        schema_matches_baseline = True
-                        schema_diff = prebump_evidence.get("schema_diff") if isinstance(prebump_evidence.get("schema_diff"), dict) else schema_diff
-                    fresh_evidence_available = True
-                    fresh_evidence_source = "latest_prebump_report"
-                else:
-                    failed_prebump_evidence = _latest_failed_prebump_evidence(
-                        agent_name=agent_name,
-                        reports_root=report_dir.parent,
-                        cli_binary_mtime=cli_mtime,
-                    )
-
-        # If we have concrete evidence that the newest local schema matches our fixture baseline,
-        # downgrade "installed newer" to low and suggest bumping verified version.
-        if (
-            args.mode == "weekly"
-            and severity in ("medium", "low")
-            and installed_newer_than_verified
-            and schema_matches_baseline is True
-            and not probe_failed
-        ):
-            severity = "low"
-            recommendation = "bump_verified_version"
-
-        if args.mode == "weekly":
-            severity, recommendation = _apply_stale_override(
-                severity=severity,
-                recommendation=recommendation,
-                installed_newer_than_verified=installed_newer_than_verified,
-                schema_matches_baseline=schema_matches_baseline,
-                sample_freshness=sample_freshness,
-                probe_failed=probe_failed,
-            )
-
-        if args.mode == "weekly":
-            compatibility = _build_compatibility_assessment(
-                verified=verified,
-                installed=installed,
-                upstream=upstream,
-                upstream_source_status=upstream_source_status,
-                upstream_sources_configured=bool(upstream_sources),
-                upstream_errors=upstream_errors,
-                installed_newer_than_verified=installed_newer_than_verified,
-                upstream_newer_than_verified=upstream_newer_than_verified,
-                monitoring_failed=monitoring_failed,
-                schema_matches_baseline=schema_matches_baseline,
-                schema_diff=schema_diff,
-                sample_freshness=sample_freshness,
-                fresh_evidence_source=fresh_evidence_source,
-                probe_failed=probe_failed,
-                real_session_driver_configured=isinstance(agent_cfg.get("prebump"), dict),
-                failed_prebump_evidence=failed_prebump_evidence,
-            )
-            severity, recommendation = _apply_compatibility_to_legacy_status(
-                severity=severity,
-                recommendation=recommendation,
-                compatibility=compatibility,
-            )
-        else:
-            compatibility = {
-                "question": "Can current Agent Sessions code support the latest available session/storage/usage format for this agent?",
-                "verdict": "not_evaluated_daily",
-                "scope": "none",
-                "confidence": "none",
-                "latest_status": (
-                    "cached_latest"
-                    if upstream and upstream_source_status == "cached_prior_report"
-                    else (
-                        "current_fetch_known"
-                        if upstream
-                        else ("unknown_fetch_failed" if upstream_errors else "unknown_not_configured")
-                    )
-                ),
-                "verified_version": verified,
-                "installed_version": installed,
-                "latest_available_version": upstream,
-                "supports_installed": None,
-                "supports_latest": None,
-                "evidence_source": "not_collected_daily",
-                "fresh_schema_evidence": False,
-                "blockers": [],
-                "next_action": "run weekly mode for compatibility verdict",
-            }
-
-        # Daily runs should only bother the user when something looks risky/urgent.
-        # Low severity (newer version with no risk signal) is recorded silently.
-        if args.mode == "weekly":
-            actionable = severity != "none"
-        else:
-            actionable = severity in ("medium", "high")
-        any_actionable = any_actionable or actionable
-
-        results[agent_name] = {
-            "verified_version": verified,
-            "installed": {
-                "argv": effective_installed_cmd,
-                "exit_code": installed_rc,
-                "stdout": installed_stdout,
-                "stderr": installed_stderr,
-                "parsed_version": installed,
-            },
-            "upstream": {
-                "parsed_version": upstream,
-                "source_used": upstream_source_used,
-                "source_status": upstream_source_status,
-                "errors": upstream_errors[:3],
-            },
-            "diff": {
-                "upstream_newer_than_verified": upstream_newer_than_verified,
-                "installed_newer_than_verified": installed_newer_than_verified,
-            },
-            "risk": {
-                "schema_keyword_hits": schema_hits,
-                "usage_keyword_hits": usage_hits,
-                "monitoring_failed": monitoring_failed,
-            },
-            "weekly": weekly_details,
-            "evidence": {
-                "schema_matches_baseline": schema_matches_baseline,
-                "schema_diff": schema_diff,
-                "sample_freshness": sample_freshness,
-                "fresh_evidence_available": fresh_evidence_available,
-                "fresh_evidence_source": fresh_evidence_source,
-                "prebump_evidence": prebump_evidence,
-                "failed_prebump_evidence": failed_prebump_evidence,
-            },
-            "compatibility": compatibility,
-            "severity": severity,
-            "recommendation": recommendation,
-        }
-
-        if args.mode == "weekly" or severity != "none":
-            summary_lines.append(
-                _format_summary_line(
-                    agent_name=agent_name,
-                    severity=severity,
-                    verified=verified,
-                    installed=installed,
-                    upstream=upstream,
-                    recommendation=recommendation,
-                    sample_freshness=sample_freshness,
-                    compatibility=compatibility,
-                )
+    agents = [
+        (agent_name, agent_cfg)
+        for agent_name, agent_cfg in (cfg.get("agents") or {}).items()
+        if (agent_cfg.get("cadence") or {}).get(args.mode, False)
+    ]
+    # Each agent is dominated by blocking waits (version CLIs, upstream fetches, probe
+    # subprocesses), so threads overlap them. Results are still collected in config
+    # order so the report and summary read the same as a sequential run.
+    with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(agents)))) as pool:
+        futures = [
+            pool.submit(
+                _process_agent,
+                agent_name,
+                agent_cfg,
+                args=args,
+                report_dir=report_dir,
+                verified_map=verified_map,
+                evidence=evidence,
             )
+            for agent_name, agent_cfg in agents
+        ]
+        for (agent_name, _agent_cfg), future in zip(agents, futures):
+            result, summary_line, actionable = future.result()
+            results[agent_name] = result
+            if summary_line is not None:
+                summary_lines.append(summary_line)
+            any_actionable = any_actionable or actionable
 
     report = {
         "timestamp_utc": datetime.now(timezone.utc).isoformat(),
@@ -3538,7 +3965,8 @@ def main(argv: list[str]) -> int:
     }
 
     report_path = report_dir / "report.json"
-    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_report(report_path, report)
+    _HTTP_CACHE.close()
 
     # Output policy:
     # - daily: print only when actionable
@@ -6,10 +6,81 @@ This helps verify the Analytics filtering fix is working correctly.
 
 import json
 import os
+import re
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import simdjson  # type: ignore
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+# Session files are read as bytes; orjson (when installed) parses them without a
+# separate UTF-8 decode and several times faster than the stdlib.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# simdjson (when installed) parses lazily: only the values we index are turned into
+# Python objects, so a large conversation costs one structural scan.
+_SIMDJSON_PARSER = simdjson.Parser() if simdjson is not None else None
+
+def _messages_head(raw, n=3):
+    """Return (len(messages), first n messages) of a session JSON document."""
+    if _SIMDJSON_PARSER is not None:
+        messages = _SIMDJSON_PARSER.parse(raw).get('messages', [])
+        return len(messages), messages[:n]
+    messages = _loads(raw).get('messages', [])
+    return len(messages), messages[:n]
+
+# Most Codex lines are not messages; only lines that can match are parsed.
+_MESSAGE_TYPE_RE = re.compile(rb'"type"\s*:\s*"message"')
+
+def _scan_codex_file(jsonl_file, full=False):
+    """Count `message` events in one Codex JSONL file (runs in a worker process).
+
+    Stops after the third message unless `full`: three already settle the bucket.
+    Returns (message_count, message previews, error text or None).
+    """
+    message_count = 0
+    messages = []
+    try:
+        with open(jsonl_file, 'rb') as f:
+            for line in f:
+                if _MESSAGE_TYPE_RE.search(line):
+                    data = _loads(line)
+                    if data.get('type') == 'message':
+                        message_count += 1
+                        role = data.get('role', 'unknown')
+                        content = data.get('content', '')
+                        if isinstance(content, list) and content:
+                            content = content[0].get('text', '') if isinstance(content[0], dict) else str(content[0])
+                        messages.append({
+                            'role': role,
+                            'preview': content[:100] if content else ''
+                        })
+                        if message_count > 2 and not full:
+                            break
+    except Exception as e:
+        return message_count, messages, str(e)
+    return message_count, messages, None
+
+# Directories that never hold session logs; pruned from the walk.
+_SKIP_DIRS = {'.git', 'node_modules', 'backups'}
+
+def _walk_files(root, suffix):
+    """Yield files under `root` whose name ends with `suffix`, like rglob('*' + suffix)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.endswith(suffix):
+                yield Path(dirpath, name)
+
 def analyze_codex_sessions():
     """Analyze Codex CLI sessions from JSONL files."""
     codex_root = Path.home() / '.codex' / 'sessions'
@@ -19,47 +90,40 @@ def analyze_codex_sessions():
     if not codex_root.exists():
         return stats, examples
 
-    for jsonl_file in codex_root.rglob('*.jsonl'):
-        message_count = 0
-        session_info = {'file': str(jsonl_file.name), 'messages': []}
-
-        try:
-            with open(jsonl_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        if data.get('type') == 'message':
-                            message_count += 1
-                            role = data.get('role', 'unknown')
-                            content = data.get('content', '')
-                            if isinstance(content, list) and content:
-                                content = content[0].get('text', '') if isinstance(content[0], dict) else str(content[0])
-                            session_info['messages'].append({
-                                'role': role,
-                                'preview': content[:100] if content else ''
-                            })
-        except Exception as e:
-            print(f"Error reading {jsonl_file}: {e}")
-            continue
+    # Parsing is CPU-bound and files are independent, so fan them out across
+    # processes (threads would serialize on the GIL). map() keeps walk order, so
+    # examples and error lines come out exactly as a sequential pass would.
+    files = list(_walk_files(codex_root, '.jsonl'))
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(_scan_codex_file, files, chunksize=16)
+
+        for jsonl_file, (message_count, messages, error) in zip(files, results):
+            if error is None and message_count > 2 and not examples['normal']:
+                # The 'normal' example reports its exact count: read it in full.
+                message_count, messages, error = _scan_codex_file(jsonl_file, full=True)
+            if error is not None:
+                print(f"Error reading {jsonl_file}: {error}")
+                continue
+            session_info = {'file': str(jsonl_file.name), 'messages': messages}
+
+            # Categorize by message count
+            if message_count == 0:
+                stats['zero'] += 1
+                if len(examples['zero']) < 2:
+                    session_info['count'] = 0
+                    examples['zero'].append(session_info)
+            elif 1 <= message_count <= 2:
+                stats['low'] += 1
+                if len(examples['low']) < 2:
+                    session_info['count'] = message_count
+                    examples['low'].append(session_info)
+            else:
+                stats['normal'] += 1
+                if len(examples['normal']) < 1:
+                    session_info['count'] = message_count
+                    examples['normal'].append(session_info)
 
-        # Categorize by message count
-        if message_count == 0:
-            stats['zero'] += 1
-            if len(examples['zero']) < 2:
-                session_info['count'] = 0
-                examples['zero'].append(session_info)
-        elif 1 <= message_count <= 2:
-            stats['low'] += 1
-            if len(examples['low']) < 2:
-                session_info['count'] = message_count
-                examples['low'].append(session_info)
-        else:
-            stats['normal'] += 1
-            if len(examples['normal']) < 1:
-                session_info['count'] = message_count
-                examples['normal'].append(session_info)
-
-        stats['total'] += 1
+            stats['total'] += 1
 
     return stats, examples
 
@@ -81,10 +145,8 @@ def analyze_claude_sessions():
             continue
 
         try:
-            with open(conversation_file, 'r') as f:
-                data = json.load(f)
-                messages = data.get('messages', [])
-                message_count = len(messages)
+            with open(conversation_file, 'rb') as f:
+                message_count, head = _messages_head(f.read())
 
                 session_info = {
                     'file': session_dir.name,
@@ -92,7 +154,17 @@ def analyze_claude_sessions():
                     'messages': []
                 }
 
-                for msg in messages[:3]:  # Preview first 3 messages
+                if message_count == 0:
+                    bucket, slots = 'zero', 2
+                elif message_count <= 2:
+                    bucket, slots = 'low', 2
+                else:
+                    bucket, slots = 'normal', 1
+                # Previews are built only while the bucket has an open example slot;
+                # `head` already holds at most the first 3 messages.
+                wants_preview = len(examples[bucket]) < slots
+
+                for msg in head if wants_preview else ():
                     content = msg.get('content', '')
                     if isinstance(content, list) and content:
                         content = content[0].get('text', '') if isinstance(content[0], dict) else str(content[0])
@@ -15,16 +15,27 @@ It does not modify or delete any source files.
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import json
 import os
 import shutil
 import sqlite3
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Linux reflink ioctl (exposed as fcntl.FICLONE from Python 3.12; value from linux/fs.h).
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None and sys.platform.startswith("linux") else None
 
 
 @dataclass(frozen=True)
@@ -38,7 +49,7 @@ def _now_utc_slug() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%SZ")
 
 
-def _newest(paths: Iterable[Path]) -> Path | None:
+def _newest(paths: Iterable[Path | os.DirEntry[str]]) -> Path | None:
     newest: Path | None = None
     newest_mtime: float = -1.0
     for p in paths:
@@ -48,15 +59,60 @@ def _newest(paths: Iterable[Path]) -> Path | None:
             continue
         if m > newest_mtime:
             newest_mtime = m
-            newest = p
+            newest = Path(p)
     return newest
 
 
+def _scan_files(root: Path, name_pattern: str) -> Iterator[os.DirEntry[str]]:
+    """Stream files under `root` whose name matches, like `root.rglob(name_pattern)`.
+
+    Walks with os.scandir so no Path is built for non-matches, and the DirEntry's
+    cached stat means `_newest` costs one syscall per match. Symlinked directories
+    are not followed, same as rglob.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif fnmatch.fnmatchcase(entry.name, name_pattern):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
 def _safe_copy(src: Path, dst: Path) -> None:
     dst.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(src, dst)
 
 
+def _clone_or_copy2(src: str, dst: str) -> str:
+    """`shutil.copy2`, but as a copy-on-write reflink where the filesystem allows.
+
+    On btrfs/XFS the clone is O(1) regardless of size. Anywhere else (including a
+    cross-device copy) the ioctl fails and copy2 takes over; copy2 itself already
+    uses sendfile on Linux and fcopyfile on macOS, so no bytes pass through Python.
+    """
+    if _FICLONE is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _copytree(src: Path, dst: Path) -> None:
+    shutil.copytree(src, dst, copy_function=_clone_or_copy2, dirs_exist_ok=True)
+
+
 def _try_version(cmd: list[str]) -> str | None:
     try:
         proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
@@ -66,14 +122,21 @@ def _try_version(cmd: list[str]) -> str | None:
     return out if out else None
 
 
+def _first_version(cmds: list[list[str]]) -> str | None:
+    for cmd in cmds:
+        out = _try_version(cmd)
+        if out:
+            return out
+    return None
+
+
 def capture_antigravity(dest_root: Path) -> list[CaptureResult]:
     brain_root = Path.home() / ".gemini" / "antigravity-cli" / "brain"
     if not brain_root.exists():
         return []
-    candidates = [p for p in brain_root.glob("*/.system_generated/logs/transcript.jsonl") if p.is_file()]
-    if not candidates:
+    src = _newest(p for p in brain_root.glob("*/.system_generated/logs/transcript.jsonl") if p.is_file())
+    if src is None:
         return []
-    src = max(candidates, key=lambda p: p.stat().st_mtime)
     out_dir = dest_root / "antigravity"
     out_dir.mkdir(parents=True, exist_ok=True)
     dst = out_dir / f"{src.parent.parent.parent.name}.transcript.jsonl"
@@ -111,8 +174,7 @@ def capture_opencode(dest_root: Path) -> list[CaptureResult]:
     if not sessions_root.exists():
         return []
 
-    candidates = list(sessions_root.rglob("ses_*.json"))
-    src = _newest(candidates)
+    src = _newest(_scan_files(sessions_root, "ses_*.json"))
     if src is None:
         return []
 
@@ -140,27 +202,31 @@ def capture_opencode(dest_root: Path) -> list[CaptureResult]:
 
     # Copy all message records for this session.
     message_dir = storage_root / "message" / session_id
-    if message_dir.exists():
-        dst_message_dir = out_storage / "message" / session_id
-        shutil.copytree(message_dir, dst_message_dir, dirs_exist_ok=True)
+    if not message_dir.exists():
+        return results
+    dst_message_dir = out_storage / "message" / session_id
+    _copytree(message_dir, dst_message_dir)
 
     # Copy part directories for each message referenced by the message records.
-    if message_dir.exists():
-        for msg_file in sorted(message_dir.glob("msg_*.json")):
-            try:
-                msg_obj = json.loads(msg_file.read_text(encoding="utf-8"))
-            except Exception:
-                continue
-            if not isinstance(msg_obj, dict):
-                continue
-            mid = msg_obj.get("id")
-            if not isinstance(mid, str) or not mid:
-                continue
-            part_dir = storage_root / "part" / mid
-            if not part_dir.exists():
-                continue
-            dst_part_dir = out_storage / "part" / mid
-            shutil.copytree(part_dir, dst_part_dir, dirs_exist_ok=True)
+    # Copy order is irrelevant, so the listing is streamed rather than sorted.
+    with os.scandir(message_dir) as it:
+        msg_files = [e.path for e in it if e.name.startswith("msg_") and e.name.endswith(".json")]
+    for msg_file in msg_files:
+        try:
+            with open(msg_file, "rb") as fh:
+                msg_obj = json.loads(fh.read())
+        except Exception:
+            continue
+        if not isinstance(msg_obj, dict):
+            continue
+        mid = msg_obj.get("id")
+        if not isinstance(mid, str) or not mid:
+            continue
+        part_dir = storage_root / "part" / mid
+        if not part_dir.exists():
+            continue
+        dst_part_dir = out_storage / "part" / mid
+        _copytree(part_dir, dst_part_dir)
 
     return results
 
@@ -221,7 +287,7 @@ def _openclaw_root_candidates() -> list[Path]:
 
 
 def _iter_openclaw_session_files() -> list[Path]:
-    out: list[Path] = []
+    out: list[tuple[float, Path]] = []
     for candidate in _openclaw_root_candidates():
         if not candidate.exists():
             continue
@@ -231,7 +297,8 @@ def _iter_openclaw_session_files() -> list[Path]:
         for scan_root in scan_roots:
             if not scan_root.exists():
                 continue
-            for p in scan_root.rglob("*.jsonl"):
+            for entry in _scan_files(scan_root, "*.jsonl"):
+                p = Path(entry.path)
                 if p.name.endswith(".jsonl.lock"):
                     continue
                 if p.name.endswith(".trajectory.jsonl"):
@@ -253,8 +320,13 @@ def _iter_openclaw_session_files() -> list[Path]:
                     continue
                 if len(p.parts) - sessions_idx != 2:
                     continue
-                out.append(p)
-    return sorted(out, key=lambda p: p.stat().st_mtime if p.exists() else 0.0, reverse=True)
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue  # vanished mid-scan; nothing left to copy
+                out.append((mtime, p))
+    out.sort(key=itemgetter(0), reverse=True)
+    return [p for _, p in out]
 
 
 def capture_openclaw(dest_root: Path) -> list[CaptureResult]:
@@ -262,9 +334,8 @@ def capture_openclaw(dest_root: Path) -> list[CaptureResult]:
     if not candidates:
         return []
 
-    src = _newest(candidates)
-    if src is None:
-        return []
+    # Already newest-first.
+    src = candidates[0]
 
     # Preserve relative `agents/<agentId>/sessions/...` paths when possible.
     rel = Path(src.name)
@@ -302,11 +373,19 @@ def main(argv: list[str]) -> int:
     out.mkdir(parents=True, exist_ok=True)
 
     # Record local CLI versions (best-effort; these do not necessarily appear in session JSON).
-    versions = {
-        "antigravity": _try_version(["agy", "--version"]),
-        "opencode": _try_version(["opencode", "--version"]) or _try_version(["opencode", "-v"]),
-        "openclaw": _try_version(["openclaw", "--version"]) or _try_version(["openclaw", "-v"]),
+    # Each agent's commands are tried in order; the agents themselves are probed
+    # concurrently so CLI startup times overlap instead of adding up.
+    version_cmds = {
+        "antigravity": [["agy", "--version"]],
+        "opencode": [["opencode", "--version"], ["opencode", "-v"]],
+        "openclaw": [["openclaw", "--version"], ["openclaw", "-v"]],
     }
+    with ThreadPoolExecutor(max_workers=len(version_cmds)) as pool:
+        futures = {
+            name: pool.submit(_first_version, cmds)
+            for name, cmds in version_cmds.items()
+        }
+        versions = {name: future.result() for name, future in futures.items()}
     (out / "versions.json").write_text(json.dumps(versions, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
     captured: list[CaptureResult] = []
@@ -10,19 +10,41 @@ from __future__ import annotations
 
 import argparse
 import json
-import shutil
+import os
 import subprocess
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import simdjson  # type: ignore
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Shared with the other scripts rather than copied: JSON decoding and report writing
+# from agent_watch, reflink-or-copy2 from the session capture script.
+from agent_watch import _loads, _write_report  # noqa: E402
+from capture_latest_agent_sessions import _clone_or_copy2  # noqa: E402
 
 
 DEFAULT_PROMPT = "Say HELLO. Then run ls -la."
 DEFAULT_CONTINUE_PROMPT = (
     "Continue: if README.md exists, read and summarize it. Otherwise say NO_README."
 )
+# Per-file schema results, reused across runs while a file's (mtime_ns, size) holds.
+DEFAULT_SCHEMA_CACHE = Path("scripts") / "agent_captures" / ".schema_cache.json"
+# Read buffer for JSONL streams; Factory session stores run to tens of MB of small
+# events, and the default 8 KiB buffer turns that into thousands of read() calls.
+_JSONL_READ_BUFFER = 256 * 1024
 
 
 @dataclass(frozen=True)
@@ -35,8 +57,8 @@ class RunResult:
     session_id: str | None
 
 
-def _now_utc_slug() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%SZ")
+def _now_utc_slug(now: datetime | None = None) -> str:
+    return (now or datetime.now(timezone.utc)).strftime("%Y%m%d-%H%M%SZ")
 
 
 def _newest(paths: Iterable[Path]) -> Path | None:
@@ -62,24 +84,63 @@ def _try_version(cmd: list[str]) -> str | None:
     return out if out else None
 
 
-def _extract_session_id(path: Path) -> str | None:
-    session_id: str | None = None
-    text = path.read_text(encoding="utf-8", errors="replace")
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
+# simdjson (when installed) scans a line on demand: only the values asked for become
+# Python objects. Its proxies must not outlive a parse, as the parser is reused.
+_SIMDJSON_PARSER = simdjson.Parser() if simdjson is not None else None
+_JSON_OBJECT_TYPES: tuple[type, ...] = (dict, simdjson.Object) if simdjson is not None else (dict,)
+
+
+def _event_skeleton(line: bytes) -> dict[str, Any] | None:
+    """Parse one JSONL event down to what `_schema_index` reads: its keys and `type`.
+
+    Returns None for valid JSON that is not an object. Lines simdjson rejects are
+    retried through `_loads`, so parse errors keep the stdlib's message.
+    """
+    obj: Any = None
+    if _SIMDJSON_PARSER is not None:
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(obj, dict):
-            continue
-        if obj.get("type") == "completion":
-            sid = obj.get("session_id")
-            if isinstance(sid, str) and sid:
-                session_id = sid
-    return session_id
+            obj = _SIMDJSON_PARSER.parse(line)
+        except ValueError:
+            obj = None
+    if obj is None:
+        obj = _loads(line)
+    return _skeleton_of(obj)
+
+
+def _skeleton_of(obj: Any) -> dict[str, Any] | None:
+    if not isinstance(obj, _JSON_OBJECT_TYPES):
+        return None
+    # Skeletons are kept for the whole run and repeat the same few key and type
+    # strings; interning shares one copy of each, and `_schema_index`'s dict lookups
+    # on them then succeed on identity.
+    event: dict[str, Any] = dict.fromkeys(map(sys.intern, obj.keys()))
+    raw_type = obj.get("type")
+    if isinstance(raw_type, str):
+        event["type"] = sys.intern(raw_type)
+    return event
+
+
+def _completion_session_id(line: bytes | str) -> str | None:
+    try:
+        obj = _loads(line)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(obj, dict) and obj.get("type") == "completion":
+        sid = obj.get("session_id")
+        if isinstance(sid, str) and sid:
+            return sid
+    return None
+
+
+def _session_id_from_stream(stdout: str) -> str | None:
+    # stream-json ends with a single `completion` event: scan from the end, and only
+    # parse lines that can be one.
+    for line in reversed(stdout.split("\n")):
+        if '"completion"' in line:
+            sid = _completion_session_id(line)
+            if sid:
+                return sid
+    return None
 
 
 def _run_droid(argv: list[str], out_dir: Path, label: str, timeout: int) -> RunResult:
@@ -104,7 +165,7 @@ def _run_droid(argv: list[str], out_dir: Path, label: str, timeout: int) -> RunR
 
     stdout_path.write_text(stdout, encoding="utf-8")
     stderr_path.write_text(stderr, encoding="utf-8")
-    session_id = _extract_session_id(stdout_path)
+    session_id = _session_id_from_stream(stdout)
 
     return RunResult(
         label=label,
@@ -124,27 +185,30 @@ def _default_baseline_paths() -> list[Path]:
 
 
 def _load_events(paths: Iterable[Path]) -> tuple[list[dict], list[dict]]:
+    # Events are kept as key skeletons (see `_event_skeleton`): the schema index never
+    # looks at values, so whole decoded events would only pin memory.
     events: list[dict] = []
     errors: list[dict] = []
     for path in paths:
-        text = path.read_text(encoding="utf-8", errors="replace")
-        for idx, line in enumerate(text.splitlines(), start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError as exc:
-                errors.append(
-                    {
-                        "file": str(path),
-                        "line": idx,
-                        "error": str(exc),
-                    }
-                )
-                continue
-            if isinstance(obj, dict):
-                events.append(obj)
+        # Lines are streamed as raw bytes and parsed one at a time (simdjson, else
+        # orjson via `_loads`), so every bad line is reported with its line number.
+        with path.open("rb", buffering=_JSONL_READ_BUFFER) as fh:
+            for idx, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    obj = _event_skeleton(line)
+                except json.JSONDecodeError as exc:
+                    errors.append(
+                        {
+                            "file": str(path),
+                            "line": idx,
+                            "error": str(exc),
+                        }
+                    )
+                    continue
+                if obj is not None:
+                    events.append(obj)
     return events, errors
 
 
@@ -157,12 +221,88 @@ def _schema_index(events: Iterable[dict]) -> tuple[dict[str, set[str]], dict[str
         raw_type = obj.get("type")
         event_type = raw_type if isinstance(raw_type, str) and raw_type else "<missing-type>"
         type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        keys = type_keys.setdefault(event_type, set())
-        for key in obj.keys():
-            keys.add(key)
+        type_keys.setdefault(event_type, set()).update(obj.keys())
     return type_keys, type_counts
 
 
+def _file_signature(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_schema_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_schema_cache(path: Path, cache: dict[str, Any]) -> None:
+    # Best effort: a cache that cannot be written only costs the next run a re-parse.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode("utf-8"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _cache_entry_matches(entry: Any, sig: list[int]) -> bool:
+    """Whether `entry` is a well-formed cache entry for a file with stat `sig`.
+
+    A hand-edited or older-format entry counts as a miss, so the file is re-parsed
+    instead of the probe failing on a missing or mistyped field.
+    """
+    if not isinstance(entry, dict) or entry.get("sig") != sig:
+        return False
+    type_keys = entry.get("type_keys")
+    type_counts = entry.get("type_counts")
+    errors = entry.get("errors")
+    return (
+        isinstance(type_keys, dict)
+        and all(isinstance(keys, list) and all(isinstance(k, str) for k in keys) for keys in type_keys.values())
+        and isinstance(type_counts, dict)
+        and all(isinstance(n, int) for n in type_counts.values())
+        and isinstance(errors, list)
+        and all(isinstance(err, dict) for err in errors)
+    )
+
+
+def _schema_for_paths(
+    paths: Iterable[Path], cache: dict[str, Any], touched: dict[str, Any]
+) -> tuple[dict[str, set[str]], dict[str, int], list[dict]]:
+    """`_load_events` + `_schema_index` over `paths`, one file at a time.
+
+    Files whose stat signature matches their `cache` entry are not read again; their
+    keys, counts and parse errors are merged from the entry. Every entry used or
+    rebuilt is recorded in `touched`, which is what gets written back.
+    """
+    type_keys: dict[str, set[str]] = {}
+    type_counts: dict[str, int] = {}
+    errors: list[dict] = []
+    for path in paths:
+        sig = _file_signature(path)
+        cache_key = str(path.resolve())
+        entry = cache.get(cache_key)
+        if sig is None or not _cache_entry_matches(entry, sig):
+            events, file_errors = _load_events([path])
+            keys, counts = _schema_index(events)
+            entry = {"sig": sig, "type_keys": _serialize_keys(keys), "type_counts": counts, "errors": file_errors}
+        if sig is not None:
+            touched[cache_key] = entry
+        for event_type, keys in entry["type_keys"].items():
+            type_keys.setdefault(event_type, set()).update(keys)
+        for event_type, count in entry["type_counts"].items():
+            type_counts[event_type] = type_counts.get(event_type, 0) + count
+        errors.extend(dict(err, file=str(path)) for err in entry["errors"])
+    return type_keys, type_counts, errors
+
+
 def _serialize_keys(type_keys: dict[str, set[str]]) -> dict[str, list[str]]:
     return {event_type: sorted(keys) for event_type, keys in sorted(type_keys.items())}
 
@@ -170,14 +310,13 @@ def _serialize_keys(type_keys: dict[str, set[str]]) -> dict[str, list[str]]:
 def _compare_schema(
     observed: dict[str, set[str]], baseline: dict[str, set[str]]
 ) -> dict[str, dict[str, list[str]] | list[str]]:
-    observed_types = set(observed.keys())
-    baseline_types = set(baseline.keys())
-    unknown_types = sorted(observed_types - baseline_types)
-    missing_types = sorted(baseline_types - observed_types)
+    # Set operations run directly on the dict key views; no intermediate sets.
+    unknown_types = sorted(observed.keys() - baseline.keys())
+    missing_types = sorted(baseline.keys() - observed.keys())
 
     unknown_keys: dict[str, list[str]] = {}
     missing_keys: dict[str, list[str]] = {}
-    for event_type in sorted(observed_types | baseline_types):
+    for event_type in sorted(observed.keys() | baseline.keys()):
         observed_keys = observed.get(event_type, set())
         baseline_keys = baseline.get(event_type, set())
         extra = sorted(observed_keys - baseline_keys)
@@ -201,6 +340,21 @@ def _format_type_counts(type_counts: dict[str, int]) -> str:
     return ", ".join(f"{event_type}={type_counts[event_type]}" for event_type in sorted(type_counts))
 
 
+def _find_files_named(root: Path, name: str) -> Iterable[Path]:
+    # os.scandir walk; symlinked directories are not followed, same as rglob.
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == name:
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def _copy_session_store(
     session_id: str, out_dir: Path, root: Path | None = None
 ) -> Path | None:
@@ -209,13 +363,17 @@ def _copy_session_store(
     root = root or (Path.home() / ".factory" / "sessions")
     if not root.exists():
         return None
-    candidates = list(root.rglob(f"{session_id}.jsonl"))
-    src = _newest(candidates)
+    name = f"{session_id}.jsonl"
+    # Factory files a session under its cwd with "/" encoded as "-"; droid ran in ours,
+    # so probe that path before walking the whole store.
+    src = root / os.getcwd().replace(os.sep, "-") / name
+    if not src.is_file():
+        src = _newest(_find_files_named(root, name))
     if src is None:
         return None
     dst = out_dir / "session_store" / src.relative_to(root)
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    _clone_or_copy2(src, dst)
     return dst
 
 
@@ -254,9 +412,16 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help="Skip copying the on-disk session store file.",
     )
+    parser.add_argument(
+        "--no-schema-cache",
+        action="store_true",
+        help=f"Re-parse every file instead of reusing {DEFAULT_SCHEMA_CACHE}.",
+    )
     args = parser.parse_args(argv)
 
-    out_dir = Path(args.out) if args.out else Path("scripts") / "agent_captures" / _now_utc_slug() / "droid"
+    # One clock read names the output directory and stamps the report.
+    now = datetime.now(timezone.utc)
+    out_dir = Path(args.out) if args.out else Path("scripts") / "agent_captures" / _now_utc_slug(now) / "droid"
     out_dir.mkdir(parents=True, exist_ok=True)
 
     droid_version = _try_version([args.droid_bin, "--version"]) or _try_version(
@@ -304,11 +469,12 @@ def main(argv: list[str]) -> int:
     baseline_paths = [Path(p) for p in args.baseline] if args.baseline else _default_baseline_paths()
     baseline_paths = [p for p in baseline_paths if p.exists()]
 
-    observed_events, parse_errors = _load_events(stream_paths)
-    baseline_events, _ = _load_events(baseline_paths)
-
-    observed_keys, observed_counts = _schema_index(observed_events)
-    baseline_keys, _ = _schema_index(baseline_events)
+    schema_cache = {} if args.no_schema_cache else _read_schema_cache(DEFAULT_SCHEMA_CACHE)
+    touched: dict[str, Any] = {}
+    observed_keys, observed_counts, parse_errors = _schema_for_paths(stream_paths, schema_cache, touched)
+    baseline_keys, _, _ = _schema_for_paths(baseline_paths, schema_cache, touched)
+    if not args.no_schema_cache:
+        _write_schema_cache(DEFAULT_SCHEMA_CACHE, touched)
 
     diff = _compare_schema(observed_keys, baseline_keys) if baseline_keys else {}
 
@@ -317,7 +483,7 @@ def main(argv: list[str]) -> int:
         session_store_path = _copy_session_store(session_id, out_dir)
 
     report = {
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "timestamp_utc": now.isoformat(),
         "droid_version": droid_version,
         "stream_files": [str(p) for p in stream_paths],
         "baseline_files": [str(p) for p in baseline_paths],
@@ -347,7 +513,7 @@ def main(argv: list[str]) -> int:
     }
 
     report_path = out_dir / "schema_report.json"
-    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_report(report_path, report)
 
     summary = [
         f"Droid version: {droid_version or 'unknown'}",
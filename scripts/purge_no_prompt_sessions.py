@@ -22,29 +22,52 @@ from __future__ import annotations
 
 import argparse
 import json
+import mmap
 import os
 import random
 import shutil
 import sqlite3
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 def _now_utc_slug() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%SZ")
 
 
-def _read_jsonl(path: Path) -> Iterable[dict]:
+def _loads(data: bytes):
+    """Decode one JSON line, via orjson when it is installed.
+
+    Whatever orjson rejects is retried through the stdlib on the replacement-decoded
+    text, so lines with torn UTF-8 parse exactly as the old text-mode reads did.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode("utf-8", errors="replace"))
+
+
+def _read_jsonl(path: str, needle: bytes | None = None) -> Iterable[dict]:
+    """Yield the JSON objects in `path`; with `needle`, only from lines containing it."""
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as f:
+        with open(path, "rb") as f:
             for line in f:
+                if needle is not None and needle not in line:
+                    continue
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = _loads(line)
                 except json.JSONDecodeError:
                     continue
                 if isinstance(obj, dict):
@@ -53,8 +76,49 @@ def _read_jsonl(path: Path) -> Iterable[dict]:
         return
 
 
-def _has_any_assistant_codex(path: Path) -> bool:
-    for obj in _read_jsonl(path):
+# Both agents spell an assistant turn with the JSON string "assistant" (Codex as a role,
+# Claude as a type). A file without those bytes cannot have one, so the JSON scan only
+# runs on files that pass this raw-bytes check.
+_ASSISTANT_NEEDLE = b'"assistant"'
+_SCAN_CHUNK_BYTES = 1 << 20
+# Below this a plain read is cheaper than setting up and tearing down a mapping.
+_MMAP_MIN_BYTES = 64 * 1024
+# Files shorter than the needle cannot contain an assistant turn and are not opened.
+# Deliberately the provable bound rather than a measured "smallest real transcript":
+# a threshold that guessed too high would mark real conversations for purging.
+MIN_ASSISTANT_BYTES = len(_ASSISTANT_NEEDLE)
+
+
+def _file_contains(path: str, needle: bytes) -> bool:
+    overlap = len(needle) - 1
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= _MMAP_MIN_BYTES:
+                return needle in f.read()
+            # Larger transcripts are searched through a read-only map: no copy into a
+            # bytes object, and only the pages up to the first hit are touched.
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(needle) != -1
+            except (OSError, ValueError):
+                pass  # not mappable: search it in chunks instead
+            f.seek(0)
+            carry = b""
+            while chunk := f.read(_SCAN_CHUNK_BYTES):
+                # The carry catches a needle split across two chunks.
+                if needle in chunk or needle in carry + chunk[:overlap]:
+                    return True
+                carry = chunk[-overlap:] if len(chunk) >= overlap else (carry + chunk)[-overlap:]
+    except OSError:
+        return False
+    return False
+
+
+def _has_any_assistant_codex(path: str) -> bool:
+    if not _file_contains(path, _ASSISTANT_NEEDLE):
+        return False
+    for obj in _read_jsonl(path, _ASSISTANT_NEEDLE):
         t = obj.get("type")
         if t == "response_item":
             payload = obj.get("payload") or {}
@@ -67,16 +131,24 @@ def _has_any_assistant_codex(path: Path) -> bool:
     return False
 
 
-def _has_any_assistant_claude(path: Path) -> bool:
-    for obj in _read_jsonl(path):
+def _has_any_assistant_claude(path: str) -> bool:
+    if not _file_contains(path, _ASSISTANT_NEEDLE):
+        return False
+    for obj in _read_jsonl(path, _ASSISTANT_NEEDLE):
         if obj.get("type") == "assistant":
             return True
     return False
 
 
+def _has_any_assistant(row: Row) -> bool:
+    if row.source == "codex":
+        return _has_any_assistant_codex(row.path)
+    return _has_any_assistant_claude(row.path)
+
+
 def _sample(items: list, k: int) -> list:
-    if not items:
-        return []
+    # random.sample on a list picks k indices without copying the population, so
+    # this stays O(k) however many rows matched.
     if len(items) <= k:
         return items
     return random.sample(items, k)
@@ -85,53 +157,95 @@ def _sample(items: list, k: int) -> list:
 def _write_manifest(out_dir: Path, manifest: dict) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / "manifest.json"
-    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Written beside the target and renamed into place, so a reader never sees a
+    # half-written manifest. orjson (when installed) encodes the same layout natively;
+    # otherwise json.dump streams into the buffered file instead of building one string.
+    tmp = path.with_name(path.name + ".tmp")
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            data = None
+    if data is not None:
+        tmp.write_bytes(data)
+    else:
+        with tmp.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+            json.dump(manifest, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+    os.replace(tmp, path)
     return path
 
 
-@dataclass(frozen=True)
-class Row:
+# NamedTuples rather than frozen dataclasses: one is built per index row, and tuple
+# construction skips the per-field object.__setattr__ of a frozen __init__.
+class Row(NamedTuple):
     session_id: str
     source: str
-    path: Path
+    path: str  # as stored in index.db; wrapped in Path only where needed
     title: str
 
 
-@dataclass(frozen=True)
-class Candidate:
+class Candidate(NamedTuple):
     row: Row
     root_ok: bool
     no_assistant: bool
     exists: bool
+    # The root index matched row.path: a regular file spelled exactly as its resolved
+    # path, so the quarantine layout can split it without resolving.
+    indexed: bool = False
 
 
 def _index_db_path(arg: str) -> Path:
     return Path(os.path.expandvars(arg)).expanduser()
 
 
-def _query_no_prompt_rows(db_path: Path, include_blank: bool) -> list[Row]:
+# The --include-blank predicate. The partial index below repeats it verbatim so the
+# planner can prove either query's WHERE implies the index's: the exact-title query
+# becomes a SEARCH on it, while --include-blank still scans it whole (only the matching
+# rows, not the full table).
+_NO_PROMPT_OR_BLANK = "title='No prompt' OR title IS NULL OR trim(title)=''"
+
+
+def _query_no_prompt_rows(db_path: Path, include_blank: bool, create_index: bool = False) -> list[Row]:
     if not db_path.exists():
         raise SystemExit(f"index.db not found: {db_path}")
 
-    con = sqlite3.connect(str(db_path))
+    if create_index:
+        # Opt-in: the one write this script will make to AgentSessions' database.
+        con = sqlite3.connect(str(db_path))
+        try:
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS idx_session_meta_no_prompt "
+                f"ON session_meta(title) WHERE {_NO_PROMPT_OR_BLANK}"
+            )
+            con.execute("ANALYZE session_meta")
+            con.commit()
+        finally:
+            con.close()
+
+    # Opened read-only, so the scan cannot write or take a write lock next to the
+    # running app. Not immutable=1: the app's WAL may hold rows the main file lacks.
+    con = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True)
     try:
-        cur = con.cursor()
+        # Pages come through mmap, and anything SQLite spills stays in memory.
+        con.execute("PRAGMA mmap_size=268435456")
+        con.execute("PRAGMA temp_store=MEMORY")
+        con.execute("PRAGMA cache_size=-65536")
         if include_blank:
-            sql = (
-                "SELECT session_id, source, path, title "
-                "FROM session_meta "
-                "WHERE title='No prompt' OR title IS NULL OR trim(title)=''"
-            )
+            sql = f"SELECT session_id, source, path, title FROM session_meta WHERE {_NO_PROMPT_OR_BLANK}"
         else:
             sql = "SELECT session_id, source, path, title FROM session_meta WHERE title='No prompt'"
-        rows = cur.execute(sql).fetchall()
+        rows = con.execute(sql)
         out: list[Row] = []
-        for session_id, source, path, title in rows:
-            if not isinstance(session_id, str) or not isinstance(source, str) or not isinstance(path, str):
-                continue
-            if title is None:
-                title = ""
-            out.append(Row(session_id=session_id, source=source, path=Path(path), title=str(title)))
+        # Batches keep at most 1024 raw tuples alive next to the Rows built from them.
+        while batch := rows.fetchmany(1024):
+            for session_id, source, path, title in batch:
+                if not isinstance(session_id, str) or not isinstance(source, str) or not isinstance(path, str):
+                    continue
+                if title is None:
+                    title = ""
+                out.append(Row(session_id=session_id, source=source, path=path, title=str(title)))
         return out
     finally:
         con.close()
@@ -145,22 +259,61 @@ def _allowed_roots() -> dict[str, Path]:
     }
 
 
-def _is_under(path: Path, root: Path) -> bool:
+def _is_under(path: str, root: str) -> bool:
+    # `root` is already resolved. The path is resolved too (realpath, on strings to skip
+    # building Paths): a lexical abspath check would pass a symlink that escapes the
+    # root, and the quarantine move relies on the resolved path being inside it.
     try:
-        path = path.resolve()
+        real = os.path.realpath(path)
     except OSError:
         return False
+    return real == root or real.startswith(root + os.sep)
+
+
+def _entry_size(entry: os.DirEntry[str]) -> int:
     try:
-        path.relative_to(root)
-        return True
-    except ValueError:
-        return False
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return MIN_ASSISTANT_BYTES  # unknown: let the scan decide
 
 
-def _collect_candidates(rows: list[Row]) -> tuple[list[Candidate], dict[str, int]]:
-    roots = _allowed_roots()
+def _index_root(root: Path) -> dict[str, os.DirEntry[str]]:
+    """The regular files under `root` by path, from one os.scandir walk.
+
+    Symlinks are left out (and not followed): whether one stays inside the root is
+    only known after resolving it, which `_collect_candidates` does per row.
+    """
+    found: dict[str, os.DirEntry[str]] = {}
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            found[entry.path] = entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return found
+
+
+def _collect_candidates(
+    rows: list[Row], roots: dict[str, Path] | None = None
+) -> tuple[list[Candidate], dict[str, int]]:
+    if roots is None:
+        roots = _allowed_roots()
     counts: dict[str, int] = {"unknown_source": 0, "missing": 0, "outside_root": 0, "has_assistant": 0}
     candidates: list[Candidate] = []
+    to_scan: list[int] = []
+    # One walk per root replaces an exists() and a resolve() chain per row: a row whose
+    # path is in its root's index is a regular file under that root by construction.
+    root_strs = {source: str(root) for source, root in roots.items()}
+    wanted = {row.source for row in rows}
+    indexed = {source: _index_root(root) for source, root in roots.items() if source in wanted}
 
     for row in rows:
         allowed_root = roots.get(row.source)
@@ -168,30 +321,83 @@ def _collect_candidates(rows: list[Row]) -> tuple[list[Candidate], dict[str, int
             counts["unknown_source"] += 1
             continue
 
-        exists = row.path.exists()
+        entry = indexed[row.source].get(row.path)
+        if entry is not None:
+            exists = root_ok = True
+        else:
+            # Symlinks, unnormalized paths and rows outside the root take the slow path.
+            exists = os.path.exists(row.path)
+            root_ok = exists and _is_under(row.path, root_strs[row.source])
         if not exists:
             counts["missing"] += 1
             candidates.append(Candidate(row=row, root_ok=False, no_assistant=False, exists=False))
             continue
 
-        root_ok = _is_under(row.path, allowed_root)
         if not root_ok:
             counts["outside_root"] += 1
             candidates.append(Candidate(row=row, root_ok=False, no_assistant=False, exists=True))
             continue
 
-        if row.source == "codex":
-            has_assistant = _has_any_assistant_codex(row.path)
-        else:
-            has_assistant = _has_any_assistant_claude(row.path)
-
-        if has_assistant:
-            counts["has_assistant"] += 1
-        candidates.append(Candidate(row=row, root_ok=True, no_assistant=(not has_assistant), exists=True))
+        if entry is not None and _entry_size(entry) < MIN_ASSISTANT_BYTES:
+            # Too small to hold the needle; nothing to open.
+            candidates.append(Candidate(row=row, root_ok=True, no_assistant=True, exists=True, indexed=True))
+            continue
+        to_scan.append(len(candidates))
+        candidates.append(Candidate(row=row, root_ok=True, no_assistant=False, exists=True, indexed=entry is not None))
+
+    # Each scan is reads plus a find, which release the GIL, so transcripts are scanned
+    # concurrently; results land back in their rows' slots, keeping the manifest order.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        scanned = pool.map(_has_any_assistant, [candidates[i].row for i in to_scan], chunksize=64)
+        for i, has_assistant in zip(to_scan, scanned):
+            if has_assistant:
+                counts["has_assistant"] += 1
+            else:
+                candidates[i] = candidates[i]._replace(no_assistant=True)
 
     return candidates, counts
 
 
+def _quarantine_rel(c: Candidate, root: Path, root_str: str) -> Path:
+    """The row's path relative to its (resolved) source root, for the quarantine layout.
+
+    A row the root index matched is already its own resolved path and is split
+    lexically, without a realpath per file. Anything else (symlinks, `..` segments, a
+    spelling outside the root) is resolved, so it lands where its target would and
+    `rel` can never climb out of the quarantine directory.
+    """
+    if c.indexed:
+        return Path(c.row.path[len(root_str) + 1 :])
+    return Path(c.row.path).resolve().relative_to(root)
+
+
+def _same_device_sources(roots: dict[str, Path], quarantine_dir: Path, sources: set[str]) -> dict[str, bool]:
+    """Whether each source root shares a device with the quarantine (stat'ed once)."""
+    try:
+        q_dev = os.stat(quarantine_dir).st_dev
+    except OSError:
+        return dict.fromkeys(sources, False)
+    out: dict[str, bool] = {}
+    for source in sources:
+        try:
+            out[source] = os.stat(roots[source]).st_dev == q_dev
+        except OSError:
+            out[source] = False
+    return out
+
+
+def _move(src: str, dst: str, same_device: bool) -> None:
+    # On one device a move is a single rename; shutil.move is kept for cross-device
+    # roots and for renames that still fail (e.g. separate mounts of one filesystem).
+    if same_device:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.move(src, dst)
+
+
 def _default_quarantine_root() -> Path:
     return (
         Path.home()
@@ -215,6 +421,11 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help='Also match blank/null titles (in addition to exact "No prompt").',
     )
+    parser.add_argument(
+        "--create-index",
+        action="store_true",
+        help="Create (once) a partial index on session_meta.title for the match and ANALYZE it; writes to index.db.",
+    )
     parser.add_argument("--execute", action="store_true", help="Actually purge matched session files.")
     parser.add_argument(
         "--confirm",
@@ -234,21 +445,28 @@ def main(argv: list[str]) -> int:
     args = parser.parse_args(argv)
 
     db_path = _index_db_path(args.db)
-    rows = _query_no_prompt_rows(db_path, include_blank=bool(args.include_blank))
-    candidates, skipped_counts = _collect_candidates(rows)
-
-    eligible = [c for c in candidates if c.exists and c.root_ok and c.no_assistant]
-    skipped = [c for c in candidates if c not in eligible]
+    rows = _query_no_prompt_rows(db_path, include_blank=bool(args.include_blank), create_index=bool(args.create_index))
+    # Resolved once: the same roots gate the scan and anchor the quarantine layout.
+    roots = _allowed_roots()
+    candidates, skipped_counts = _collect_candidates(rows, roots)
 
+    # One pass splits the candidates and counts eligible ones per source.
+    eligible: list[Candidate] = []
+    skipped: list[Candidate] = []
     by_source: dict[str, int] = {}
-    for c in eligible:
-        by_source[c.row.source] = by_source.get(c.row.source, 0) + 1
+    for c in candidates:
+        if c.exists and c.root_ok and c.no_assistant:
+            eligible.append(c)
+            by_source[c.row.source] = by_source.get(c.row.source, 0) + 1
+        else:
+            skipped.append(c)
 
     out_dir = Path("scripts") / "probe_scan_output" / "purge_no_prompt_sessions" / _now_utc_slug()
     manifest = {
         "timestamp_utc": datetime.now(timezone.utc).isoformat(),
         "db": str(db_path),
         "include_blank": bool(args.include_blank),
+        "min_assistant_bytes": MIN_ASSISTANT_BYTES,
         "mode": "execute" if args.execute else "dry_run",
         "hard_delete": bool(args.hard_delete),
         "counts": {
@@ -259,30 +477,34 @@ def main(argv: list[str]) -> int:
             "skipped_breakdown": skipped_counts,
         },
         "samples": {
-            "eligible_paths": [str(c.row.path) for c in _sample(eligible, 20)],
-            "skipped_paths": [str(c.row.path) for c in _sample(skipped, 10)],
+            "eligible_paths": [c.row.path for c in _sample(eligible, 20)],
+            "skipped_paths": [c.row.path for c in _sample(skipped, 10)],
         },
+        # Keys in their sorted order already, so the stdlib fallback's per-record
+        # sort_keys pass finds nothing to reorder.
         "eligible": [
-            {"source": c.row.source, "session_id": c.row.session_id, "path": str(c.row.path), "title": c.row.title}
+            {"path": c.row.path, "session_id": c.row.session_id, "source": c.row.source, "title": c.row.title}
             for c in eligible
         ],
     }
     manifest_path = _write_manifest(out_dir, manifest)
 
-    print(f"DB: {db_path}")
-    print(f"Mode: {'execute' if args.execute else 'dry-run'}")
-    print(f"Match: title == 'No prompt'{' OR blank/null' if args.include_blank else ''}")
-    print(f"Eligible (two-signal, safe): {len(eligible)}  by_source={by_source}")
-    print(f"Skipped: {len(skipped)}  breakdown={skipped_counts}")
+    # The report goes out as one write rather than a print per sample path.
+    lines = [
+        f"DB: {db_path}",
+        f"Mode: {'execute' if args.execute else 'dry-run'}",
+        f"Match: title == 'No prompt'{' OR blank/null' if args.include_blank else ''}",
+        f"Eligible (two-signal, safe): {len(eligible)}  by_source={by_source}",
+        f"Skipped: {len(skipped)}  breakdown={skipped_counts}",
+    ]
     if manifest["samples"]["eligible_paths"]:
-        print("Eligible sample (up to 20):")
-        for p in manifest["samples"]["eligible_paths"]:
-            print(f"  {p}")
+        lines.append("Eligible sample (up to 20):")
+        lines.extend(f"  {p}" for p in manifest["samples"]["eligible_paths"])
     if manifest["samples"]["skipped_paths"]:
-        print("Skipped sample (up to 10):")
-        for p in manifest["samples"]["skipped_paths"]:
-            print(f"  {p}")
-    print(f"Manifest: {manifest_path}")
+        lines.append("Skipped sample (up to 10):")
+        lines.extend(f"  {p}" for p in manifest["samples"]["skipped_paths"])
+    lines.append(f"Manifest: {manifest_path}")
+    print("\n".join(lines))
 
     if not args.execute:
         print("Dry-run only. To execute, pass --execute and --confirm \"delete <N> sessions\".")
@@ -301,7 +523,7 @@ def main(argv: list[str]) -> int:
         # We intentionally require the user/agent to do a second explicit run for hard delete.
         for c in eligible:
             try:
-                c.row.path.unlink()
+                os.unlink(c.row.path)
             except OSError as exc:
                 print(f"Failed to delete {c.row.path}: {exc}", file=os.sys.stderr)
         print(f"Hard-deleted {len(eligible)} session files.")
@@ -311,14 +533,18 @@ def main(argv: list[str]) -> int:
     quarantine_dir = quarantine_root / out_dir.name
     quarantine_dir.mkdir(parents=True, exist_ok=True)
 
-    roots = _allowed_roots()
-    for c in eligible:
-        src_root = roots[c.row.source]
-        rel = c.row.path.resolve().relative_to(src_root)
-        dst = quarantine_dir / c.row.source / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
+    same_device = _same_device_sources(roots, quarantine_dir, {c.row.source for c in eligible})
+    root_strs = {source: str(root) for source, root in roots.items()}
+    moves = [
+        (c, quarantine_dir / c.row.source / _quarantine_rel(c, roots[c.row.source], root_strs[c.row.source]))
+        for c in eligible
+    ]
+    # Sessions cluster in a few day/project directories: create each one once.
+    for parent in dict.fromkeys(dst.parent for _, dst in moves):
+        parent.mkdir(parents=True, exist_ok=True)
+    for c, dst in moves:
         try:
-            shutil.move(str(c.row.path), str(dst))
+            _move(c.row.path, str(dst), same_device[c.row.source])
         except OSError as exc:
             print(f"Failed to move {c.row.path}: {exc}", file=os.sys.stderr)
     print(f"Moved {len(eligible)} session files to quarantine: {quarantine_dir}")
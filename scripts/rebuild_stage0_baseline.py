@@ -57,12 +57,8 @@ TARGET_FIXTURE = {
     "copilot": "copilot/small.jsonl",
 }
 
-# matrix key -> evidence_fixtures, mirroring agent_watch's own mapping.
-MATRIX_KEY = {
-    "codex": "codex_cli", "claude": "claude_code", "copilot": "copilot_cli",
-    "antigravity": "antigravity", "opencode": "opencode", "hermes": "hermes",
-    "openclaw": "openclaw", "cursor": "cursor", "pi": "pi", "kimi": "kimi_code",
-}
+# agent -> matrix key for evidence_fixtures; agent_watch's own mapping.
+MATRIX_KEY = agent_watch._MATRIX_KEY_BY_AGENT
 
 
 def _load_config(agent: str) -> dict:
@@ -74,22 +70,9 @@ def _load_config(agent: str) -> dict:
 
 
 def _baseline_paths(agent: str) -> list[str]:
-    """evidence_fixtures for the agent, read without a yaml dependency."""
-    key = MATRIX_KEY.get(agent, agent)
-    text = MATRIX.read_text(encoding="utf-8")
-    out: list[str] = []
-    in_agent = False
-    for line in text.splitlines():
-        if line.startswith(f"  {key}:"):
-            in_agent = True
-            continue
-        if in_agent:
-            if line and not line.startswith("    ") and not line.startswith("      "):
-                break
-            stripped = line.strip()
-            if stripped.startswith('- "Resources/'):
-                out.append(stripped[3:].strip('"'))
-    return out
+    """evidence_fixtures for the agent, via agent_watch's own matrix reader."""
+    _versions, evidence = agent_watch._parse_matrix(MATRIX)
+    return evidence.get(MATRIX_KEY.get(agent, agent), [])
 
 
 def _all_sessions(agent: str, cfg: dict, limit: int | None) -> list[Path]:
@@ -196,7 +179,7 @@ def main(argv: list[str]) -> int:
                 if not remaining:
                     break
                 try:
-                    rec = json.loads(raw.strip())
+                    rec = agent_watch._loads(raw)
                 except json.JSONDecodeError:
                     continue
                 if not isinstance(rec, dict):
@@ -10,14 +10,23 @@ Outputs:
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import functools
+import heapq
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
@@ -37,9 +46,18 @@ DEFAULT_MAX_FILES_PER_AGENT = 200
 MAX_TEXT_EVENT_LEN = 2000
 MAX_EXAMPLE_CHARS = 800
 
+# Compiled once: these run for every field name, tool name and candidate text line.
+_RE_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_RE_NON_TOKEN = re.compile(r"[^a-z0-9_]+")
+_RE_UNDERSCORES = re.compile(r"_+")
+_RE_TOOL_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_./-]{1,80}$")
+# Keys whose array value holds the items of a whole-file JSON session, in lookup order.
+_RAW_ITEM_ARRAY_PATTERNS = tuple(
+    re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[', re.MULTILINE) for key in ("messages", "history", "items")
+)
 
-@dataclass
-class Example:
+
+class Example(NamedTuple):
     agent_family: str
     source_file: str
     event_index: Optional[int]
@@ -88,16 +106,20 @@ def json_safe(value: Any) -> Any:
     return str(value)
 
 
+# Field and tool names come from a small recurring vocabulary, so normalization is
+# memoized: repeats cost one cache lookup instead of three regex passes. Results are
+# interned, so every group key and fields_seen entry shares one string per name.
+@functools.lru_cache(maxsize=4096)
 def normalize_token(value: str) -> str:
     s = value.strip()
     if not s:
         return ""
-    s = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s)
+    s = _RE_CAMEL.sub(r"\1_\2", s)
     s = s.replace("-", "_").replace(" ", "_").replace(".", "_").replace("/", "_")
     s = s.lower()
-    s = re.sub(r"[^a-z0-9_]+", "", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
+    s = _RE_NON_TOKEN.sub("", s)
+    s = _RE_UNDERSCORES.sub("_", s).strip("_")
+    return sys.intern(s)
 
 
 def normalize_tool_name(name: Optional[str]) -> str:
@@ -107,12 +129,17 @@ def normalize_tool_name(name: Optional[str]) -> str:
     return norm or "unknown"
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_field_name(name: str) -> str:
     norm = normalize_token(name)
-    return norm or name.strip().lower()
+    return norm or sys.intern(name.strip().lower())
 
 
-def parse_payload(payload: Any) -> Tuple[Optional[str], Optional[Any], Optional[str], List[str]]:
+def parse_payload(
+    payload: Any, want_fields: bool = True
+) -> Tuple[Optional[str], Optional[Any], Optional[str], List[str]]:
+    # want_fields=False skips listing the payload's keys for callers that already
+    # have the block's fields; the parse itself is still needed for parse_success.
     raw_payload: Optional[str] = None
     parsed_payload: Optional[Any] = None
     parse_error: Optional[str] = None
@@ -122,11 +149,11 @@ def parse_payload(payload: Any) -> Tuple[Optional[str], Optional[Any], Optional[
         return None, None, None, []
 
     if isinstance(payload, (dict, list)):
-        raw_payload = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        # raw_payload is left for payload_text(): only events kept as examples need it.
         parsed_payload = payload
-        if isinstance(payload, dict):
+        if want_fields and isinstance(payload, dict):
             fields = list(payload.keys())
-        return raw_payload, parsed_payload, None, fields
+        return None, parsed_payload, None, fields
 
     if isinstance(payload, str):
         raw_payload = payload
@@ -134,7 +161,7 @@ def parse_payload(payload: Any) -> Tuple[Optional[str], Optional[Any], Optional[
         if candidate.startswith("{") or candidate.startswith("["):
             try:
                 parsed_payload = json.loads(candidate)
-                if isinstance(parsed_payload, dict):
+                if want_fields and isinstance(parsed_payload, dict):
                     fields = list(parsed_payload.keys())
             except Exception as exc:
                 parse_error = f"json_decode_error: {exc}"
@@ -144,6 +171,13 @@ def parse_payload(payload: Any) -> Tuple[Optional[str], Optional[Any], Optional[
     return raw_payload, None, None, []
 
 
+def payload_text(raw_payload: Optional[str], parsed_payload: Any) -> Optional[str]:
+    """The raw_payload an example shows: structured payloads are serialized on demand."""
+    if raw_payload is None and isinstance(parsed_payload, (dict, list)):
+        return json.dumps(parsed_payload, ensure_ascii=False, sort_keys=True)
+    return raw_payload
+
+
 def infer_direction_from_payload(parsed_payload: Any) -> str:
     if not isinstance(parsed_payload, dict):
         return "unknown"
@@ -180,72 +214,91 @@ def infer_direction_from_payload(parsed_payload: Any) -> str:
     return "unknown"
 
 
+# Structural characters for the bracket walkers below. Runs of anything else cannot
+# change their state, so the walkers jump between matches instead of visiting every
+# character in Python.
+_RE_BRACE_STRUCT = re.compile(r'[{}"]')
+_RE_ARRAY_STRUCT = re.compile(r'["\[\],]')
+_RE_STRING_STRUCT = re.compile(r'["\\]')
+_RE_NON_SPACE = re.compile(r"\S")
+
+
+def _skip_string(text: str, pos: int) -> int:
+    """Index just past the string whose body starts at `pos`, or -1 if it never closes."""
+    while True:
+        match = _RE_STRING_STRUCT.search(text, pos)
+        if match is None:
+            return -1
+        if match.group() == "\\":
+            pos = match.start() + 2  # the escaped character, whatever it is
+            continue
+        return match.end()
+
+
 def extract_balanced_braces(text: str, start: int) -> Optional[str]:
-    in_string = False
-    escape = False
     depth = 0
-    for i in range(start, len(text)):
+    pos = start
+    while True:
+        match = _RE_BRACE_STRUCT.search(text, pos)
+        if match is None:
+            return None
+        i = match.start()
         ch = text[i]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
         if ch == '"':
-            in_string = True
+            pos = _skip_string(text, i + 1)
+            if pos < 0:
+                return None
             continue
+        pos = i + 1
         if ch == "{":
             depth += 1
-        elif ch == "}":
+        else:
             depth -= 1
             if depth == 0:
                 return text[start : i + 1]
-    return None
 
 
 def split_json_array_items(text: str, start_index: int) -> List[str]:
     items: List[str] = []
-    in_string = False
-    escape = False
     depth = 0
     item_start: Optional[int] = None
+    pos = start_index
 
-    for i in range(start_index, len(text)):
+    while True:
+        # Between items the next non-space character opens one; inside an item (or
+        # outside the array) only quotes, brackets and commas matter.
+        if depth == 1 and item_start is None:
+            match = _RE_NON_SPACE.search(text, pos)
+        else:
+            match = _RE_ARRAY_STRUCT.search(text, pos)
+        if match is None:
+            return items
+        i = match.start()
         ch = text[i]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
         if ch == '"':
-            in_string = True
+            pos = _skip_string(text, i + 1)
+            if pos < 0:
+                return items
             continue
+        pos = i + 1
         if ch == "[":
             depth += 1
-            if depth == 1:
-                continue
+            continue
         if ch == "]":
             if depth == 1 and item_start is not None:
                 items.append(text[item_start:i].strip())
                 return items
             depth -= 1
+            if depth == 1 and item_start is None:
+                item_start = i
+            continue
         if depth == 1:
             if ch == ",":
                 if item_start is not None:
                     items.append(text[item_start:i].strip())
                     item_start = None
-            elif not ch.isspace():
-                if item_start is None:
-                    item_start = i
-        elif depth > 1:
-            continue
-    return items
+            elif item_start is None:
+                item_start = i
 
 
 def extract_raw_items_from_json(text: str) -> List[str]:
@@ -255,8 +308,7 @@ def extract_raw_items_from_json(text: str) -> List[str]:
         if start >= 0:
             return split_json_array_items(text, start)
         return []
-    for key in ["messages", "history", "items"]:
-        pattern = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[', re.MULTILINE)
+    for pattern in _RAW_ITEM_ARRAY_PATTERNS:
         match = pattern.search(text)
         if not match:
             continue
@@ -266,6 +318,21 @@ def extract_raw_items_from_json(text: str) -> List[str]:
     return []
 
 
+def _loads(raw: str) -> Any:
+    """json.loads via orjson when it is installed.
+
+    orjson is stricter (no NaN/Infinity, no lone surrogates), so whatever it rejects
+    is retried through the stdlib and parses as before. One difference remains: an
+    integer past 64 bits comes back as a float, which only a catalog example shows.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def iter_jsonl_with_raw(path: Path) -> Iterable[Tuple[int, Dict[str, Any], str]]:
     try:
         with path.open("r", encoding="utf-8", errors="replace") as handle:
@@ -274,7 +341,7 @@ def iter_jsonl_with_raw(path: Path) -> Iterable[Tuple[int, Dict[str, Any], str]]
                 if not raw.strip():
                     continue
                 try:
-                    obj = json.loads(raw)
+                    obj = _loads(raw)
                 except Exception:
                     continue
                 if isinstance(obj, dict):
@@ -293,7 +360,7 @@ def iter_json_items_with_raw(path: Path) -> Iterable[Tuple[int, Dict[str, Any],
         if not raw.strip():
             continue
         try:
-            obj = json.loads(raw)
+            obj = _loads(raw)
         except Exception:
             continue
         if isinstance(obj, dict):
@@ -337,32 +404,32 @@ def text_candidates(obj: Dict[str, Any]) -> List[Tuple[str, str]]:
     return out
 
 
+def looks_like_tool_name(s: str) -> Optional[str]:
+    raw = s.strip().strip("<>").strip()
+    if not raw:
+        return None
+    if _RE_TOOL_NAME.match(raw):
+        return raw
+    return None
+
+
 def extract_text_tool_blocks(text: str, full_path: str) -> List[Tuple[str, str, str]]:
     results: List[Tuple[str, str, str]] = []
-    if not text.strip():
+    # Every pattern below needs a JSON object; most message text has no brace at all.
+    if "{" not in text or not text.strip():
         return results
     lines = text.splitlines()
     if not lines:
         return results
 
-    # Build line offsets to recover exact substrings.
-    offsets: List[int] = []
-    pos = 0
-    for line in lines:
-        offsets.append(pos)
-        pos += len(line) + 1
-
-    def looks_like_tool_name(s: str) -> Optional[str]:
-        raw = s.strip().strip("<>").strip()
-        if not raw:
-            return None
-        if re.match(r"^[A-Za-z][A-Za-z0-9_./-]{1,80}$", raw):
-            return raw
-        return None
-
     seen: set[Tuple[str, str]] = set()
 
+    # Offsets of line starts are tracked as the lines are walked (one newline per
+    # line), rather than precomputed for every line of the text.
+    line_start = 0
     for idx, line in enumerate(lines):
+        offset = line_start
+        line_start += len(line) + 1
         stripped = line.strip()
         if not stripped:
             continue
@@ -372,8 +439,7 @@ def extract_text_tool_blocks(text: str, full_path: str) -> List[Tuple[str, str,
             prefix = stripped[:brace_index].strip().strip(":")
             tool_name = looks_like_tool_name(prefix.split()[0]) if prefix else None
             if tool_name:
-                line_start = offsets[idx]
-                full_index = line_start + line.find("{")
+                full_index = offset + line.find("{")
                 raw_json = extract_balanced_braces(text, full_index)
                 if raw_json:
                     shape = "text:line-prefix+json"
@@ -388,13 +454,15 @@ def extract_text_tool_blocks(text: str, full_path: str) -> List[Tuple[str, str,
         tool_name = looks_like_tool_name(stripped)
         if tool_name and idx + 1 < len(lines):
             # Look ahead for a JSON block starting on the next non-empty line.
+            next_start = line_start
             for j in range(idx + 1, len(lines)):
+                next_offset = next_start
+                next_start += len(lines[j]) + 1
                 if not lines[j].strip():
                     continue
                 if "{" not in lines[j]:
                     break
-                line_start = offsets[j]
-                full_index = line_start + lines[j].find("{")
+                full_index = next_offset + lines[j].find("{")
                 raw_json = extract_balanced_braces(text, full_index)
                 if raw_json:
                     shape = "text:line+json_block"
@@ -437,7 +505,10 @@ def record_fields(group: GroupStats, fields: Iterable[str]) -> None:
             continue
         norm = normalize_field_name(field_name)
         group.fields_seen.add(norm)
-        group.field_variants.setdefault(norm, set()).add(field_name)
+        variants = group.field_variants.setdefault(norm, set())
+        if field_name not in variants:
+            # Each parsed line brings its own copy of every key; keep one.
+            variants.add(sys.intern(field_name))
 
 
 def add_tool_block(
@@ -474,10 +545,22 @@ def add_tool_block(
     group.count += 1
     if parsed_payload is not None:
         group.parse_success += 1
-    if tool_name:
-        group.tool_name_variants.add(tool_name)
+    if tool_name and tool_name not in group.tool_name_variants:
+        group.tool_name_variants.add(sys.intern(tool_name))
     record_fields(group, fields)
 
+    shape = shapes.get(shape_signature)
+    if shape is None:
+        shape = ShapeStats(shape_signature=shape_signature)
+        shapes[shape_signature] = shape
+    shape.count += 1
+    shape.agents.add(agent)
+    shape.directions[direction] = shape.directions.get(direction, 0) + 1
+
+    # Once both example lists are full (nearly every event on a large scan), the
+    # example -- and the payload serialization it needs -- is never built.
+    if len(group.examples) >= max_examples_per_group and len(shape.examples) >= max_examples_per_shape:
+        return
     example = Example(
         agent_family=agent,
         source_file=source_file,
@@ -487,19 +570,11 @@ def add_tool_block(
         shape_signature=shape_signature,
         field_path=field_path,
         raw_event=raw_event,
-        raw_payload=raw_payload,
+        raw_payload=payload_text(raw_payload, parsed_payload),
         parsed_payload=parsed_payload,
         parse_error=parse_error,
     )
     add_group_example(group, example, max_examples_per_group)
-
-    shape = shapes.get(shape_signature)
-    if shape is None:
-        shape = ShapeStats(shape_signature=shape_signature)
-        shapes[shape_signature] = shape
-    shape.count += 1
-    shape.agents.add(agent)
-    shape.directions[direction] = shape.directions.get(direction, 0) + 1
     add_shape_example(shape, example, max_examples_per_shape)
 
 
@@ -702,6 +777,37 @@ def opencode_tool_blocks(obj: Dict[str, Any], raw_event: str) -> List[Tuple[str,
     return blocks
 
 
+def rglob_paths(root: Path, *patterns: str) -> List[Path]:
+    """Like root.rglob(pattern) for any of `patterns`, in the same order.
+
+    pathlib (before 3.13) lists every directory twice -- once to find subdirectories,
+    once to match names. This lists each once: a directory's matches come first, then
+    its subdirectories' (not following symlinks), exactly as rglob yields them.
+    """
+    out: List[Path] = []
+
+    def walk(directory: Path) -> None:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs: List[str] = []
+        for entry in entries:
+            if any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in patterns):
+                out.append(directory / entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+            except OSError:
+                continue
+        for name in subdirs:
+            walk(directory / name)
+
+    walk(root)
+    return out
+
+
 def discover_codex_sessions() -> List[Path]:
     if os.getenv("CODEX_HOME"):
         root = Path(os.getenv("CODEX_HOME", "")).expanduser() / "sessions"
@@ -709,7 +815,7 @@ def discover_codex_sessions() -> List[Path]:
         root = Path.home() / ".codex" / "sessions"
     if not root.exists():
         return []
-    return [p for p in root.rglob("*.jsonl") if p.name.startswith("rollout-")]
+    return [p for p in rglob_paths(root, "*.jsonl") if p.name.startswith("rollout-")]
 
 
 def discover_claude_sessions() -> List[Path]:
@@ -718,10 +824,11 @@ def discover_claude_sessions() -> List[Path]:
         return []
     projects = root / "projects"
     scan_root = projects if projects.exists() else root
-    out: List[Path] = []
-    for ext in ("*.jsonl", "*.ndjson"):
-        out.extend(scan_root.rglob(ext))
-    return out
+    # One walk for both extensions; all .jsonl files still come before any .ndjson.
+    found = rglob_paths(scan_root, "*.jsonl", "*.ndjson")
+    return [p for p in found if fnmatch.fnmatchcase(p.name, "*.jsonl")] + [
+        p for p in found if not fnmatch.fnmatchcase(p.name, "*.jsonl")
+    ]
 
 
 def discover_copilot_sessions() -> List[Path]:
@@ -742,7 +849,7 @@ def discover_opencode_sessions() -> List[Path]:
     root = Path.home() / ".local" / "share" / "opencode" / "storage" / "session"
     if not root.exists():
         return []
-    return [p for p in root.rglob("ses_*.json")]
+    return rglob_paths(root, "ses_*.json")
 
 
 def discover_openclaw_sessions() -> List[Path]:
@@ -761,7 +868,7 @@ def discover_openclaw_sessions() -> List[Path]:
         scan_root = agents_root if agents_root.exists() else root
         if not scan_root.exists():
             continue
-        for p in scan_root.rglob("*.jsonl"):
+        for p in rglob_paths(scan_root, "*.jsonl"):
             if p.name.endswith(".jsonl.lock") or ".jsonl.deleted." in p.name:
                 continue
             if "sessions" not in p.parts:
@@ -804,10 +911,10 @@ def discover_droid_sessions() -> List[Path]:
     out: List[Path] = []
     sessions_root = Path.home() / ".factory" / "sessions"
     if sessions_root.exists():
-        out.extend(sessions_root.rglob("*.jsonl"))
+        out.extend(rglob_paths(sessions_root, "*.jsonl"))
     projects_root = Path.home() / ".factory" / "projects"
     if projects_root.exists():
-        for path in projects_root.rglob("*.jsonl"):
+        for path in rglob_paths(projects_root, "*.jsonl"):
             if droid_looks_like_stream_json(path):
                 out.append(path)
     return out
@@ -823,15 +930,16 @@ def limit_by_mtime(paths: List[Path], max_files: int) -> List[Path]:
         except OSError:
             mtime = 0.0
         with_mtime.append((mtime, path))
-    with_mtime.sort(key=lambda item: item[0], reverse=True)
-    return [p for _, p in with_mtime[:max_files]]
+    # nlargest keeps the newest max_files in the order a stable descending sort would.
+    newest = heapq.nlargest(max_files, with_mtime, key=lambda item: item[0])
+    return [p for _, p in newest]
 
 
 def discover_fixture_sessions(fixtures_root: Path) -> Dict[str, List[Path]]:
     out: Dict[str, List[Path]] = {}
     if not fixtures_root.exists():
         return out
-    for path in fixtures_root.rglob("*"):
+    for path in rglob_paths(fixtures_root, "*"):
         if path.suffix.lower() not in {".jsonl", ".ndjson", ".json", ".md"}:
             continue
         parts = list(path.parts)
@@ -862,6 +970,7 @@ def scan_jsonl_file(
     max_examples_per_group: int,
     max_examples_per_shape: int,
 ) -> None:
+    source_file = str(path)
     for idx, obj, raw in iter_jsonl_with_raw(path):
         blocks: List[Tuple[str, str, Any, str, List[str], Optional[str]]] = []
         if agent == "codex":
@@ -876,7 +985,7 @@ def scan_jsonl_file(
             blocks = openclaw_tool_blocks(obj, raw)
 
         for direction, tool_name, payload, shape, fields, field_path in blocks:
-            raw_payload, parsed_payload, parse_error, payload_fields = parse_payload(payload)
+            raw_payload, parsed_payload, parse_error, payload_fields = parse_payload(payload, want_fields=not fields)
             use_fields = fields or payload_fields
             add_tool_block(
                 groups=groups,
@@ -891,7 +1000,7 @@ def scan_jsonl_file(
                 parse_error=parse_error,
                 field_path=field_path,
                 fields=use_fields,
-                source_file=str(path),
+                source_file=source_file,
                 event_index=idx,
                 max_examples_per_group=max_examples_per_group,
                 max_examples_per_shape=max_examples_per_shape,
@@ -917,7 +1026,7 @@ def scan_jsonl_file(
                     parse_error=parse_error,
                     field_path=field_path,
                     fields=payload_fields,
-                    source_file=str(path),
+                    source_file=source_file,
                     event_index=idx,
                     max_examples_per_group=max_examples_per_group,
                     max_examples_per_shape=max_examples_per_shape,
@@ -939,14 +1048,14 @@ def scan_json_file(
         except OSError:
             return
         try:
-            obj = json.loads(raw)
+            obj = _loads(raw)
         except Exception:
             return
         if not isinstance(obj, dict):
             return
         blocks = opencode_tool_blocks(obj, raw)
         for direction, tool_name, payload, shape, fields, field_path in blocks:
-            raw_payload, parsed_payload, parse_error, payload_fields = parse_payload(payload)
+            raw_payload, parsed_payload, parse_error, payload_fields = parse_payload(payload, want_fields=not fields)
             use_fields = fields or payload_fields
             add_tool_block(
                 groups=groups,
@@ -1018,7 +1127,7 @@ def discover_opencode_part_files(session_paths: List[Path]) -> List[Path]:
             continue
         if not part_root.exists():
             continue
-        for part_file in part_root.rglob("*.json"):
+        for part_file in rglob_paths(part_root, "*.json"):
             key = str(part_file)
             if key in seen:
                 continue
@@ -1027,6 +1136,73 @@ def discover_opencode_part_files(session_paths: List[Path]) -> List[Path]:
     return parts
 
 
+def scan_file(
+    agent: str,
+    path: Path,
+    max_examples_per_group: int,
+    max_examples_per_shape: int,
+) -> Tuple[Dict[Tuple[str, str, str, str], GroupStats], Dict[str, ShapeStats]]:
+    """Scan one file into fresh group/shape tables (runs in a worker process)."""
+    groups: Dict[Tuple[str, str, str, str], GroupStats] = {}
+    shapes: Dict[str, ShapeStats] = {}
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        scan = scan_jsonl_file
+    elif suffix == ".json":
+        scan = scan_json_file
+    elif suffix == ".md":
+        scan = scan_markdown_file
+    else:
+        return groups, shapes
+    scan(
+        agent,
+        path,
+        groups,
+        shapes,
+        max_examples_per_group=max_examples_per_group,
+        max_examples_per_shape=max_examples_per_shape,
+    )
+    return groups, shapes
+
+
+def merge_scan(
+    groups: Dict[Tuple[str, str, str, str], GroupStats],
+    shapes: Dict[str, ShapeStats],
+    file_groups: Dict[Tuple[str, str, str, str], GroupStats],
+    file_shapes: Dict[str, ShapeStats],
+    max_examples_per_group: int,
+    max_examples_per_shape: int,
+) -> None:
+    """Fold one file's tables into the totals.
+
+    Files are merged in scan order and each file's examples are its first ones that
+    fit, so topping up to the caps keeps exactly the examples a sequential scan would.
+    """
+    for key, fg in file_groups.items():
+        group = groups.get(key)
+        if group is None:
+            groups[key] = fg
+            continue
+        group.count += fg.count
+        group.parse_success += fg.parse_success
+        group.tool_name_variants |= fg.tool_name_variants
+        group.fields_seen |= fg.fields_seen
+        for name, variants in fg.field_variants.items():
+            group.field_variants.setdefault(name, set()).update(variants)
+        group.examples.extend(fg.examples[: max(0, max_examples_per_group - len(group.examples))])
+
+    for signature, fs in file_shapes.items():
+        shape = shapes.get(signature)
+        if shape is None:
+            shapes[signature] = fs
+            continue
+        shape.count += fs.count
+        shape.agents |= fs.agents
+        for direction, n in fs.directions.items():
+            shape.directions[direction] = shape.directions.get(direction, 0) + n
+        shape.examples.extend(fs.examples[: max(0, max_examples_per_shape - len(shape.examples))])
+
+
 def build_catalog(
     groups: Dict[Tuple[str, str, str, str], GroupStats],
     shapes: Dict[str, ShapeStats],
@@ -1246,6 +1422,7 @@ def main() -> int:
     ap.add_argument("--max-files-per-agent", type=int, default=DEFAULT_MAX_FILES_PER_AGENT)
     ap.add_argument("--max-examples-per-group", type=int, default=DEFAULT_MAX_EXAMPLES_PER_GROUP)
     ap.add_argument("--max-examples-per-shape", type=int, default=DEFAULT_MAX_EXAMPLES_PER_SHAPE)
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes (1 = scan in-process)")
     args = ap.parse_args()
 
     ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -1270,6 +1447,7 @@ def main() -> int:
         for agent, paths in fixtures.items():
             sources.setdefault(agent, []).extend(paths)
 
+    tasks: List[Tuple[str, Path]] = []
     for agent, paths in sources.items():
         if args.max_files_per_agent > 0:
             paths = limit_by_mtime(paths, args.max_files_per_agent)
@@ -1277,36 +1455,9 @@ def main() -> int:
         scan_roots[agent] = sorted({str(p.parent) for p in paths})
         files_scanned[agent] = 0
         for path in paths:
-            if path.suffix.lower() in {".jsonl", ".ndjson"}:
-                files_scanned[agent] += 1
-                scan_jsonl_file(
-                    agent,
-                    path,
-                    groups,
-                    shapes,
-                    max_examples_per_group=args.max_examples_per_group,
-                    max_examples_per_shape=args.max_examples_per_shape,
-                )
-            elif path.suffix.lower() == ".json":
+            if path.suffix.lower() in {".jsonl", ".ndjson", ".json", ".md"}:
                 files_scanned[agent] += 1
-                scan_json_file(
-                    agent,
-                    path,
-                    groups,
-                    shapes,
-                    max_examples_per_group=args.max_examples_per_group,
-                    max_examples_per_shape=args.max_examples_per_shape,
-                )
-            elif path.suffix.lower() == ".md":
-                files_scanned[agent] += 1
-                scan_markdown_file(
-                    agent,
-                    path,
-                    groups,
-                    shapes,
-                    max_examples_per_group=args.max_examples_per_group,
-                    max_examples_per_shape=args.max_examples_per_shape,
-                )
+                tasks.append((agent, path))
 
     # OpenCode tool data lives in part files under storage/part.
     opencode_sessions = sources.get("opencode", [])
@@ -1317,15 +1468,22 @@ def main() -> int:
         scan_roots.setdefault("opencode", [])
         scan_roots["opencode"].extend(sorted({str(p.parent) for p in opencode_parts}))
         files_scanned["opencode"] = files_scanned.get("opencode", 0) + len(opencode_parts)
-        for part_path in opencode_parts:
-            scan_json_file(
-                "opencode_part",
-                part_path,
-                groups,
-                shapes,
-                max_examples_per_group=args.max_examples_per_group,
-                max_examples_per_shape=args.max_examples_per_shape,
-            )
+        tasks.extend(("opencode_part", part_path) for part_path in opencode_parts)
+
+    # Files are independent and parsing is CPU-bound, so they are scanned across
+    # processes (threads would serialize on the GIL). map() returns results in task
+    # order, and merging in that order reproduces a sequential scan exactly.
+    agents = [agent for agent, _ in tasks]
+    paths = [path for _, path in tasks]
+    max_g = [args.max_examples_per_group] * len(tasks)
+    max_s = [args.max_examples_per_shape] * len(tasks)
+    if args.jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            for file_groups, file_shapes in pool.map(scan_file, agents, paths, max_g, max_s, chunksize=8):
+                merge_scan(groups, shapes, file_groups, file_shapes, args.max_examples_per_group, args.max_examples_per_shape)
+    else:
+        for file_groups, file_shapes in map(scan_file, agents, paths, max_g, max_s):
+            merge_scan(groups, shapes, file_groups, file_shapes, args.max_examples_per_group, args.max_examples_per_shape)
 
     catalog = build_catalog(groups, shapes, scan_roots, files_scanned)
     Path(args.output_catalog).write_text(render_json(catalog), encoding="utf-8")
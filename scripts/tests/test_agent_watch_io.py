@@ -0,0 +1,238 @@
+# scripts/tests/test_agent_watch_io.py
+"""
+Readers and parsers on agent_watch's per-run hot path. Each test pins behaviour a
+faster implementation must keep: session logs are read as raw bytes through
+`agent_watch._loads` (orjson when installed) and must decode exactly as the old
+text-mode reads did; the support matrix is parsed once for every field main() needs.
+"""
+import json
+
+import agent_watch
+
+
+def test_loads_recovers_malformed_utf8_like_text_mode_reads():
+    # A torn multibyte character used to be replaced by the `errors="replace"` text
+    # read; the bytes path must not turn that line into a parse error.
+    raw = b'{"type": "user", "text": "caf\xc3"}\n'
+    assert agent_watch._loads(raw) == {"type": "user", "text": "caf�"}
+
+
+def test_loads_raises_stdlib_decode_error_on_bad_json():
+    try:
+        agent_watch._loads(b"{not json}\n")
+    except json.JSONDecodeError:
+        return
+    raise AssertionError("expected json.JSONDecodeError")
+
+
+def test_jsonl_fingerprint_counts_bad_lines_from_bytes(tmp_path):
+    p = tmp_path / "s.jsonl"
+    p.write_bytes(b'{"type": "a", "x": 1}\n\n  \n{oops\n{"type": "a", "y": 2}\r\n')
+    fp = agent_watch._jsonl_schema_fingerprint(p, max_lines=100)
+    assert fp["type_counts"] == {"a": 2}
+    assert fp["type_keys"] == {"a": ["type", "x", "y"]}
+    assert fp["parse_errors"] == 1
+
+
+def test_contains_any_type_prefilter_still_confirms_by_parsing(tmp_path):
+    # The raw-bytes prefilter must accept any spacing around the colon, and a type
+    # name appearing only as some other value must not count as a hit.
+    p = tmp_path / "s.jsonl"
+    p.write_bytes(b'{"type":"other","note":"session_meta"}\n{"type" :  "session_meta"}\n')
+    assert agent_watch._jsonl_contains_any_type(p, {"session_meta"}, max_lines=10)
+    assert not agent_watch._jsonl_contains_any_type(p, {"session_meta"}, max_lines=1)
+
+
+def test_tail_lines_keeps_last_non_blank_lines(tmp_path):
+    p = tmp_path / "s.jsonl"
+    p.write_bytes(b"".join(b'{"n": %d}\n\n' % i for i in range(10)))
+    assert agent_watch._tail_lines(p, 3) == [b'{"n": 7}\n', b'{"n": 8}\n', b'{"n": 9}\n']
+    assert agent_watch._tail_lines(p, 0) == []
+
+
+def test_tail_lines_seek_path_matches_streaming(tmp_path, monkeypatch):
+    # Large files are tailed backwards from EOF through an mmap; the result must
+    # match the streamed tail.
+    p = tmp_path / "big.jsonl"
+    p.write_bytes(b"".join(b'{"n": %d, "pad": "%s"}\n' % (i, b"x" * (i % 7)) for i in range(500)))
+    streamed = [json.loads(line) for line in agent_watch._tail_lines(p, 40)]
+
+    monkeypatch.setattr(agent_watch, "_TAIL_SEEK_THRESHOLD_BYTES", 64)
+    seeked = [json.loads(line) for line in agent_watch._tail_lines(p, 40)]
+    assert seeked == streamed
+    assert [r["n"] for r in seeked] == list(range(460, 500))
+    # Asking for more lines than exist returns the whole file.
+    assert len(agent_watch._tail_lines(p, 10_000)) == 500
+
+
+def test_parse_matrix_reads_versions_and_evidence_in_one_pass(tmp_path):
+    p = tmp_path / "matrix.yml"
+    p.write_text(
+        "notes:\n"
+        "  - \"agents: is not a key here\"\n"
+        "agents:\n"
+        "  codex_cli:\n"
+        "    max_verified_version: \"0.145.0\"\n"
+        "    evidence_fixtures:\n"
+        "      - \"Resources/Fixtures/codex/small.jsonl\"\n"
+        "      # comment inside the list\n"
+        "      - Resources/Fixtures/codex/schema_drift.jsonl\n"
+        "    parser: \"x\"\n"
+        "      - \"not evidence\"\n"
+        "  kimi_code:\n"
+        "    evidence_fixtures:\n"
+        "      - \"Resources/Fixtures/kimi/small.jsonl\"\n"
+        "    max_verified_version: 0.29.2\n",
+        encoding="utf-8",
+    )
+    versions, evidence = agent_watch._parse_matrix(p)
+    assert versions == {"codex_cli": "0.145.0", "kimi_code": "0.29.2"}
+    assert evidence == {
+        "codex_cli": [
+            "Resources/Fixtures/codex/small.jsonl",
+            "Resources/Fixtures/codex/schema_drift.jsonl",
+        ],
+        "kimi_code": ["Resources/Fixtures/kimi/small.jsonl"],
+    }
+
+
+def test_semver_parse_fast_path_agrees_with_search():
+    S = agent_watch.Semver
+    assert S.parse("0.145.0") == S(0, 145, 0)
+    assert S.parse("v1.2.3") == S(1, 2, 3)
+    assert S.parse("codex-cli 0.145.0") == S(0, 145, 0)
+    assert S.parse("1.2.3.4") == S(1, 2, 3)
+    assert S.parse("2026.07.20") == S(2026, 7, 20)
+    assert S.parse("1.2.x") is None
+    assert S.parse("1. 2.3") is None
+    assert S.parse("") is None
+
+
+def _legacy_candidates(root, glob):
+    # The selection rule _stat_candidates used to delegate to pathlib.
+    found = root.glob(glob) if "*" in glob and "/" not in glob else root.rglob(glob)
+    return {p for p in found if p.is_file()}
+
+
+def test_scandir_walk_selects_the_same_files_as_pathlib(tmp_path):
+    root = tmp_path / "root"
+    for rel in (
+        "session_a.json",
+        "nested/session_b.json",
+        "2026/07/01/rollout-1.jsonl",
+        "2026/07/01/other.jsonl",
+        "rollout-top.jsonl",
+        "brain/abc/.system_generated/logs/transcript.jsonl",
+        "deep/brain/def/.system_generated/logs/transcript.jsonl",
+        "p/agent-transcripts/x/y/t.jsonl",
+        "p/agent-transcripts/t2.jsonl",
+        "p/not-transcripts/t3.jsonl",
+        ".hidden/h.jsonl",
+        "storage/session/proj/ses_1.json",
+        "state.db",
+        "sub/state.db",
+    ):
+        f = root / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text("{}\n")
+    (root / "dir.jsonl").mkdir()
+
+    for glob in (
+        "session_*.json",
+        "**/rollout-*.jsonl",
+        "**/*.jsonl",
+        "*/.system_generated/logs/transcript.jsonl",
+        "**/agent-transcripts/**/*.jsonl",
+        "storage/session/**/ses_*.json",
+        "state.db",
+    ):
+        walked = {p for _, p in agent_watch._stat_candidates([str(root)], glob)}
+        assert walked == _legacy_candidates(root, glob), glob
+
+    assert agent_watch._stat_candidates([str(tmp_path / "missing")], "**/*.jsonl") == []
+
+
+def test_opencode_storage_tree_fingerprint_finds_root_from_nested_session(tmp_path):
+    root = tmp_path / "storage"
+    session = root / "session" / "proj" / "ses_1.json"
+    session.parent.mkdir(parents=True)
+    session.write_text(json.dumps({"id": "ses_1", "title": "t"}))
+    (root / "message" / "ses_1").mkdir(parents=True)
+    (root / "message" / "ses_1" / "msg_a.json").write_text(json.dumps({"id": "msg_a", "role": "user"}))
+    (root / "message" / "ses_1" / "notes.json").write_text("{}")
+    (root / "part" / "msg_a").mkdir(parents=True)
+    (root / "part" / "msg_a" / "prt_1.json").write_text(json.dumps({"type": "text", "text": "x"}))
+
+    assert agent_watch._opencode_storage_root_for_session_file(session) == root
+    fp = agent_watch._opencode_storage_session_tree_schema_fingerprint(session, max_messages=10, max_parts=10)
+    assert fp["type_counts"] == {"message.user": 1, "part.text": 1, "session": 1}
+    assert fp["message_files_parsed"] == 1
+    assert fp["part_files_parsed"] == 1
+
+
+def test_expand_path_memo_tracks_home(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path / "a"))
+    assert agent_watch._expand_path("~/.codex") == tmp_path / "a" / ".codex"
+    monkeypatch.setenv("HOME", str(tmp_path / "b"))
+    assert agent_watch._expand_path("~/.codex") == tmp_path / "b" / ".codex"
+    monkeypatch.setenv("AW_TEST_ROOT", str(tmp_path / "c"))
+    assert agent_watch._expand_path("$AW_TEST_ROOT/x") == tmp_path / "c" / "x"
+
+
+def test_run_cmd_decodes_invalid_utf8_and_crlf():
+    import sys
+
+    rc, out, err = agent_watch._run_cmd(
+        [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'v1.2\\r\\n\\xff ok\\r\\n')"],
+        timeout=30,
+    )
+    assert rc == 0
+    assert out == "v1.2\n� ok"
+    assert err == ""
+
+
+def test_keyword_hits_scans_several_lists_case_insensitively():
+    cfg = {"agents": {"codex": {"risk_keywords": {"schema": ["session", "JSONL", "migration"],
+                                                  "usage": ["Token", "json", "quota"]}}}}
+    agent_watch._normalize_risk_keywords(cfg)
+    risk = cfg["agents"]["codex"]["risk_keywords"]
+    schema, usage = agent_watch._keyword_hits("New JSONL session format; token usage", risk["schema"], risk["usage"])
+    assert schema == ["session", "jsonl"]
+    assert usage == ["token", "json"]
+    assert agent_watch._keyword_hits("", ["a"], ["b"]) == ([], [])
+
+
+def test_parsed_semver_values_order_for_newer_than_checks():
+    # _process_agent compares these values directly: numeric, not lexicographic.
+    parse = agent_watch._parse_semver_cached
+    assert parse("0.10.0") > parse("0.9.9")
+    assert parse("v1.2.3") == parse("1.2.3")
+    assert parse("1.2.3") < parse("1.10.0")
+    assert parse("1.2") is None
+    assert parse("1.2.3") is parse("1.2.3")
+
+
+def test_keyword_plan_settles_longer_keywords_from_shorter_misses():
+    plan = dict(agent_watch._keyword_plan(("jsonl", "json", "tokens", "token", "json")))
+    assert plan == {"json": (), "token": (), "jsonl": ("json",), "tokens": ("token",)}
+    assert agent_watch._keyword_hits("a TOKENS list", ["json", "jsonl"], ["tokens", "token"]) == ([], ["tokens", "token"])
+
+
+def test_upstream_scan_text_keeps_values_not_field_names():
+    res = {"ok": True, "version": "1.2.3", "published_at": None, "body": "New session format",
+           "cached_source_used": {"name": "Token limits", "assets": ["x.jsonl"]}}
+    text = agent_watch._upstream_scan_text(res)
+    assert text.split("\n") == ["1.2.3", "New session format", "Token limits", "x.jsonl"]
+    assert "published" not in text
+
+
+def test_baseline_type_keys_memo_rereads_edited_fixture(tmp_path):
+    # Baselines are memoized across passes, but a fixture rewritten in place (as
+    # rebuild_stage0_baseline --emit does) must not serve the stale fingerprint.
+    p = tmp_path / "small.jsonl"
+    p.write_text('{"type": "a", "x": 1}\n')
+    first = agent_watch._baseline_type_keys_for_agent("codex", [str(p)])
+    first["a"].append("mutated")
+    assert agent_watch._baseline_type_keys_for_agent("codex", [str(p)]) == {"a": ["type", "x"]}
+    p.write_text('{"type": "a", "x": 1, "y": 2}\n')
+    assert agent_watch._baseline_type_keys_for_agent("codex", [str(p)]) == {"a": ["type", "x", "y"]}
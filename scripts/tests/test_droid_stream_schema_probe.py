@@ -0,0 +1,57 @@
+# scripts/tests/test_droid_stream_schema_probe.py
+"""
+The droid probe's per-file schema cache. An entry is only trusted when its stat
+signature matches and it has the shape the probe writes; anything else is a miss.
+"""
+import json
+
+import droid_stream_schema_probe as probe
+
+
+def _session(tmp_path):
+    p = tmp_path / "s.jsonl"
+    p.write_text(json.dumps({"type": "message", "text": "x"}) + "\n", encoding="utf-8")
+    return p
+
+
+def test_schema_cache_hit_is_served_without_reparsing(tmp_path):
+    p = _session(tmp_path)
+    key = str(p.resolve())
+    cached = {"sig": probe._file_signature(p), "type_keys": {"cached": ["a"]}, "type_counts": {"cached": 1},
+              "errors": []}
+    touched = {}
+    keys, counts, errors = probe._schema_for_paths([p], {key: cached}, touched)
+    assert (keys, counts, errors) == ({"cached": {"a"}}, {"cached": 1}, [])
+    assert touched == {key: cached}
+
+
+def test_malformed_schema_cache_entry_is_a_miss(tmp_path):
+    p = _session(tmp_path)
+    key = str(p.resolve())
+    sig = probe._file_signature(p)
+    good = {"sig": sig, "type_keys": {"a": ["x"]}, "type_counts": {"a": 1}, "errors": []}
+    for broken in (
+        {"sig": sig},
+        dict(good, type_keys=None),
+        dict(good, type_keys={"a": "x"}),
+        dict(good, type_counts=[]),
+        dict(good, type_counts={"a": "1"}),
+        dict(good, errors={}),
+        dict(good, errors=["bad"]),
+    ):
+        touched = {}
+        keys, counts, errors = probe._schema_for_paths([p], {key: broken}, touched)
+        assert keys == {"message": {"type", "text"}}, broken
+        assert counts == {"message": 1}
+        assert errors == []
+        assert touched[key]["type_counts"] == {"message": 1}
+
+
+def test_load_events_reports_each_bad_line_even_when_they_join_into_valid_json(tmp_path):
+    # "1,2", "[3" and "4]" would join into the valid array [1,2,[3,4]] of three values;
+    # each line is still invalid on its own and must be reported as such.
+    p = tmp_path / "s.jsonl"
+    p.write_bytes(b'{"type": "a", "x": 1}\n1,2\n[3\n\n4]\n{"type": "a", "y": 2}\n')
+    events, errors = probe._load_events([p])
+    assert events == [{"type": "a", "x": None}, {"type": "a", "y": None}]
+    assert [err["line"] for err in errors] == [2, 3, 5]
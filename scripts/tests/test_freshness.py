@@ -52,6 +52,45 @@ def test_http_get_text_uses_github_token_for_api(monkeypatch):
     assert seen["config_mode"] == "0o600"
 
 
+def test_http_get_text_revalidates_with_cached_etag(tmp_path, monkeypatch):
+    # Once main() enables the cache, a repeat fetch must send If-None-Match and serve
+    # the stored body on 304, and the validators must survive into the next run.
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    calls = []
+
+    def fake_run(argv, timeout):
+        calls.append(argv)
+        headers = argv[argv.index("-D") + 1]
+        body = argv[argv.index("-o") + 1]
+        if any(a.startswith("If-None-Match:") for a in argv):
+            _Path(headers).write_text("HTTP/2 304\r\netag: W/\"v1\"\r\n\r\n")
+            return 0, "304", ""
+        _Path(headers).write_text(
+            "HTTP/1.1 302 Found\r\nlocation: x\r\n\r\nHTTP/2 200\r\nETag: W/\"v1\"\r\n\r\n"
+        )
+        _Path(body).write_text('{"tag_name": "v1.2.3"}')
+        return 0, "200", ""
+
+    monkeypatch.setattr(agent_watch, "_run_cmd", fake_run)
+    cache_path = tmp_path / ".etag_cache.json"
+    url = "https://api.github.com/repos/o/r/releases/latest"
+    try:
+        agent_watch._HTTP_CACHE.load(cache_path)
+        assert agent_watch._http_get_text(url, timeout=5) == '{"tag_name": "v1.2.3"}'
+    finally:
+        agent_watch._HTTP_CACHE.close()
+    assert _json.loads(cache_path.read_text())[url]["etag"] == 'W/"v1"'
+
+    try:
+        agent_watch._HTTP_CACHE.load(cache_path)
+        assert agent_watch._http_get_text(url, timeout=5) == '{"tag_name": "v1.2.3"}'
+    finally:
+        agent_watch._HTTP_CACHE.close()
+    assert 'If-None-Match: W/"v1"' in calls[-1]
+    assert len(calls) == 2
+
+
 def test_cached_upstream_evidence_uses_prior_successful_report(tmp_path):
     reports_root = tmp_path / "agent_watch"
     old_dir = reports_root / "20260601-120000Z"
@@ -1030,3 +1069,109 @@ def test_daily_report_does_not_use_weekly_compatibility_blockers(tmp_path, monke
     assert codex["severity"] == "none"
     assert codex["recommendation"] == "ignore"
     assert codex["compatibility"]["verdict"] == "not_evaluated_daily"
+
+
+def test_daily_report_keeps_config_order_when_agents_run_concurrently(tmp_path, monkeypatch, capsys):
+    # Agents are checked on a thread pool; the slowest agent finishing last must not
+    # reorder the report or the printed summary.
+    import time
+
+    report_root = tmp_path / "out"
+    names = ["codex", "claude", "copilot", "skipped"]
+    cfg = {
+        "report_root": str(report_root),
+        "agents": {
+            name: {
+                "cadence": {"daily": name != "skipped"},
+                "installed_version_cmd": [name, "--version"],
+                "upstream": [],
+                "risk_keywords": {"schema": [], "usage": []},
+            }
+            for name in names
+        },
+    }
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(_json.dumps(cfg))
+
+    delays = {"codex": 0.2, "claude": 0.1, "copilot": 0.0}
+
+    def fake_installed(agent_cfg):
+        name = agent_cfg["installed_version_cmd"][0]
+        time.sleep(delays[name])
+        # Far ahead of any verified version so every agent is actionable.
+        return ([name, "--version"], 0, f"{name} 999.0.0", "", "999.0.0")
+
+    monkeypatch.chdir(_Path(__file__).resolve().parents[2])
+    monkeypatch.setattr(agent_watch, "_run_installed_version_cmds", fake_installed)
+
+    rc = agent_watch.main(["--mode", "daily", "--config", str(cfg_path)])
+    assert rc == 0
+    report_path = next(report_root.glob("*/report.json"))
+    report = _json.loads(report_path.read_text())
+    assert list(report["results"]) == ["claude", "codex", "copilot"]  # sort_keys
+    printed = [line.split(":")[0] for line in capsys.readouterr().out.splitlines()[1:]]
+    assert printed == ["codex", "claude", "copilot"]
+
+
+def test_jobs_one_checks_agents_one_at_a_time(tmp_path, monkeypatch):
+    # `--jobs 1` is the escape hatch for debugging an agent in isolation: no two
+    # agents may be in flight at once.
+    import threading
+    import time
+
+    cfg = {
+        "report_root": str(tmp_path / "out"),
+        "agents": {
+            name: {
+                "cadence": {"daily": True},
+                "installed_version_cmd": [name, "--version"],
+                "upstream": [],
+                "risk_keywords": {"schema": [], "usage": []},
+            }
+            for name in ("codex", "claude", "copilot")
+        },
+    }
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(_json.dumps(cfg))
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_installed(agent_cfg):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return (agent_cfg["installed_version_cmd"], 0, "1.0.0", "", "1.0.0")
+
+    monkeypatch.chdir(_Path(__file__).resolve().parents[2])
+    monkeypatch.setattr(agent_watch, "_run_installed_version_cmds", fake_installed)
+
+    assert agent_watch.main(["--mode", "daily", "--config", str(cfg_path), "--jobs", "1"]) == 0
+    assert state["peak"] == 1
+
+
+def test_fetch_upstreams_overlaps_sources_but_keeps_priority(monkeypatch):
+    # A slow primary and a fast fallback are fetched together, yet results come back
+    # in config order so the primary still wins when both succeed.
+    import threading
+
+    # The barrier only opens while both fetches are in flight at once; a serial
+    # fetch would break it after the timeout instead of relying on wall-clock time.
+    both_running = threading.Barrier(2, timeout=5)
+    fallback_done = threading.Event()
+
+    def fake_fetch(source, timeout):
+        both_running.wait()
+        if source["v"] == "1.0.0":
+            # The primary finishes last, so config order is not completion order.
+            assert fallback_done.wait(timeout=5)
+        else:
+            fallback_done.set()
+        return {"ok": source["ok"], "version": source["v"]}
+
+    monkeypatch.setattr(agent_watch, "_fetch_upstream", fake_fetch)
+    sources = [{"ok": True, "v": "1.0.0"}, {"ok": True, "v": "2.0.0"}, "junk"]
+    results = list(agent_watch._fetch_upstreams(sources, timeout=5))
+    assert [r["version"] for r in results] == ["1.0.0", "2.0.0"]
@@ -0,0 +1,71 @@
+# scripts/tests/test_purge_droid_test_sessions.py
+"""
+Candidate selection for purge_droid_test_sessions. Marker hits come from rg/grep when
+one is installed and from an os.scandir walk otherwise; both decide what gets
+deleted, so they must select exactly the same files.
+"""
+import shutil
+import subprocess
+
+import pytest
+
+import purge_droid_test_sessions as purge
+
+MARKER = purge.DEFAULT_MARKER
+CWD = "-Users-x-Repo"
+
+
+def _tree(tmp_path):
+    root = tmp_path / "sessions"
+    files = {
+        f"{CWD}/hit.jsonl": f'{{"text": "{MARKER}"}}\n'.encode(),
+        f"{CWD}/miss.jsonl": b'{"text": "Say HELLO."}\n',
+        ".hidden/hit.jsonl": f'{{"text": "{MARKER}"}}\n'.encode(),
+        "binary.jsonl": b"\x00\xff\xfe" + MARKER.encode() + b"\x00",
+        "notes.txt": MARKER.encode(),
+        "dir.jsonl/nested.jsonl": MARKER.encode(),
+    }
+    for rel, data in files.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+    # Symlinks are neither followed nor matched by either path.
+    (root / "link.jsonl").symlink_to(root / CWD / "hit.jsonl")
+    (root / "linkdir").symlink_to(root / ".hidden", target_is_directory=True)
+    return root
+
+
+def _python_matches(root):
+    marker = MARKER.encode("utf-8")
+    return sorted(p for p in purge._iter_jsonl_files(root) if purge._marker_in_file(p, marker))
+
+
+def test_search_tool_selects_the_same_files_as_the_python_scan(tmp_path):
+    if not (shutil.which("rg") or shutil.which("grep")):
+        pytest.skip("neither rg nor grep is installed")
+    root = _tree(tmp_path)
+    expected = sorted(root / rel for rel in (
+        f"{CWD}/hit.jsonl", ".hidden/hit.jsonl", "binary.jsonl", "dir.jsonl/nested.jsonl",
+    ))
+    assert _python_matches(root) == expected
+    assert purge._search_tool_matches(root, MARKER) == expected
+
+    candidates = purge._collect_candidates(root, MARKER, CWD)
+    assert [c.path for c in candidates] == expected
+    assert [c.cwd_signal for c in candidates] == [p.parent.name == CWD for p in expected]
+
+
+def test_search_tool_error_falls_back_to_the_python_scan(tmp_path, monkeypatch):
+    root = _tree(tmp_path)
+    expected = _python_matches(root)
+
+    # Exit status 2 means some files may have been skipped: the partial output must
+    # not be trusted, whichever tool produced it.
+    monkeypatch.setattr(purge.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(
+        purge.subprocess,
+        "run",
+        lambda argv, **kwargs: subprocess.CompletedProcess(argv, 2, stdout=str(root / CWD / "hit.jsonl").encode() + b"\0"),
+    )
+    assert purge._search_tool_matches(root, MARKER) is None
+    assert [c.path for c in purge._collect_candidates(root, MARKER, CWD)] == expected
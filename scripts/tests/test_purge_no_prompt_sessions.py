@@ -0,0 +1,141 @@
+# scripts/tests/test_purge_no_prompt_sessions.py
+"""
+Candidate selection and quarantine layout for purge_no_prompt_sessions. This is the
+deletion path of a destructive tool, so each test pins a classification a faster
+implementation must keep: root-index hits, symlinks and odd spellings must land in
+the same bucket, and the quarantine path must stay under the quarantine directory.
+"""
+import json
+import os
+
+import purge_no_prompt_sessions as purge
+from purge_no_prompt_sessions import Row
+
+
+def _jsonl(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return path
+
+
+def _tree(tmp_path):
+    roots = {
+        "codex": (tmp_path / "codex" / "sessions"),
+        "claude": (tmp_path / "claude" / "projects"),
+    }
+    for root in roots.values():
+        root.mkdir(parents=True)
+    roots = {source: root.resolve() for source, root in roots.items()}
+    codex, claude = roots["codex"], roots["claude"]
+
+    _jsonl(codex / "2026" / "10" / "01" / "rollout-talk.jsonl", [
+        {"type": "session_meta", "payload": {"id": "a"}},
+        {"type": "response_item", "payload": {"type": "message", "role": "assistant"}},
+    ])
+    _jsonl(codex / "2026" / "10" / "01" / "rollout-meta.jsonl", [
+        {"type": "session_meta", "payload": {"id": "b"}},
+        {"type": "event_msg", "payload": {"role": "user", "text": "assistant"}},
+    ])
+    _jsonl(claude / "proj" / "talk.jsonl", [{"type": "user"}, {"type": "assistant"}])
+    # The needle bytes appear, but only as a value: still no assistant turn.
+    _jsonl(claude / "proj" / "meta.jsonl", [{"type": "user", "text": "assistant"}])
+    (claude / "proj" / "empty.jsonl").write_bytes(b"")
+    # Shorter than the needle: classified from its size without being opened.
+    (claude / "proj" / "tiny.jsonl").write_bytes(b'"assistan"')
+    os.symlink(claude / "proj" / "meta.jsonl", claude / "link.jsonl")
+    outside = _jsonl(tmp_path / "outside" / "x.jsonl", [{"type": "user"}])
+    os.symlink(outside, claude / "escape.jsonl")
+    return roots, outside
+
+
+def test_collect_candidates_classifies_every_kind_of_row(tmp_path):
+    roots, outside = _tree(tmp_path)
+    codex, claude = str(roots["codex"]), str(roots["claude"])
+    cases = [
+        # (row, root_ok, no_assistant, exists, quarantine rel or None)
+        (Row("c1", "codex", f"{codex}/2026/10/01/rollout-talk.jsonl", "No prompt"), True, False, True,
+         "2026/10/01/rollout-talk.jsonl"),
+        (Row("c2", "codex", f"{codex}/2026/10/01/rollout-meta.jsonl", "No prompt"), True, True, True,
+         "2026/10/01/rollout-meta.jsonl"),
+        (Row("l1", "claude", f"{claude}/proj/talk.jsonl", "No prompt"), True, False, True, "proj/talk.jsonl"),
+        (Row("l2", "claude", f"{claude}/proj/meta.jsonl", "No prompt"), True, True, True, "proj/meta.jsonl"),
+        (Row("l3", "claude", f"{claude}/proj/empty.jsonl", "No prompt"), True, True, True, "proj/empty.jsonl"),
+        (Row("l4", "claude", f"{claude}/proj/tiny.jsonl", "No prompt"), True, True, True, "proj/tiny.jsonl"),
+        (Row("l5", "claude", f"{claude}/proj/gone.jsonl", "No prompt"), False, False, False, None),
+        (Row("l6", "claude", f"{claude}/proj/../proj/meta.jsonl", "No prompt"), True, True, True,
+         "proj/meta.jsonl"),
+        # An in-root symlink is quarantined where its target lives, as resolve() places it.
+        (Row("l7", "claude", f"{claude}/link.jsonl", "No prompt"), True, True, True, "proj/meta.jsonl"),
+        (Row("l8", "claude", f"{claude}/escape.jsonl", "No prompt"), False, False, True, None),
+        (Row("l9", "claude", str(outside), "No prompt"), False, False, True, None),
+        (Row("l10", "codex", f"{claude}/proj/meta.jsonl", "No prompt"), False, False, True, None),
+    ]
+    unknown = Row("u1", "gemini", f"{claude}/proj/meta.jsonl", "No prompt")
+    rows = [case[0] for case in cases]
+    rows.insert(3, unknown)
+
+    candidates, counts = purge._collect_candidates(rows, roots)
+
+    # Unknown sources are counted and dropped; the rest keep row order, even though
+    # the assistant scan fills its results back in from a thread pool.
+    assert [c.row for c in candidates] == [case[0] for case in cases]
+    for c, (row, root_ok, no_assistant, exists, rel) in zip(candidates, cases):
+        assert (c.root_ok, c.no_assistant, c.exists) == (root_ok, no_assistant, exists), row.session_id
+        if rel is not None:
+            root = roots[row.source]
+            assert purge._quarantine_rel(c, root, str(root)).as_posix() == rel, row.session_id
+    assert counts == {"unknown_source": 1, "missing": 1, "outside_root": 3, "has_assistant": 2}
+
+
+def _no_mmap(*args, **kwargs):
+    raise OSError("mmap unavailable")
+
+
+def test_file_contains_finds_needle_split_across_chunks_without_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(purge.mmap, "mmap", _no_mmap)
+    needle = purge._ASSISTANT_NEEDLE
+    chunk = purge._SCAN_CHUNK_BYTES
+    p = tmp_path / "big.jsonl"
+    for split in range(len(needle) + 1):
+        p.write_bytes(b"x" * (chunk - split) + needle + b"y" * 100)
+        assert purge._file_contains(str(p), needle), split
+    # A needle prefix ending one chunk and a suffix starting the next is not a hit.
+    p.write_bytes(b"x" * (chunk - 4) + needle[:4] + b"-" + needle[4:] + b"y" * 100)
+    assert not purge._file_contains(str(p), needle)
+
+
+def test_file_contains_agrees_across_read_mmap_and_chunked_paths(tmp_path, monkeypatch):
+    needle = purge._ASSISTANT_NEEDLE
+    small = tmp_path / "small.jsonl"
+    small.write_bytes(b"x" * 100 + needle)
+    large = tmp_path / "large.jsonl"
+    large.write_bytes(b"x" * (purge._MMAP_MIN_BYTES * 2) + needle)
+    plain = tmp_path / "plain.jsonl"
+    plain.write_bytes(b"x" * (purge._MMAP_MIN_BYTES * 2))
+    assert purge._file_contains(str(small), needle)
+    assert purge._file_contains(str(large), needle)
+    assert not purge._file_contains(str(plain), needle)
+    assert not purge._file_contains(str(tmp_path / "missing.jsonl"), needle)
+
+    monkeypatch.setattr(purge, "_SCAN_CHUNK_BYTES", 7)
+    monkeypatch.setattr(purge.mmap, "mmap", _no_mmap)
+    assert purge._file_contains(str(large), needle)
+    assert not purge._file_contains(str(plain), needle)
+
+
+def test_move_renames_and_falls_back_to_shutil(tmp_path, monkeypatch):
+    src = tmp_path / "a.jsonl"
+    src.write_text("{}\n")
+    dst = tmp_path / "q" / "a.jsonl"
+    dst.parent.mkdir()
+    purge._move(str(src), str(dst), same_device=True)
+    assert not src.exists() and dst.read_text() == "{}\n"
+
+    def refuse(*args, **kwargs):
+        raise OSError("cross-device link")
+
+    # A rename that fails anyway (e.g. separate mounts) still moves through a copy.
+    monkeypatch.setattr(purge.os, "rename", refuse)
+    back = tmp_path / "b.jsonl"
+    purge._move(str(dst), str(back), same_device=True)
+    assert not dst.exists() and back.read_text() == "{}\n"
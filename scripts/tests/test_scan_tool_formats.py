@@ -0,0 +1,100 @@
+# scripts/tests/test_scan_tool_formats.py
+"""
+The tool-format scanner's catalog assembly. Files are scanned independently (across
+a process pool with --jobs > 1) and merged in task order with examples capped, so the
+catalog must come out identical however the work was split.
+"""
+import json
+import sys
+
+import scan_tool_formats
+
+
+def _catalog(tmp_path, monkeypatch, jobs):
+    out = tmp_path / f"catalog_jobs{jobs}.json"
+    monkeypatch.setattr(scan_tool_formats, "ARTIFACTS_DIR", tmp_path)
+    monkeypatch.setattr(sys, "argv", [
+        "scan_tool_formats.py",
+        "--fixtures-only",
+        "--jobs", str(jobs),
+        # Small caps, so which examples survive depends on the merge order.
+        "--max-examples-per-group", "1",
+        "--max-examples-per-shape", "2",
+        "--output-catalog", str(out),
+        "--output-report", str(tmp_path / f"report_jobs{jobs}.md"),
+    ])
+    assert scan_tool_formats.main() == 0
+    catalog = json.loads(out.read_text(encoding="utf-8"))
+    catalog.pop("generated_at")
+    return catalog
+
+
+def test_process_pool_catalog_matches_in_process_scan(tmp_path, monkeypatch):
+    sequential = _catalog(tmp_path, monkeypatch, jobs=1)
+    pooled = _catalog(tmp_path, monkeypatch, jobs=3)
+    assert sequential["summary"]["total_tool_blocks"] > 0
+    assert len(sequential["groups"]) > 1
+    assert pooled == sequential
+
+
+# Results of the character-by-character walkers these replaced, quirks included:
+# string items are skipped, a nested array yields its closing "]", and commas split
+# objects. Only a change that means to alter the catalog should touch this table.
+_BRACE_CASES = [
+    ('{"a": 1}', 0, '{"a": 1}'),
+    ('x {"a": {"b": 2}} y', 2, '{"a": {"b": 2}}'),
+    ('{"s": "}"}', 0, '{"s": "}"}'),
+    ('{"s": "\\"}"}', 0, '{"s": "\\"}"}'),
+    ('{"s": "a\\\\"}', 0, '{"s": "a\\\\"}'),
+    ('{"s": "\\\\\\"}"}', 0, '{"s": "\\\\\\"}"}'),
+    ('{"a": [1, {"b": "]"}]} tail', 0, '{"a": [1, {"b": "]"}]}'),
+    ("{}", 0, "{}"),
+    ('{"a": 1', 0, None),
+    ('{"s": "unterminated}', 0, None),
+    ('{"s": "ends with \\', 0, None),
+]
+
+_ARRAY_CASES = [
+    ("[1, 2, 3]", 0, ["1", "2", "3"]),
+    ("[]", 0, []),
+    ("[ , 1]", 0, ["1"]),
+    ('["a", "b,c", "]"]', 0, []),
+    ('["x\\"]", 1]', 0, ["1"]),
+    ('["esc\\\\", 2]', 0, ["2"]),
+    ("[[1, 2], [3]]", 0, ["]", "]"]),
+    ('[1, [2, [3, "]"]], 4]', 0, ["1", "]", "4"]),
+    ('[{"a": [1, "]"]}, 2]', 0, ['{"a": [1, "]"]}', "2"]),
+    ('[{"a": 1, "b": 2}]', 0, ['{"a": 1', ": 2}"]),
+    ('key: [ "a" ,\n "b" ] rest', 5, []),
+    ('[1, "unterminated', 0, ["1"]),
+    ('["ends with \\', 0, []),
+]
+
+
+def test_extract_balanced_braces_edge_cases():
+    for text, start, expected in _BRACE_CASES:
+        assert scan_tool_formats.extract_balanced_braces(text, start) == expected, text
+
+
+def test_split_json_array_items_edge_cases():
+    for text, start, expected in _ARRAY_CASES:
+        assert scan_tool_formats.split_json_array_items(text, start) == expected, text
+
+
+def test_rglob_paths_finds_what_pathlib_rglob_finds(tmp_path):
+    for rel in ("a.jsonl", "b.json", "x/c.jsonl", "x/y/d.jsonl", ".hidden/e.jsonl", "x/y/ses_1.json"):
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("{}\n")
+    (tmp_path / "dir.jsonl").mkdir()
+    (tmp_path / "linkdir").symlink_to(tmp_path / "x", target_is_directory=True)
+
+    for patterns in (("*.jsonl",), ("ses_*.json",), ("*.jsonl", "*.json")):
+        found = scan_tool_formats.rglob_paths(tmp_path, *patterns)
+        expected = {p for pattern in patterns for p in tmp_path.rglob(pattern) if "linkdir" not in p.parts}
+        assert sorted(found) == sorted(expected), patterns
+        assert len(found) == len(set(found))
+        # A directory's own matches come before anything found below it.
+        top = [p for p in found if p.parent == tmp_path]
+        assert found[: len(top)] == top
+    assert scan_tool_formats.rglob_paths(tmp_path / "missing", "*.jsonl") == []